@@ -6,6 +6,7 @@ Displays z-score, spread, and mean with historical data and live updates
 import numpy as np
 from datetime import datetime
 from collections import deque
+from itertools import islice
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox
 from PyQt6.QtCore import QTimer
 import matplotlib
@@ -19,16 +20,18 @@ from matplotlib.dates import DateFormatter, HourLocator
 
 class ChartWidget(QWidget):
     """Real-time chart widget with z-score, spread, and mean"""
+
+    MAX_POINTS = 500  # History kept per series (oldest points drop off)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # Data storage (will be populated from trading system)
-        self.timestamps = deque(maxlen=500)
-        self.zscores = deque(maxlen=500)
-        self.spreads = deque(maxlen=500)
-        self.means = deque(maxlen=500)
-        self.stds = deque(maxlen=500)
+        self.timestamps = deque(maxlen=self.MAX_POINTS)
+        self.zscores = deque(maxlen=self.MAX_POINTS)
+        self.spreads = deque(maxlen=self.MAX_POINTS)
+        self.means = deque(maxlen=self.MAX_POINTS)
+        self.stds = deque(maxlen=self.MAX_POINTS)
         
         # Reference to trading system (set by parent)
         self.trading_system = None
@@ -214,7 +217,7 @@ class ChartWidget(QWidget):
         # Draw initial chart
         self.update_chart()
         
-    def add_realtime_data(self, snapshot):
+    def add_realtime_data(self, snapshot, redraw=True):
         """Add new real-time data point"""
         if not snapshot:
             return
@@ -226,7 +229,7 @@ class ChartWidget(QWidget):
         self.stds.append(snapshot.spread_std)
         
         # Update chart if auto-update is on
-        if self.auto_update_btn.isChecked():
+        if redraw and self.auto_update_btn.isChecked():
             self.update_chart()
             
     def update_chart(self):
@@ -247,12 +250,13 @@ class ChartWidget(QWidget):
         else:  # All data
             n = len(self.timestamps)
         
-        # Get data for selected timeframe
-        times = list(self.timestamps)[-n:]
-        zscores = list(self.zscores)[-n:]
-        spreads = list(self.spreads)[-n:]
-        means = list(self.means)[-n:]
-        stds = list(self.stds)[-n:]
+        # Get data for selected timeframe (copy only the tail of each deque)
+        start = len(self.timestamps) - n
+        times = list(islice(self.timestamps, start, None))
+        zscores = list(islice(self.zscores, start, None))
+        spreads = list(islice(self.spreads, start, None))
+        means = list(islice(self.means, start, None))
+        stds = list(islice(self.stds, start, None))
         
         # Clear plots
         self.ax1.clear()
@@ -7,8 +7,8 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QLabel, QPushButton,
     QToolTip, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QCursor
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, pyqtProperty, QAbstractAnimation, QPropertyAnimation
+from PyQt6.QtGui import QFont, QColor, QPainter, QPixmap
 import logging
 
 logger = logging.getLogger(__name__)
@@ -84,15 +84,27 @@ class ConfigSyncIndicator(QWidget):
         }
     """
 
+    # Status icon glyphs/colors, pre-rendered once into pixmaps (see _status_pixmaps)
+    ICON_SPECS = {
+        "stopped": ("●", "#95a5a6"),
+        "synced": ("✓", "#27ae60"),
+        "oos_a": ("⚠", "#f39c12"),  # Orange
+        "oos_b": ("⚠", "#e74c3c"),  # Red
+    }
+    ICON_SIZE = 16
+
+    _pixmap_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._icons = self._status_pixmaps()
         self._is_synced = True
         self._is_running = False
         self._change_count = 0
         self._tooltip_text = ""
-        self._blink_state = False
+        self._blink_phase = 0
 
-        self._setup_blink_timer()  # Must be before _init_ui() which calls _update_display()
+        self._setup_blink_animation()  # Must be before _init_ui() which calls _update_display()
         self._init_ui()
 
     def _init_ui(self):
@@ -102,8 +114,8 @@ class ConfigSyncIndicator(QWidget):
         layout.setSpacing(6)
 
         # Status icon/indicator
-        self.status_icon = QLabel("●")
-        self.status_icon.setFont(QFont("Segoe UI", 10))
+        self.status_icon = QLabel()
+        self.status_icon.setFixedSize(self.ICON_SIZE, self.ICON_SIZE)
         layout.addWidget(self.status_icon)
 
         # Status text
@@ -111,35 +123,62 @@ class ConfigSyncIndicator(QWidget):
         self.status_label.setFont(QFont("Segoe UI", 10))
         layout.addWidget(self.status_label)
 
-        # Apply button (hidden when synced)
-        self.apply_btn = QPushButton("Apply")
-        self.apply_btn.setStyleSheet(self.STYLE_APPLY_BTN)
-        self.apply_btn.setFixedHeight(20)
-        self.apply_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.apply_btn.clicked.connect(self._on_apply_clicked)
-        self.apply_btn.setToolTip("Apply changes to running system (Hot-Reload)")
-        self.apply_btn.hide()
-        layout.addWidget(self.apply_btn)
+        # Apply button - created on first out-of-sync state (see _ensure_apply_btn)
+        self.apply_btn = None
 
         # Set initial state
         self._update_display()
 
-        # Enable click for details
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-
-    def _setup_blink_timer(self):
-        """Setup timer for blinking when out of sync"""
-        self._blink_timer = QTimer(self)
-        self._blink_timer.timeout.connect(self._toggle_blink)
-        self._blink_timer.setInterval(500)  # Blink every 500ms
-
-    def _toggle_blink(self):
-        """Toggle blink state for attention"""
-        self._blink_state = not self._blink_state
-        if self._blink_state:
-            self.status_icon.setStyleSheet("color: #f39c12;")  # Orange
-        else:
-            self.status_icon.setStyleSheet("color: #e74c3c;")  # Red
+        # Enable click for details (child widgets such as apply_btn inherit the cursor)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    @classmethod
+    def _status_pixmaps(cls) -> dict:
+        """Render each status glyph once and share the pixmaps across instances"""
+        if not cls._pixmap_cache:
+            font = QFont("Segoe UI", 10)
+            for state, (glyph, color) in cls.ICON_SPECS.items():
+                pixmap = QPixmap(cls.ICON_SIZE, cls.ICON_SIZE)
+                pixmap.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(pixmap)
+                painter.setFont(font)
+                painter.setPen(QColor(color))
+                painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+                painter.end()
+                cls._pixmap_cache[state] = pixmap
+        return cls._pixmap_cache
+
+    def _setup_blink_animation(self):
+        """Setup looping animation for blinking when out of sync"""
+        # Driven by Qt's shared animation timer instead of a per-widget QTimer
+        self._blink_anim = QPropertyAnimation(self, b"blinkPhase", self)
+        self._blink_anim.setStartValue(0)
+        self._blink_anim.setEndValue(2)
+        self._blink_anim.setDuration(1000)  # 500ms per color
+        self._blink_anim.setLoopCount(-1)
+
+    def _ensure_apply_btn(self) -> QPushButton:
+        """Create the apply button on first use (stays hidden while synced/stopped)"""
+        if self.apply_btn is None:
+            self.apply_btn = QPushButton("Apply")
+            self.apply_btn.setStyleSheet(self.STYLE_APPLY_BTN)
+            self.apply_btn.setFixedHeight(20)
+            self.apply_btn.clicked.connect(self._on_apply_clicked)
+            self.apply_btn.setToolTip("Apply changes to running system (Hot-Reload)")
+            self.layout().addWidget(self.apply_btn)
+        return self.apply_btn
+
+    def _get_blink_phase(self) -> int:
+        return self._blink_phase
+
+    def _set_blink_phase(self, value: int):
+        """Swap icon only when the animated phase flips (orange <-> red)"""
+        phase = value % 2
+        if phase != self._blink_phase:
+            self._blink_phase = phase
+            self.status_icon.setPixmap(self._icons["oos_b" if phase else "oos_a"])
+
+    blinkPhase = pyqtProperty(int, fget=_get_blink_phase, fset=_set_blink_phase)
 
     def set_synced(self, is_synced: bool, change_count: int = 0, tooltip: str = ""):
         """Set sync status"""
@@ -153,42 +192,59 @@ class ConfigSyncIndicator(QWidget):
         self._is_running = is_running
         self._update_display()
 
+    def set_state(self, is_running: bool, is_synced: bool,
+                  change_count: int = 0, tooltip: str = ""):
+        """Set running and sync status together, rendering once"""
+        self._is_running = is_running
+        self._is_synced = is_synced
+        self._change_count = change_count
+        self._tooltip_text = tooltip
+        self._update_display()
+
     def _update_display(self):
         """Update visual display based on current state"""
-        if not self._is_running:
-            # Not running - gray
-            self.status_icon.setText("●")
-            self.status_icon.setStyleSheet("color: #95a5a6;")
-            self.status_label.setText("System Stopped")
-            self.status_label.setStyleSheet("color: #95a5a6;")
-            self.apply_btn.hide()
-            self._blink_timer.stop()
-            self.setToolTip("Start trading system to enable config sync")
-
-        elif self._is_synced:
-            # Synced - green
-            self.status_icon.setText("✓")
-            self.status_icon.setStyleSheet("color: #27ae60;")
-            self.status_label.setText("Config Synced")
-            self.status_label.setStyleSheet("color: #27ae60;")
-            self.apply_btn.hide()
-            self._blink_timer.stop()
-            self.setToolTip("GUI settings match running system")
+        self.setUpdatesEnabled(False)
+        try:
+            if not self._is_running:
+                # Not running - gray
+                self.status_icon.setPixmap(self._icons["stopped"])
+                self.status_label.setText("System Stopped")
+                self.status_label.setStyleSheet("color: #95a5a6;")
+                if self.apply_btn is not None:
+                    self.apply_btn.hide()
+                self._blink_anim.stop()
+                self.setToolTip("Start trading system to enable config sync")
+
+            elif self._is_synced:
+                # Synced - green
+                self.status_icon.setPixmap(self._icons["synced"])
+                self.status_label.setText("Config Synced")
+                self.status_label.setStyleSheet("color: #27ae60;")
+                if self.apply_btn is not None:
+                    self.apply_btn.hide()
+                self._blink_anim.stop()
+                self.setToolTip("GUI settings match running system")
 
-        else:
-            # Out of sync - orange/red with blink
-            self.status_icon.setText("⚠")
-            self.status_label.setText(f"{self._change_count} Unsaved")
-            self.status_label.setStyleSheet("color: #e67e22; font-weight: bold;")
-            self.apply_btn.show()
-            self._blink_timer.start()
-
-            # Build tooltip
-            if self._tooltip_text:
-                self.setToolTip(f"Click 'Apply' to sync changes:\n{self._tooltip_text}")
             else:
-                self.setToolTip(f"{self._change_count} setting(s) differ from running system.\nClick 'Apply' to hot-reload.")
-
+                # Out of sync - orange/red with blink
+                if self._blink_anim.state() != QAbstractAnimation.State.Running:
+                    self._blink_phase = 0
+                    self.status_icon.setPixmap(self._icons["oos_a"])
+                    self._blink_anim.start()
+                self.status_label.setText(f"{self._change_count} Unsaved")
+                self.status_label.setStyleSheet("color: #e67e22; font-weight: bold;")
+                self._ensure_apply_btn().show()
+
+                # Build tooltip
+                if self._tooltip_text:
+                    self.setToolTip(f"Click 'Apply' to sync changes:\n{self._tooltip_text}")
+                else:
+                    self.setToolTip(f"{self._change_count} setting(s) differ from running system.\n"
+                                    "Click 'Apply' to hot-reload.")
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @pyqtSlot()
     def _on_apply_clicked(self):
         """Handle apply button click"""
         self.apply_clicked.emit()
@@ -238,6 +294,7 @@ class ConfigSyncStatusBar(QFrame):
             }
         """)
 
+    @pyqtSlot()
     def _on_apply(self):
         """Forward apply signal"""
         self.apply_clicked.emit()
@@ -246,8 +303,7 @@ class ConfigSyncStatusBar(QFrame):
                    change_count: int = 0, tooltip: str = "",
                    last_sync_time: str = ""):
         """Update status bar"""
-        self.indicator.set_running(is_running)
-        self.indicator.set_synced(is_synced, change_count, tooltip)
+        self.indicator.set_state(is_running, is_synced, change_count, tooltip)
 
         if last_sync_time:
             self.sync_time_label.setText(f"Last sync: {last_sync_time}")
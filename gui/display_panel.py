@@ -5,18 +5,45 @@ Handles all display widgets: dashboard, charts, logs, and real-time updates
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QGridLayout,
-    QLabel, QTabWidget, QTextEdit, QPushButton
+    QLabel, QTabWidget, QPlainTextEdit, QPushButton, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QFont, QColor
-from datetime import datetime
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QColor, QTextCursor
+from collections import deque
+from functools import lru_cache
 import logging
+import time
 
 from gui.chart_widget import ChartWidget
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _dollar_text(value):
+    return f"${value:,.2f}"
+
+
+def _fmt_dollar(value):
+    """Format a dollar amount, cached per cent since balances and P&L mostly repeat"""
+    # + 0.0 turns -0.0 into 0.0, which share a cache entry
+    return _dollar_text(round(value, 2) + 0.0)
+
+
+_fmt_pct1 = "{:.1f}%".format
+
+# Signal badge styles
+_SIGNAL_STYLE_LONG = "background-color: #27ae60; color: white; padding: 5px; border-radius: 3px; font-weight: bold;"
+_SIGNAL_STYLE_SHORT = "background-color: #e74c3c; color: white; padding: 5px; border-radius: 3px; font-weight: bold;"
+_SIGNAL_STYLE_HOLD = "background-color: #7f8c8d; color: white; padding: 5px; border-radius: 3px; font-weight: bold;"
+_SIGNAL_STYLES = {"LONG": _SIGNAL_STYLE_LONG, "SHORT": _SIGNAL_STYLE_SHORT}
+
+# Total P&L styles
+_PNL_STYLE_POS = "color: #27ae60; font-weight: bold; font-size: 16px;"
+_PNL_STYLE_NEG = "color: #e74c3c; font-weight: bold; font-size: 16px;"
+_PNL_STYLE_NEUTRAL = "color: #ecf0f1; font-weight: bold; font-size: 16px;"
+
+
 class DisplayPanel(QWidget):
     """
     Display Panel Widget
@@ -26,10 +53,19 @@ class DisplayPanel(QWidget):
     # Signals
     start_stop_clicked = pyqtSignal()  # Emitted when start/stop button clicked
 
+    CHART_REFRESH_MS = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._chart_widget = None
+        self._chart_dirty = False  # Data added to the chart since its last redraw
         self.init_ui()
 
+        self._chart_timer = QTimer(self)
+        self._chart_timer.setSingleShot(True)
+        self._chart_timer.setInterval(self.CHART_REFRESH_MS)
+        self._chart_timer.timeout.connect(self.refresh_chart)
+
     def init_ui(self):
         """Initialize display panel UI"""
         layout = QVBoxLayout(self)
@@ -42,9 +78,21 @@ class DisplayPanel(QWidget):
         self.dashboard_widget = DashboardWidget()
         self.tabs.addTab(self.dashboard_widget, "📊 Dashboard")
 
-        # Chart tab
-        self.chart_widget = ChartWidget()
-        self.tabs.addTab(self.chart_widget, "📈 Charts")
+        # Dashboard updates go straight to the dashboard widget
+        dashboard = self.dashboard_widget
+        self.update_live_stats = dashboard.update_live_stats
+        self.update_model_metrics = dashboard.update_model_metrics
+        self.update_account_info = dashboard.update_account_info
+        self.update_position_overview = dashboard.update_position_overview
+        self.update_risk_manager = dashboard.update_risk_manager
+        self.update_pnl_attribution = dashboard.update_pnl_attribution
+        self.update_total_pnl = dashboard.update_total_pnl
+        self.update_status = dashboard.update_status
+
+        # Chart tab (the matplotlib chart is built on first use, see chart_widget)
+        self._chart_tab = QWidget()
+        QVBoxLayout(self._chart_tab).setContentsMargins(0, 0, 0, 0)
+        self.tabs.addTab(self._chart_tab, "📈 Charts")
 
         # Logs tab
         self.logs_widget = LogsWidget()
@@ -54,52 +102,71 @@ class DisplayPanel(QWidget):
 
         # Connect signals
         self.dashboard_widget.start_stop_clicked.connect(self.start_stop_clicked.emit)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    @property
+    def chart_widget(self):
+        """Chart widget, created on first access"""
+        return self._ensure_chart_widget()
+
+    def _ensure_chart_widget(self):
+        """Create the chart in its tab the first time it is needed"""
+        if self._chart_widget is None:
+            self._chart_widget = ChartWidget()
+            self._chart_tab.layout().addWidget(self._chart_widget)
+            self._chart_widget.show()
+        return self._chart_widget
 
     def add_log(self, message):
         """Add log message"""
         self.logs_widget.add_log(message)
 
+    def add_log_bulk(self, messages):
+        """Add several log messages at once"""
+        self.logs_widget.add_log_bulk(messages)
+
     def get_start_stop_button(self):
         """Get reference to start/stop button"""
         return self.dashboard_widget.start_stop_btn
 
     @pyqtSlot(object)
     def update_chart(self, snapshot):
-        """Update chart with new snapshot"""
-        self.chart_widget.update_chart(snapshot)
-
-    # Dashboard update methods - delegate to dashboard widget
-    def update_live_stats(self, z_score, correlation, hedge_ratio, spread, signal):
-        """Update live statistics panel"""
-        self.dashboard_widget.update_live_stats(z_score, correlation, hedge_ratio, spread, signal)
-
-    def update_model_metrics(self, metrics):
-        """Update model metrics panel"""
-        self.dashboard_widget.update_model_metrics(metrics)
-
-    def update_account_info(self, balance, equity, unrealized_pnl, margin_info):
-        """Update account information"""
-        self.dashboard_widget.update_account_info(balance, equity, unrealized_pnl, margin_info)
-
-    def update_position_overview(self, overview):
-        """Update position overview"""
-        self.dashboard_widget.update_position_overview(overview)
+        """Add a snapshot to the chart (if built), redrawn at most every CHART_REFRESH_MS"""
+        chart = self._chart_widget
+        if not snapshot or chart is None:
+            return
+        chart.add_realtime_data(snapshot, redraw=False)
+        self._chart_dirty = True
+        if not self._chart_timer.isActive():
+            self._chart_timer.start()
+
+    @pyqtSlot()
+    def refresh_chart(self):
+        """Redraw the chart once for the data added since the last redraw, if it is visible"""
+        chart = self._chart_widget
+        if not self._chart_dirty or chart is None or not chart.isVisible():
+            return
+        self._chart_dirty = False
+        if chart.auto_update_btn.isChecked():
+            chart.update_chart()
 
-    def update_risk_manager(self, risk_data):
-        """Update risk manager panel"""
-        self.dashboard_widget.update_risk_manager(risk_data)
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index):
+        """Render updates deferred while the dashboard or chart tab was hidden"""
+        widget = self.tabs.widget(index)
+        if widget is self.dashboard_widget:
+            self.replay_pending_updates()
+        elif widget is self._chart_tab:
+            self._ensure_chart_widget()
+            self.refresh_chart()
 
-    def update_pnl_attribution(self, attribution):
-        """Update P&L attribution panel"""
-        self.dashboard_widget.update_pnl_attribution(attribution)
+    def replay_pending_updates(self):
+        """Render dashboard updates deferred while the dashboard was hidden
 
-    def update_total_pnl(self, pnl):
-        """Update total P&L"""
-        self.dashboard_widget.update_total_pnl(pnl)
-
-    def update_status(self, status, color):
-        """Update status label"""
-        self.dashboard_widget.update_status(status, color)
+        Hosts that re-parent the dashboard panels into their own tabs should call
+        this when those panels become visible again.
+        """
+        self.dashboard_widget.flush()
 
 
 class DashboardWidget(QWidget):
@@ -107,8 +174,41 @@ class DashboardWidget(QWidget):
 
     start_stop_clicked = pyqtSignal()
 
+    REFRESH_INTERVAL_MS = 250  # Tick-driven updates are rendered at most 4 times per second
+
+    # Render method -> label whose visibility decides if the update is rendered now
+    RENDER_TARGETS = {
+        '_do_update_live_stats': 'z_score_label',
+        '_do_update_model_metrics': 'entry_threshold_label',
+        '_do_update_account_info': 'balance_label',
+        '_do_update_position_overview': 'open_spread_label',
+        '_do_update_risk_manager': 'setup_risk_pct_label',
+        '_do_update_pnl_attribution': 'spread_pnl_label',
+        '_do_update_total_pnl': 'total_pnl_label',
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Latest args per update, rendered by _apply_latest (older ticks are dropped,
+        # entries for hidden panels are kept until they are shown)
+        self._latest = {}
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._apply_latest)
+        # Last stylesheet written per label by _set_style
+        self._style_cache = {}
+        # Built once by create_live_stats_group
+        self._live_stats_group = None
+
+        # Fonts shared by all labels of the same style
+        self._f_mono9 = QFont("Courier New", 9)
+        self._f_mono10 = QFont("Courier New", 10)
+        self._f_mono10b = QFont("Courier New", 10, QFont.Weight.Bold)
+        self._f_mono11b = QFont("Courier New", 11, QFont.Weight.Bold)
+        self._f_mono14b = QFont("Courier New", 14, QFont.Weight.Bold)
+        self._f_mono16b = QFont("Courier New", 16, QFont.Weight.Bold)
+
         self.init_ui()
 
     def init_ui(self):
@@ -162,11 +262,21 @@ class DashboardWidget(QWidget):
         layout.addWidget(button_group)
 
         # Live statistics
+        layout.addWidget(self.create_live_stats_group())
+
+        panel.setLayout(layout)
+        return panel
+
+    def create_live_stats_group(self) -> QGroupBox:
+        """Get the Live Statistics group (built on first call)"""
+        if self._live_stats_group is not None:
+            return self._live_stats_group
+
         stats_group = QGroupBox("Live Statistics")
         stats_layout = QGridLayout()
 
         self.z_score_label = QLabel("--")
-        self.z_score_label.setFont(QFont("Courier New", 14, QFont.Weight.Bold))
+        self.z_score_label.setFont(self._f_mono14b)
         stats_layout.addWidget(QLabel("Z-Score:"), 0, 0)
         stats_layout.addWidget(self.z_score_label, 0, 1)
 
@@ -183,21 +293,19 @@ class DashboardWidget(QWidget):
         stats_layout.addWidget(self.spread_label, 0, 3)
 
         self.total_pnl_label = QLabel("$0.00")
-        self.total_pnl_label.setFont(QFont("Courier New", 16, QFont.Weight.Bold))
+        self.total_pnl_label.setFont(self._f_mono16b)
         stats_layout.addWidget(QLabel("Total P&L:"), 1, 2)
         stats_layout.addWidget(self.total_pnl_label, 1, 3)
 
         self.signal_label = QLabel("HOLD")
-        self.signal_label.setStyleSheet(
-            "background-color: #7f8c8d; color: white; padding: 5px; border-radius: 3px; font-weight: bold;")
+        self.signal_label.setStyleSheet(_SIGNAL_STYLE_HOLD)
+        self._last_signal_key = "HOLD"
         stats_layout.addWidget(QLabel("Signal:"), 2, 2)
         stats_layout.addWidget(self.signal_label, 2, 3)
 
         stats_group.setLayout(stats_layout)
-        layout.addWidget(stats_group)
-
-        panel.setLayout(layout)
-        return panel
+        self._live_stats_group = stats_group
+        return stats_group
 
     def _create_metrics_panel(self):
         """Create model metrics panel"""
@@ -207,60 +315,60 @@ class DashboardWidget(QWidget):
         # Row 0
         layout.addWidget(QLabel("Entry Threshold:"), 0, 0)
         self.entry_threshold_label = QLabel("2.0")
-        self.entry_threshold_label.setFont(QFont("Courier New", 10))
+        self.entry_threshold_label.setFont(self._f_mono10)
         layout.addWidget(self.entry_threshold_label, 0, 1)
 
         layout.addWidget(QLabel("Spread Mean:"), 0, 2)
         self.spread_mean_label = QLabel("--")
-        self.spread_mean_label.setFont(QFont("Courier New", 10))
+        self.spread_mean_label.setFont(self._f_mono10)
         layout.addWidget(self.spread_mean_label, 0, 3)
 
         layout.addWidget(QLabel("Mean Drift:"), 0, 4)
         self.mean_drift_label = QLabel("--")
-        self.mean_drift_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.mean_drift_label.setFont(self._f_mono10b)
         layout.addWidget(self.mean_drift_label, 0, 5)
 
         # Row 1
         layout.addWidget(QLabel("Exit Threshold:"), 1, 0)
         self.exit_threshold_label = QLabel("0.5")
-        self.exit_threshold_label.setFont(QFont("Courier New", 10))
+        self.exit_threshold_label.setFont(self._f_mono10)
         layout.addWidget(self.exit_threshold_label, 1, 1)
 
         layout.addWidget(QLabel("Spread Std:"), 1, 2)
         self.spread_std_label = QLabel("--")
-        self.spread_std_label.setFont(QFont("Courier New", 10))
+        self.spread_std_label.setFont(self._f_mono10)
         layout.addWidget(self.spread_std_label, 1, 3)
 
         layout.addWidget(QLabel("Window Size:"), 1, 4)
         self.window_size_label = QLabel("200")
-        self.window_size_label.setFont(QFont("Courier New", 10))
+        self.window_size_label.setFont(self._f_mono10)
         layout.addWidget(self.window_size_label, 1, 5)
 
         # Row 2
         layout.addWidget(QLabel("Max Z-Score:"), 2, 0)
         self.max_z_score_label = QLabel("--")
-        self.max_z_score_label.setFont(QFont("Courier New", 10))
+        self.max_z_score_label.setFont(self._f_mono10)
         layout.addWidget(self.max_z_score_label, 2, 1)
 
         layout.addWidget(QLabel("Max Mean:"), 2, 2)
         self.max_mean_label = QLabel("--")
-        self.max_mean_label.setFont(QFont("Courier New", 10))
+        self.max_mean_label.setFont(self._f_mono10)
         layout.addWidget(self.max_mean_label, 2, 3)
 
         layout.addWidget(QLabel("Last Update:"), 2, 4)
         self.last_update_label = QLabel("--")
-        self.last_update_label.setFont(QFont("Courier New", 9))
+        self.last_update_label.setFont(self._f_mono9)
         layout.addWidget(self.last_update_label, 2, 5)
 
         # Row 3
         layout.addWidget(QLabel("Min Z-Score:"), 3, 0)
         self.min_z_score_label = QLabel("--")
-        self.min_z_score_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.min_z_score_label.setFont(self._f_mono10b)
         layout.addWidget(self.min_z_score_label, 3, 1)
 
         layout.addWidget(QLabel("Min Mean:"), 3, 2)
         self.min_mean_label = QLabel("--")
-        self.min_mean_label.setFont(QFont("Courier New", 10))
+        self.min_mean_label.setFont(self._f_mono10)
         layout.addWidget(self.min_mean_label, 3, 3)
 
         layout.addWidget(QLabel("Status:"), 3, 4)
@@ -268,6 +376,17 @@ class DashboardWidget(QWidget):
         self.status_label.setStyleSheet("color: #7f8c8d; font-weight: bold;")
         layout.addWidget(self.status_label, 3, 5)
 
+        # (label, metrics key, format) for optional values shown as "--" when missing
+        self._metrics_table = [
+            (self.spread_mean_label, 'spread_mean', '{:.4f}'.format),
+            (self.spread_std_label, 'spread_std', '{:.4f}'.format),
+            (self.mean_drift_label, 'mean_drift', '{:.4f}'.format),
+            (self.max_z_score_label, 'max_z_score', '{:.2f}'.format),
+            (self.min_z_score_label, 'min_z_score', '{:.2f}'.format),
+            (self.max_mean_label, 'max_mean', '{:.4f}'.format),
+            (self.min_mean_label, 'min_mean', '{:.4f}'.format),
+        ]
+
         panel.setLayout(layout)
         return panel
 
@@ -283,19 +402,19 @@ class DashboardWidget(QWidget):
 
         layout.addWidget(QLabel("Balance:"), 1, 0)
         self.balance_label = QLabel("$0.00")
-        self.balance_label.setFont(QFont("Courier New", 11, QFont.Weight.Bold))
+        self.balance_label.setFont(self._f_mono11b)
         self.balance_label.setStyleSheet("color: #2980b9;")
         layout.addWidget(self.balance_label, 1, 1)
 
         layout.addWidget(QLabel("Equity:"), 1, 2)
         self.equity_label = QLabel("$0.00")
-        self.equity_label.setFont(QFont("Courier New", 11, QFont.Weight.Bold))
+        self.equity_label.setFont(self._f_mono11b)
         self.equity_label.setStyleSheet("color: #27ae60;")
         layout.addWidget(self.equity_label, 1, 3)
 
         layout.addWidget(QLabel("Unrealized P&L:"), 1, 4)
         self.unrealized_pnl_label = QLabel("$0.00")
-        self.unrealized_pnl_label.setFont(QFont("Courier New", 11, QFont.Weight.Bold))
+        self.unrealized_pnl_label.setFont(self._f_mono11b)
         layout.addWidget(self.unrealized_pnl_label, 1, 5)
 
         # Margin Info
@@ -309,7 +428,7 @@ class DashboardWidget(QWidget):
 
         layout.addWidget(QLabel("Margin Level:"), 2, 4)
         self.margin_level_label = QLabel("0.0%")
-        self.margin_level_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.margin_level_label.setFont(self._f_mono10b)
         layout.addWidget(self.margin_level_label, 2, 5)
 
         # === POSITION OVERVIEW ===
@@ -319,32 +438,32 @@ class DashboardWidget(QWidget):
 
         layout.addWidget(QLabel("Open Spread:"), 4, 0)
         self.open_spread_label = QLabel("0")
-        self.open_spread_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.open_spread_label.setFont(self._f_mono10b)
         layout.addWidget(self.open_spread_label, 4, 1)
 
         layout.addWidget(QLabel("Open/Close:"), 4, 2)
         self.open_close_label = QLabel("0 / 0")
-        self.open_close_label.setFont(QFont("Courier New", 9))
+        self.open_close_label.setFont(self._f_mono9)
         layout.addWidget(self.open_close_label, 4, 3)
 
         layout.addWidget(QLabel("Total Lots:"), 4, 4)
         self.total_lots_label = QLabel("0.00 / 0.00")
-        self.total_lots_label.setFont(QFont("Courier New", 9))
+        self.total_lots_label.setFont(self._f_mono9)
         layout.addWidget(self.total_lots_label, 4, 5)
 
         layout.addWidget(QLabel("Hedge Quality:"), 5, 0)
         self.hedge_quality_label = QLabel("--")
-        self.hedge_quality_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.hedge_quality_label.setFont(self._f_mono10b)
         layout.addWidget(self.hedge_quality_label, 5, 1)
 
         layout.addWidget(QLabel("Imbalance:"), 5, 2)
         self.imbalance_label = QLabel("Balanced")
-        self.imbalance_label.setFont(QFont("Courier New", 9))
+        self.imbalance_label.setFont(self._f_mono9)
         layout.addWidget(self.imbalance_label, 5, 3)
 
         layout.addWidget(QLabel("Value:"), 5, 4)
         self.value_label = QLabel("$0.00")
-        self.value_label.setFont(QFont("Courier New", 9))
+        self.value_label.setFont(self._f_mono9)
         layout.addWidget(self.value_label, 5, 5)
 
         # === RISK MANAGER ===
@@ -364,13 +483,13 @@ class DashboardWidget(QWidget):
         # Risk percentages
         layout.addWidget(QLabel("Risk %:"), 8, 0)
         self.setup_risk_pct_label = QLabel("--%")
-        self.setup_risk_pct_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.setup_risk_pct_label.setFont(self._f_mono10b)
         self.setup_risk_pct_label.setStyleSheet("color: #3498db;")
         layout.addWidget(self.setup_risk_pct_label, 8, 1)
 
         layout.addWidget(QLabel("Risk %:"), 8, 2)
         self.daily_risk_pct_label = QLabel("--%")
-        self.daily_risk_pct_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.daily_risk_pct_label.setFont(self._f_mono10b)
         self.daily_risk_pct_label.setStyleSheet("color: #e74c3c;")
         layout.addWidget(self.daily_risk_pct_label, 8, 3)
 
@@ -382,35 +501,35 @@ class DashboardWidget(QWidget):
         # Risk amounts
         layout.addWidget(QLabel("Risk $:"), 9, 0)
         self.setup_risk_amount_label = QLabel("$--")
-        self.setup_risk_amount_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.setup_risk_amount_label.setFont(self._f_mono10b)
         self.setup_risk_amount_label.setStyleSheet("color: #3498db;")
         layout.addWidget(self.setup_risk_amount_label, 9, 1)
 
         layout.addWidget(QLabel("Risk $:"), 9, 2)
         self.daily_risk_limit_label = QLabel("$--")
-        self.daily_risk_limit_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.daily_risk_limit_label.setFont(self._f_mono10b)
         self.daily_risk_limit_label.setStyleSheet("color: #e74c3c;")
         layout.addWidget(self.daily_risk_limit_label, 9, 3)
 
         layout.addWidget(QLabel("Block Time:"), 9, 4)
         self.block_time_label = QLabel("--")
-        self.block_time_label.setFont(QFont("Courier New", 9))
+        self.block_time_label.setFont(self._f_mono9)
         layout.addWidget(self.block_time_label, 9, 5)
 
         # Unrealized & Total
         layout.addWidget(QLabel("Unrealized:"), 10, 0)
         self.risk_unrealized_label = QLabel("$--")
-        self.risk_unrealized_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.risk_unrealized_label.setFont(self._f_mono10b)
         layout.addWidget(self.risk_unrealized_label, 10, 1)
 
         layout.addWidget(QLabel("Total PnL:"), 10, 2)
         self.daily_total_pnl_label = QLabel("$--")
-        self.daily_total_pnl_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.daily_total_pnl_label.setFont(self._f_mono10b)
         layout.addWidget(self.daily_total_pnl_label, 10, 3)
 
         layout.addWidget(QLabel("Unlock Time:"), 10, 4)
         self.unlock_time_label = QLabel("--")
-        self.unlock_time_label.setFont(QFont("Courier New", 9))
+        self.unlock_time_label.setFont(self._f_mono9)
         layout.addWidget(self.unlock_time_label, 10, 5)
 
         panel.setLayout(layout)
@@ -424,37 +543,37 @@ class DashboardWidget(QWidget):
         # Left side - P&L components
         layout.addWidget(QLabel("Spread P&L:"), 0, 0)
         self.spread_pnl_label = QLabel("$0.00")
-        self.spread_pnl_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.spread_pnl_label.setFont(self._f_mono10b)
         self.spread_pnl_label.setStyleSheet("color: #3498db;")
         layout.addWidget(self.spread_pnl_label, 0, 1)
         self.spread_pnl_pct_label = QLabel("0.0%")
-        self.spread_pnl_pct_label.setFont(QFont("Courier New", 9))
+        self.spread_pnl_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.spread_pnl_pct_label, 0, 2)
 
         layout.addWidget(QLabel("Mean Drift P&L:"), 1, 0)
         self.mean_drift_pnl_label = QLabel("$0.00")
-        self.mean_drift_pnl_label.setFont(QFont("Courier New", 10))
+        self.mean_drift_pnl_label.setFont(self._f_mono10)
         self.mean_drift_pnl_label.setStyleSheet("color: #9b59b6;")
         layout.addWidget(self.mean_drift_pnl_label, 1, 1)
         self.mean_drift_pnl_pct_label = QLabel("0.0%")
-        self.mean_drift_pnl_pct_label.setFont(QFont("Courier New", 9))
+        self.mean_drift_pnl_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.mean_drift_pnl_pct_label, 1, 2)
 
         layout.addWidget(QLabel("Directional P&L:"), 2, 0)
         self.directional_pnl_label = QLabel("$0.00")
-        self.directional_pnl_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.directional_pnl_label.setFont(self._f_mono10b)
         self.directional_pnl_label.setStyleSheet("color: #95a5a6;")
         layout.addWidget(self.directional_pnl_label, 2, 1)
         self.directional_pnl_pct_label = QLabel("0.0%")
-        self.directional_pnl_pct_label.setFont(QFont("Courier New", 9))
+        self.directional_pnl_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.directional_pnl_pct_label, 2, 2)
 
         layout.addWidget(QLabel("Hedge Imbalance:"), 3, 0)
         self.hedge_imbalance_pnl_label = QLabel("$0.00")
-        self.hedge_imbalance_pnl_label.setFont(QFont("Courier New", 10))
+        self.hedge_imbalance_pnl_label.setFont(self._f_mono10)
         layout.addWidget(self.hedge_imbalance_pnl_label, 3, 1)
         self.hedge_imbalance_pnl_pct_label = QLabel("0.0%")
-        self.hedge_imbalance_pnl_pct_label.setFont(QFont("Courier New", 9))
+        self.hedge_imbalance_pnl_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.hedge_imbalance_pnl_pct_label, 3, 2)
 
         # Spacer
@@ -463,189 +582,253 @@ class DashboardWidget(QWidget):
         # Right side - Costs and alpha
         layout.addWidget(QLabel("Transaction Costs:"), 0, 4)
         self.transaction_costs_label = QLabel("$0.00")
-        self.transaction_costs_label.setFont(QFont("Courier New", 10))
+        self.transaction_costs_label.setFont(self._f_mono10)
         self.transaction_costs_label.setStyleSheet("color: #e74c3c;")
         layout.addWidget(self.transaction_costs_label, 0, 5)
         self.transaction_costs_pct_label = QLabel("0.0%")
-        self.transaction_costs_pct_label.setFont(QFont("Courier New", 9))
+        self.transaction_costs_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.transaction_costs_pct_label, 0, 6)
 
         layout.addWidget(QLabel("Slippage:"), 1, 4)
         self.slippage_label = QLabel("$0.00")
-        self.slippage_label.setFont(QFont("Courier New", 10))
+        self.slippage_label.setFont(self._f_mono10)
         layout.addWidget(self.slippage_label, 1, 5)
         self.slippage_pct_label = QLabel("0.0%")
-        self.slippage_pct_label.setFont(QFont("Courier New", 9))
+        self.slippage_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.slippage_pct_label, 1, 6)
 
         layout.addWidget(QLabel("Rebalance Alpha:"), 2, 4)
         self.rebalance_alpha_label = QLabel("$0.00")
-        self.rebalance_alpha_label.setFont(QFont("Courier New", 10))
+        self.rebalance_alpha_label.setFont(self._f_mono10)
         self.rebalance_alpha_label.setStyleSheet("color: #27ae60;")
         layout.addWidget(self.rebalance_alpha_label, 2, 5)
         self.rebalance_alpha_pct_label = QLabel("0.0%")
-        self.rebalance_alpha_pct_label.setFont(QFont("Courier New", 9))
+        self.rebalance_alpha_pct_label.setFont(self._f_mono9)
         layout.addWidget(self.rebalance_alpha_pct_label, 2, 6)
 
         # Separator
-        separator = QLabel("─" * 80)
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
         separator.setStyleSheet("color: #34495e;")
         layout.addWidget(separator, 4, 0, 1, 7)
 
         # Quality metrics
         layout.addWidget(QLabel("Hedge Quality:"), 5, 0)
         self.pnl_hedge_quality_label = QLabel("--")
-        self.pnl_hedge_quality_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.pnl_hedge_quality_label.setFont(self._f_mono10b)
         self.pnl_hedge_quality_label.setStyleSheet("color: #95a5a6;")
         layout.addWidget(self.pnl_hedge_quality_label, 5, 1)
 
         layout.addWidget(QLabel("Strategy Purity:"), 5, 2)
         self.strategy_purity_label = QLabel("--")
-        self.strategy_purity_label.setFont(QFont("Courier New", 10))
+        self.strategy_purity_label.setFont(self._f_mono10)
         layout.addWidget(self.strategy_purity_label, 5, 3)
 
         layout.addWidget(QLabel("Classification:"), 5, 4)
         self.classification_label = QLabel("NO DATA")
-        self.classification_label.setFont(QFont("Courier New", 10, QFont.Weight.Bold))
+        self.classification_label.setFont(self._f_mono10b)
         self.classification_label.setStyleSheet("color: #95a5a6;")
         layout.addWidget(self.classification_label, 5, 5, 1, 2)
 
+        # (label, attribution key, format) for numeric components, missing values count as 0
+        self._attribution_table = [
+            (self.spread_pnl_label, 'spread_pnl', _fmt_dollar),
+            (self.spread_pnl_pct_label, 'spread_pnl_pct', _fmt_pct1),
+            (self.mean_drift_pnl_label, 'mean_drift_pnl', _fmt_dollar),
+            (self.mean_drift_pnl_pct_label, 'mean_drift_pnl_pct', _fmt_pct1),
+            (self.directional_pnl_label, 'directional_pnl', _fmt_dollar),
+            (self.directional_pnl_pct_label, 'directional_pnl_pct', _fmt_pct1),
+            (self.hedge_imbalance_pnl_label, 'hedge_imbalance_pnl', _fmt_dollar),
+            (self.hedge_imbalance_pnl_pct_label, 'hedge_imbalance_pnl_pct', _fmt_pct1),
+            (self.transaction_costs_label, 'transaction_costs', _fmt_dollar),
+            (self.transaction_costs_pct_label, 'transaction_costs_pct', _fmt_pct1),
+            (self.slippage_label, 'slippage', _fmt_dollar),
+            (self.slippage_pct_label, 'slippage_pct', _fmt_pct1),
+            (self.rebalance_alpha_label, 'rebalance_alpha', _fmt_dollar),
+            (self.rebalance_alpha_pct_label, 'rebalance_alpha_pct', _fmt_pct1),
+        ]
+
         panel.setLayout(layout)
         return panel
 
+    @staticmethod
+    def _set(label, text):
+        """Set label text only if it changed (setText always invalidates layout)"""
+        if label.text() != text:
+            label.setText(text)
+
+    def _set_style(self, label, style):
+        """Set label stylesheet only if it differs from the last one written here"""
+        if self._style_cache.get(label) != style:
+            self._style_cache[label] = style
+            label.setStyleSheet(style)
+
+    def _queue_update(self, name, *args):
+        """Store the latest args for a render method and schedule the next refresh"""
+        self._latest[name] = args
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    @pyqtSlot()
+    def _apply_latest(self):
+        """Render the most recent args of every queued update whose panel is visible"""
+        latest, self._latest = self._latest, {}
+        for name, args in latest.items():
+            label = getattr(self, self.RENDER_TARGETS[name])
+            # isVisibleTo(window) is False on a hidden tab, True before the window is first shown
+            if label.isVisibleTo(label.window()):
+                getattr(self, name)(*args)
+            else:
+                self._latest[name] = args
+
+    def flush(self):
+        """Render queued updates for visible panels now instead of on the next refresh"""
+        self._refresh_timer.stop()
+        self._apply_latest()
+
     def update_live_stats(self, z_score, correlation, hedge_ratio, spread, signal):
+        """Update live statistics (rendered on the next refresh)"""
+        self._queue_update('_do_update_live_stats', z_score, correlation, hedge_ratio, spread, signal)
+
+    def update_model_metrics(self, metrics):
+        """Update model metrics panel (rendered on the next refresh)"""
+        if metrics:  # Empty payloads are ignored, don't let them replace a queued one
+            self._queue_update('_do_update_model_metrics', metrics)
+
+    def update_account_info(self, balance, equity, unrealized_pnl, margin_info):
+        """Update account information (rendered on the next refresh)"""
+        self._queue_update('_do_update_account_info', balance, equity, unrealized_pnl, margin_info)
+
+    def update_position_overview(self, overview):
+        """Update position overview (rendered on the next refresh)"""
+        if overview:
+            self._queue_update('_do_update_position_overview', overview)
+
+    def update_risk_manager(self, risk_data):
+        """Update risk manager panel (rendered on the next refresh)"""
+        if risk_data:
+            self._queue_update('_do_update_risk_manager', risk_data)
+
+    def update_pnl_attribution(self, attribution):
+        """Update P&L attribution panel (rendered on the next refresh)"""
+        if attribution:
+            self._queue_update('_do_update_pnl_attribution', attribution)
+
+    def update_total_pnl(self, pnl):
+        """Update total P&L (rendered on the next refresh)"""
+        self._queue_update('_do_update_total_pnl', pnl)
+
+    def _do_update_live_stats(self, z_score, correlation, hedge_ratio, spread, signal):
         """Update live statistics"""
-        self.z_score_label.setText(f"{z_score:.2f}" if z_score is not None else "--")
-        self.correlation_label.setText(f"{correlation:.3f}" if correlation is not None else "--")
-        self.hedge_ratio_label.setText(f"{hedge_ratio:.3f}" if hedge_ratio is not None else "--")
-        self.spread_label.setText(f"{spread:.4f}" if spread is not None else "--")
+        self._set(self.z_score_label, f"{z_score:.2f}" if z_score is not None else "--")
+        self._set(self.correlation_label, f"{correlation:.3f}" if correlation is not None else "--")
+        self._set(self.hedge_ratio_label, f"{hedge_ratio:.3f}" if hedge_ratio is not None else "--")
+        self._set(self.spread_label, f"{spread:.4f}" if spread is not None else "--")
 
         if signal:
-            self.signal_label.setText(signal)
-            if "LONG" in signal:
-                self.signal_label.setStyleSheet("background-color: #27ae60; color: white; padding: 5px; border-radius: 3px; font-weight: bold;")
-            elif "SHORT" in signal:
-                self.signal_label.setStyleSheet("background-color: #e74c3c; color: white; padding: 5px; border-radius: 3px; font-weight: bold;")
-            else:
-                self.signal_label.setStyleSheet("background-color: #7f8c8d; color: white; padding: 5px; border-radius: 3px; font-weight: bold;")
+            self._set(self.signal_label, signal)
+            key = "LONG" if "LONG" in signal else "SHORT" if "SHORT" in signal else "HOLD"
+            if key != self._last_signal_key:
+                self._last_signal_key = key
+                self.signal_label.setStyleSheet(_SIGNAL_STYLES.get(key, _SIGNAL_STYLE_HOLD))
 
-    def update_model_metrics(self, metrics):
+    def _do_update_model_metrics(self, metrics):
         """Update model metrics panel"""
         if not metrics:
             return
 
-        self.entry_threshold_label.setText(f"{metrics.get('entry_threshold', 2.0):.1f}")
-        self.exit_threshold_label.setText(f"{metrics.get('exit_threshold', 0.5):.1f}")
-        self.window_size_label.setText(str(metrics.get('window_size', 200)))
-
-        self.spread_mean_label.setText(f"{metrics.get('spread_mean', 0):.4f}" if metrics.get('spread_mean') is not None else "--")
-        self.spread_std_label.setText(f"{metrics.get('spread_std', 0):.4f}" if metrics.get('spread_std') is not None else "--")
+        g = metrics.get
+        self._set(self.entry_threshold_label, f"{g('entry_threshold', 2.0):.1f}")
+        self._set(self.exit_threshold_label, f"{g('exit_threshold', 0.5):.1f}")
+        self._set(self.window_size_label, str(g('window_size', 200)))
 
-        self.mean_drift_label.setText(f"{metrics.get('mean_drift', 0):.4f}" if metrics.get('mean_drift') is not None else "--")
-        self.max_z_score_label.setText(f"{metrics.get('max_z_score', 0):.2f}" if metrics.get('max_z_score') is not None else "--")
-        self.min_z_score_label.setText(f"{metrics.get('min_z_score', 0):.2f}" if metrics.get('min_z_score') is not None else "--")
-        self.max_mean_label.setText(f"{metrics.get('max_mean', 0):.4f}" if metrics.get('max_mean') is not None else "--")
-        self.min_mean_label.setText(f"{metrics.get('min_mean', 0):.4f}" if metrics.get('min_mean') is not None else "--")
+        for label, key, fmt in self._metrics_table:
+            v = g(key)
+            self._set(label, fmt(v) if v is not None else "--")
 
-        if 'last_update' in metrics:
-            self.last_update_label.setText(metrics['last_update'])
+        v = g('last_update')
+        if v is not None:
+            self._set(self.last_update_label, v)
 
-    def update_account_info(self, balance, equity, unrealized_pnl, margin_info):
+    def _do_update_account_info(self, balance, equity, unrealized_pnl, margin_info):
         """Update account information"""
-        self.balance_label.setText(f"${balance:,.2f}" if balance is not None else "$0.00")
-        self.equity_label.setText(f"${equity:,.2f}" if equity is not None else "$0.00")
-        self.unrealized_pnl_label.setText(f"${unrealized_pnl:,.2f}" if unrealized_pnl is not None else "$0.00")
+        self._set(self.balance_label, _fmt_dollar(balance) if balance is not None else "$0.00")
+        self._set(self.equity_label, _fmt_dollar(equity) if equity is not None else "$0.00")
+        self._set(self.unrealized_pnl_label, _fmt_dollar(unrealized_pnl) if unrealized_pnl is not None else "$0.00")
 
         # Color code unrealized P&L
         if unrealized_pnl and unrealized_pnl > 0:
-            self.unrealized_pnl_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self._set_style(self.unrealized_pnl_label, "color: #27ae60; font-weight: bold;")
         elif unrealized_pnl and unrealized_pnl < 0:
-            self.unrealized_pnl_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            self._set_style(self.unrealized_pnl_label, "color: #e74c3c; font-weight: bold;")
 
         if margin_info:
-            self.used_margin_label.setText(f"${margin_info.get('used', 0):,.2f}")
-            self.free_margin_label.setText(f"${margin_info.get('free', 0):,.2f}")
-            self.margin_level_label.setText(f"{margin_info.get('level', 0):.1f}%")
+            self._set(self.used_margin_label, _fmt_dollar(margin_info.get('used', 0)))
+            self._set(self.free_margin_label, _fmt_dollar(margin_info.get('free', 0)))
+            self._set(self.margin_level_label, f"{margin_info.get('level', 0):.1f}%")
 
-    def update_position_overview(self, overview):
+    def _do_update_position_overview(self, overview):
         """Update position overview"""
         if not overview:
             return
 
-        self.open_spread_label.setText(str(overview.get('open_spread', 0)))
-        self.open_close_label.setText(f"{overview.get('open_positions', 0)} / {overview.get('closed_positions', 0)}")
-        self.total_lots_label.setText(f"{overview.get('primary_lots', 0):.2f} / {overview.get('secondary_lots', 0):.2f}")
-
-        hedge_quality = overview.get('hedge_quality', '--')
-        self.hedge_quality_label.setText(str(hedge_quality))
-
-        self.imbalance_label.setText(overview.get('imbalance', 'Balanced'))
-        self.value_label.setText(f"${overview.get('value', 0):,.2f}")
+        g = overview.get
+        self._set(self.open_spread_label, str(g('open_spread', 0)))
+        self._set(self.open_close_label, f"{g('open_positions', 0)} / {g('closed_positions', 0)}")
+        self._set(self.total_lots_label, f"{g('primary_lots', 0):.2f} / {g('secondary_lots', 0):.2f}")
+        self._set(self.hedge_quality_label, str(g('hedge_quality', '--')))
+        self._set(self.imbalance_label, g('imbalance', 'Balanced'))
+        self._set(self.value_label, _fmt_dollar(g('value', 0)))
 
-    def update_risk_manager(self, risk_data):
+    def _do_update_risk_manager(self, risk_data):
         """Update risk manager panel"""
         if not risk_data:
             return
 
-        self.setup_risk_pct_label.setText(f"{risk_data.get('setup_risk_pct', 0):.0f}%")
-        self.setup_risk_amount_label.setText(f"${risk_data.get('setup_risk_amount', 0):,.0f}")
+        g = risk_data.get
+        self._set(self.setup_risk_pct_label, f"{g('setup_risk_pct', 0):.0f}%")
+        self._set(self.setup_risk_amount_label, f"${g('setup_risk_amount', 0):,.0f}")
 
-        self.daily_risk_pct_label.setText(f"{risk_data.get('daily_risk_pct', 0):.0f}%")
-        self.daily_risk_limit_label.setText(f"${risk_data.get('daily_risk_limit', 0):,.0f}")
+        self._set(self.daily_risk_pct_label, f"{g('daily_risk_pct', 0):.0f}%")
+        self._set(self.daily_risk_limit_label, f"${g('daily_risk_limit', 0):,.0f}")
 
-        self.trading_status_label.setText(risk_data.get('trading_status', '--'))
-        self.block_time_label.setText(risk_data.get('block_time', '--'))
+        self._set(self.trading_status_label, g('trading_status', '--'))
+        self._set(self.block_time_label, g('block_time', '--'))
 
-        self.risk_unrealized_label.setText(f"${risk_data.get('unrealized', 0):,.2f}")
-        unrealized = risk_data.get('unrealized', 0)
+        unrealized = g('unrealized', 0)
+        self._set(self.risk_unrealized_label, _fmt_dollar(unrealized))
         if unrealized < 0:
-            self.risk_unrealized_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            self._set_style(self.risk_unrealized_label, "color: #e74c3c; font-weight: bold;")
         else:
-            self.risk_unrealized_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self._set_style(self.risk_unrealized_label, "color: #27ae60; font-weight: bold;")
 
-        self.daily_total_pnl_label.setText(f"${risk_data.get('total_pnl', 0):,.2f}")
-        self.unlock_time_label.setText(risk_data.get('unlock_time', '--'))
+        self._set(self.daily_total_pnl_label, _fmt_dollar(g('total_pnl', 0)))
+        self._set(self.unlock_time_label, g('unlock_time', '--'))
 
-    def update_pnl_attribution(self, attribution):
+    def _do_update_pnl_attribution(self, attribution):
         """Update P&L attribution panel"""
         if not attribution:
             return
 
-        self.spread_pnl_label.setText(f"${attribution.get('spread_pnl', 0):,.2f}")
-        self.spread_pnl_pct_label.setText(f"{attribution.get('spread_pnl_pct', 0):.1f}%")
-
-        self.mean_drift_pnl_label.setText(f"${attribution.get('mean_drift_pnl', 0):,.2f}")
-        self.mean_drift_pnl_pct_label.setText(f"{attribution.get('mean_drift_pnl_pct', 0):.1f}%")
-
-        self.directional_pnl_label.setText(f"${attribution.get('directional_pnl', 0):,.2f}")
-        self.directional_pnl_pct_label.setText(f"{attribution.get('directional_pnl_pct', 0):.1f}%")
-
-        self.hedge_imbalance_pnl_label.setText(f"${attribution.get('hedge_imbalance_pnl', 0):,.2f}")
-        self.hedge_imbalance_pnl_pct_label.setText(f"{attribution.get('hedge_imbalance_pnl_pct', 0):.1f}%")
+        g = attribution.get
+        for label, key, fmt in self._attribution_table:
+            self._set(label, fmt(g(key, 0)))
 
-        self.transaction_costs_label.setText(f"${attribution.get('transaction_costs', 0):,.2f}")
-        self.transaction_costs_pct_label.setText(f"{attribution.get('transaction_costs_pct', 0):.1f}%")
+        self._set(self.pnl_hedge_quality_label, g('hedge_quality', '--'))
+        self._set(self.strategy_purity_label, g('strategy_purity', '--'))
+        self._set(self.classification_label, g('classification', 'NO DATA'))
 
-        self.slippage_label.setText(f"${attribution.get('slippage', 0):,.2f}")
-        self.slippage_pct_label.setText(f"{attribution.get('slippage_pct', 0):.1f}%")
-
-        self.rebalance_alpha_label.setText(f"${attribution.get('rebalance_alpha', 0):,.2f}")
-        self.rebalance_alpha_pct_label.setText(f"{attribution.get('rebalance_alpha_pct', 0):.1f}%")
-
-        self.pnl_hedge_quality_label.setText(attribution.get('hedge_quality', '--'))
-        self.strategy_purity_label.setText(attribution.get('strategy_purity', '--'))
-        self.classification_label.setText(attribution.get('classification', 'NO DATA'))
-
-    def update_total_pnl(self, pnl):
+    def _do_update_total_pnl(self, pnl):
         """Update total P&L"""
-        self.total_pnl_label.setText(f"${pnl:,.2f}" if pnl is not None else "$0.00")
+        self._set(self.total_pnl_label, _fmt_dollar(pnl) if pnl is not None else "$0.00")
 
         if pnl and pnl > 0:
-            self.total_pnl_label.setStyleSheet("color: #27ae60; font-weight: bold; font-size: 16px;")
+            self._set_style(self.total_pnl_label, _PNL_STYLE_POS)
         elif pnl and pnl < 0:
-            self.total_pnl_label.setStyleSheet("color: #e74c3c; font-weight: bold; font-size: 16px;")
+            self._set_style(self.total_pnl_label, _PNL_STYLE_NEG)
         else:
-            self.total_pnl_label.setStyleSheet("color: #ecf0f1; font-weight: bold; font-size: 16px;")
+            self._set_style(self.total_pnl_label, _PNL_STYLE_NEUTRAL)
 
     def update_status(self, status, color):
         """Update status label"""
@@ -656,8 +839,25 @@ class DashboardWidget(QWidget):
 class LogsWidget(QWidget):
     """Logs display widget"""
 
+    MAX_LOG_LINES = 5000  # Oldest lines are dropped beyond this
+    FLUSH_INTERVAL_MS = 100  # Lines arriving within this window are appended together
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Lines waiting for the next flush; more than MAX_LOG_LINES would be trimmed by the widget anyway
+        self._pending = deque(maxlen=self.MAX_LOG_LINES)
+        # Always-current history; the widget itself is only written while visible
+        self._buffer = deque(maxlen=self.MAX_LOG_LINES)
+        self._stale = False
+        # Timestamp text of the last second a line was logged in
+        self._ts_sec = 0
+        self._ts_str = ""
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
         self.init_ui()
 
     def init_ui(self):
@@ -665,11 +865,17 @@ class LogsWidget(QWidget):
         layout = QVBoxLayout(self)
 
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.setMaximumBlockCount(self.MAX_LOG_LINES)
+        self.log_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.log_display.setFont(QFont("Courier New", 9))
         layout.addWidget(self.log_display)
 
+        # Write cursor kept apart from the view cursor so inserts don't touch selection/scroll
+        self._cursor = QTextCursor(self.log_display.document())
+
         # Clear button
         button_layout = QHBoxLayout()
         clear_btn = QPushButton("🗑️ Clear Logs")
@@ -678,11 +884,67 @@ class LogsWidget(QWidget):
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
+    def _timestamp(self):
+        """Current HH:MM:SS text, formatted once per second"""
+        t = int(time.time())
+        if t != self._ts_sec:
+            self._ts_sec = t
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(t))
+        return self._ts_str
+
     def add_log(self, message):
-        """Add log message with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_display.append(f"[{timestamp}] {message}")
+        """Queue log message with timestamp (appended on next flush)"""
+        line = f"[{self._timestamp()}] {message}"
+        self._buffer.append(line)
+        self._pending.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def add_log_bulk(self, messages):
+        """Queue several log messages under one timestamp"""
+        prefix = f"[{self._timestamp()}] "
+        lines = [prefix + message for message in messages]
+        self._buffer.extend(lines)
+        self._pending.extend(lines)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @pyqtSlot()
+    def _flush(self):
+        """Append all queued lines in a single call (deferred to showEvent while hidden)"""
+        if not self._pending:
+            return
+        if self.log_display.isVisible():
+            self._insert_lines("\n".join(self._pending))
+        else:
+            self._stale = True
+        self._pending.clear()
+
+    def _insert_lines(self, text):
+        """Insert text at the end of the document, following it only if already at the bottom"""
+        scrollbar = self.log_display.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        self._cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.log_display.document().isEmpty():
+            text = "\n" + text
+        self._cursor.insertText(text)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def showEvent(self, event):
+        """Catch up on lines logged while the tab was hidden"""
+        super().showEvent(event)
+        if self._stale:
+            self._pending.clear()
+            self.log_display.setPlainText("\n".join(self._buffer))
+            self.log_display.moveCursor(QTextCursor.MoveOperation.End)
+            self._stale = False
 
     def clear_logs(self):
         """Clear all logs"""
+        self._pending.clear()
+        self._buffer.clear()
+        self._stale = False
         self.log_display.clear()
@@ -12,14 +12,296 @@ Design principles:
 - Separation of concerns: Backend (data) -> Presenter (logic) -> GUI (display)
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, NamedTuple, Optional
 from pathlib import Path
 import json
 import logging
+import time
+
+# orjson parses the state file faster when available; stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Label styles
+_STYLE_RED_BOLD = "color: #e74c3c; font-weight: bold;"
+_STYLE_ORANGE_BOLD = "color: #f39c12; font-weight: bold;"
+_STYLE_GREEN_BOLD = "color: #27ae60; font-weight: bold;"
+_STYLE_GRAY_BOLD = "color: #7f8c8d; font-weight: bold;"
+_STYLE_RED = "color: #e74c3c;"
+_STYLE_ORANGE = "color: #f39c12;"
+_STYLE_GREEN = "color: #27ae60;"
+_STYLE_GRAY = "color: #95a5a6;"
+
+# Hedge quality (indicator, style) by band: >= 98%, >= 95%, below
+_HQ_OK = ("✓", _STYLE_GREEN_BOLD)
+_HQ_WARN = ("⚠", _STYLE_ORANGE_BOLD)
+_HQ_BAD = ("✗", _STYLE_RED_BOLD)
+
+# Signal badge styles
+_SIGNAL_STYLES = {
+    'HOLD': "background-color: #7f8c8d; color: white; padding: 2px; border-radius: 2px; font-weight: bold;",
+    'LONG SPREAD': "background-color: #27ae60; color: white; padding: 2px; border-radius: 2px; font-weight: bold;",
+    'SHORT SPREAD': "background-color: #e74c3c; color: white; padding: 2px; border-radius: 2px; font-weight: bold;",
+}
+
+
+# Fixed-precision number formatters ("--" for zero) and percentage formatters
+def _fmt1(value: float) -> str:
+    return "--" if value == 0.0 else f"{value:.1f}"
+
+
+def _fmt2(value: float) -> str:
+    return "--" if value == 0.0 else f"{value:.2f}"
+
+
+def _fmt4(value: float) -> str:
+    return "--" if value == 0.0 else f"{value:.4f}"
+
+
+def _fmt_pct1(value: float) -> str:
+    return f"{value:.1f}%"
+
+
+def _fmt_pct2(value: float) -> str:
+    return f"{value:.2f}%"
+
+
+# Templates for composite labels
+_LOTS_PRIMARY_FMT = "+{:.4f} lots (Primary)".format
+_LOTS_SECONDARY_FMT = "{:.4f} lots (Secondary)".format
+_OPEN_CLOSE_FMT = "{} / {}".format
+
+
+class SystemStatus(NamedTuple):
+    """Raw status values from TradingSystemThread.get_status (defaults = not running)"""
+
+    is_running: bool = False
+    # ========== CORE MARKET DATA ==========
+    zscore_value: float = 0.0
+    correlation_value: float = 0.0
+    hedge_ratio_value: float = 0.0
+    spread_value: float = 0.0
+    spread_mean_value: float = 0.0
+    spread_std_value: float = 0.0
+    signal_value: str = 'HOLD'
+    # ========== P&L DATA ==========
+    total_pnl_value: float = 0.0
+    unrealized_pnl_value: float = 0.0
+    realized_pnl_value: float = 0.0
+    # ========== POSITION COUNTS ==========
+    open_positions_value: int = 0
+    closed_positions_value: int = 0
+    # ========== ACCOUNT DATA (MT5) ==========
+    balance_value: float = 0.0
+    equity_value: float = 0.0
+    used_margin_value: float = 0.0
+    free_margin_value: float = 0.0
+    margin_level_value: float = 0.0
+    # ========== HEDGE METRICS ==========
+    primary_lots_value: float = 0.0
+    secondary_lots_value: float = 0.0
+    hedge_imbalance_value: float = 0.0
+    hedge_imbalance_pct_value: float = 0.0
+    # ========== MODEL PARAMETERS ==========
+    entry_threshold_value: float = 2.0
+    exit_threshold_value: float = 0.5
+    window_size_value: int = 200
+    scale_interval_value: float = 0.5
+    volume_multiplier_value: float = 1.0
+    # ========== STATISTICS TRACKING ==========
+    max_zscore_value: float = 0.0
+    min_zscore_value: float = 0.0
+    min_mean_value: float = 0.0
+    max_mean_value: float = 0.0
+    # ========== ENTRY TRACKING ==========
+    last_entry_zscore_value: Optional[float] = None
+    next_entry_zscore_value: Optional[float] = None
+    # ========== RISK MANAGEMENT ==========
+    setup_risk_pct_value: float = 0.0
+    daily_limit_pct_value: float = 0.0
+    daily_total_pnl_value: float = 0.0
+    trading_locked_value: bool = False
+    lock_time_value: Any = None
+    unlock_time_value: Any = None
+
+
+# Status reported while the trading system is not running
+DEFAULT_STATUS = SystemStatus()
+
+
+class Presentation(NamedTuple):
+    """GUI-ready display values produced by GUIDataPresenter.present_status"""
+
+    # ========== LIVE STATISTICS ==========
+    z_score_value: str
+    z_score_style: str
+    correlation_value: str
+    hedge_ratio_value: str
+    spread_value: str
+    total_pnl_value: str
+    total_pnl_style: str
+    signal_value: str
+    signal_style: str
+
+    # ========== MODEL METRICS ==========
+    entry_threshold_value: str
+    exit_threshold_value: str
+    window_size_value: str
+    spread_mean_value: str
+    spread_std_value: str
+    mean_drift_value: str
+    mean_drift_style: str
+    max_z_score_value: str
+    min_z_score_value: str
+    max_mean_value: str
+    min_mean_value: str
+    last_update_value: str
+    status_value: str
+    status_style: str
+    last_z_score_entries_value: str
+    next_z_score_entries_value: str
+    scalp_interval_value: str
+    volume_multiplier_value: str
+
+    # ========== ACCOUNT STATUS ==========
+    balance_value: str
+    equity_value: str
+    unrealized_pnl_value: str
+    unrealized_pnl_style: str
+    used_margin_value: str
+    free_margin_value: str
+    margin_level_value: str
+
+    # ========== POSITION OVERVIEW ==========
+    open_spread_value: str
+    open_close_value: str
+
+    # ========== HEDGE METRICS ==========
+    hedge_quality_value: str
+    hedge_quality_style: str
+    imbalance_value: str
+    imbalance_style: str
+    primary_lots_value: str
+    secondary_lots_value: str
+
+    # ========== RISK MONITORING ==========
+    setup_risk_pct_value: str
+    setup_risk_amount_value: str
+    risk_unrealized_value: str
+    risk_unrealized_style: str
+    daily_risk_pct_value: str
+    daily_risk_limit_value: str
+    daily_total_pnl_value: str
+    daily_total_pnl_style: str
+    daily_risk_pct_used_value: str
+
+    # ========== TRADING LOCK STATUS ==========
+    trading_status_value: str
+    trading_status_style: str
+    block_time_value: str
+    unlock_time_value: str
+
+
+# Presentation shown when no status is available
+_DEFAULT_PRESENTATION = Presentation(
+    # Live Statistics
+    z_score_value='--',
+    z_score_style='color: #95a5a6;',
+    correlation_value='--',
+    hedge_ratio_value='--',
+    spread_value='--',
+    total_pnl_value='$0.00',
+    total_pnl_style='color: #95a5a6;',
+    signal_value='HOLD',
+    signal_style='background-color: #7f8c8d; color: white; padding: 5px; border-radius: 3px; font-weight: bold;',
+
+    # Model Metrics
+    entry_threshold_value='2.0',
+    exit_threshold_value='0.5',
+    window_size_value='200',
+    spread_mean_value='--',
+    spread_std_value='--',
+    mean_drift_value='--',
+    mean_drift_style='color: #95a5a6;',
+    max_z_score_value='--',
+    min_z_score_value='--',
+    max_mean_value='--',
+    min_mean_value='--',
+    last_update_value='--',
+    status_value='⚫ Stopped',
+    status_style='color: #7f8c8d; font-weight: bold;',
+    last_z_score_entries_value='--',
+    next_z_score_entries_value='--',
+    scalp_interval_value='0.5',
+    volume_multiplier_value='1.0',
+
+    # Account Status
+    balance_value='$0.00',
+    equity_value='$0.00',
+    unrealized_pnl_value='$0.00',
+    unrealized_pnl_style='color: #95a5a6;',
+    used_margin_value='$0.00',
+    free_margin_value='$0.00',
+    margin_level_value='0.0%',
+
+    # Position Overview
+    open_spread_value='0',
+    open_close_value='0 / 0',
+
+    # Hedge Metrics
+    hedge_quality_value='100.0% ✓',
+    hedge_quality_style='color: #27ae60; font-weight: bold;',
+    imbalance_value='Balanced ✓',
+    imbalance_style='color: #27ae60;',
+    primary_lots_value='+0.0000',
+    secondary_lots_value='+0.0000',
+
+    # Risk Monitoring
+    setup_risk_pct_value='0%',
+    setup_risk_amount_value='$0.00',
+    risk_unrealized_value='$0.00',
+    risk_unrealized_style='color: #95a5a6;',
+    daily_risk_pct_value='0%',
+    daily_risk_limit_value='$0.00',
+    daily_total_pnl_value='$0.00',
+    daily_total_pnl_style='color: #95a5a6;',
+    daily_risk_pct_used_value='0.0%',
+
+    # Trading Lock Status
+    trading_status_value='UNLOCK',
+    trading_status_style='color: #27ae60; font-weight: bold;',
+    block_time_value='--',
+    unlock_time_value='--',
+)
+
+
+def _compute_risk_metrics(balance: float, setup_risk_pct: float, daily_limit_pct: float,
+                          daily_pnl: float, hedge_imbalance_pct: float) -> tuple[float, float, float, float]:
+    """
+    Derive the risk and hedge figures shown on the dashboard.
+
+    Returns:
+        Tuple of (setup_risk_amount, daily_risk_amount, daily_risk_pct_used, hedge_quality_pct)
+    """
+    if balance > 0:
+        setup_risk_amount = balance * (setup_risk_pct / 100.0)
+        daily_risk_amount = balance * (daily_limit_pct / 100.0)
+    else:
+        setup_risk_amount = 0.0
+        daily_risk_amount = 0.0
+
+    # Share of the daily risk budget consumed by today's P&L
+    daily_risk_pct_used = (abs(daily_pnl) / daily_risk_amount * 100.0) if daily_risk_amount > 0 else 0.0
+
+    # Hedge Quality = 100% - abs(imbalance%)
+    hedge_quality_pct = 100.0 - (abs(hedge_imbalance_pct) * 100.0) if hedge_imbalance_pct != 0 else 100.0
+
+    return setup_risk_amount, daily_risk_amount, daily_risk_pct_used, hedge_quality_pct
+
 
 class GUIDataPresenter:
     """
@@ -35,181 +317,173 @@ class GUIDataPresenter:
 
     def __init__(self):
         """Initialize presenter with default state"""
-        self.last_status = {}
+        self.last_status = DEFAULT_STATUS
         # Path to spread states JSON file (unified state)
         self.state_file = Path(__file__).parent.parent / 'asset' / 'state' / 'spread_states.json'
-
-    def present_status(self, raw_status: Dict[str, Any]) -> Dict[str, Any]:
+        # (st_mtime_ns, parsed state) of the last state file read
+        self._state_cache = (None, None)
+        # (epoch second, "%H:%M:%S" text) of the last timestamp formatted
+        self._ts_cache = (0, "")
+        # Style key -> (raw value, style) from the previous refresh, see _style_on_change
+        self._cached_styles = {}
+
+    def present_status(self, raw_status: Optional[SystemStatus]) -> Presentation:
         """
         Transform raw backend status into GUI-ready presentation data.
 
         Args:
-            raw_status: Raw status dict from TradingSystemThread with *_value fields
+            raw_status: SystemStatus from TradingSystemThread with *_value fields
 
         Returns:
-            Dict with formatted display values ready for GUI labels
+            Presentation with formatted display values ready for GUI labels
         """
-        if not raw_status:
+        if raw_status is None:
             return self._get_default_presentation()
 
         # Store for reference
         self.last_status = raw_status
 
-        # Build presentation data
-        presentation = {}
-
-        # ========== LIVE STATISTICS ==========
-        presentation['z_score_value'] = self._format_zscore(raw_status.get('zscore_value', 0.0))
-        presentation['z_score_style'] = self._get_zscore_style(raw_status.get('zscore_value', 0.0))
-
-        presentation['correlation_value'] = self._format_correlation(raw_status.get('correlation_value', 0.0))
-        presentation['hedge_ratio_value'] = self._format_decimal(raw_status.get('hedge_ratio_value', 0.0), 4)
-        presentation['spread_value'] = self._format_decimal(raw_status.get('spread_value', 0.0), 2)
-
-        presentation['total_pnl_value'] = self._format_currency(raw_status.get('total_pnl_value', 0.0))
-        presentation['total_pnl_style'] = self._get_pnl_style(raw_status.get('total_pnl_value', 0.0))
-
-        presentation['signal_value'] = raw_status.get('signal_value', 'HOLD')
-        presentation['signal_style'] = self._get_signal_style(raw_status.get('signal_value', 'HOLD'))
-
-        # ========== MODEL METRICS ==========
-        presentation['entry_threshold_value'] = self._format_decimal(raw_status.get('entry_threshold_value', 2.0), 1)
-        presentation['exit_threshold_value'] = self._format_decimal(raw_status.get('exit_threshold_value', 0.5), 1)
-        presentation['window_size_value'] = str(int(raw_status.get('window_size_value', 200)))
-
-        presentation['spread_mean_value'] = self._format_decimal(raw_status.get('spread_mean_value', 0.0), 2)
-        presentation['spread_std_value'] = self._format_decimal(raw_status.get('spread_std_value', 0.0), 2)
-
-        # Calculate mean drift (read first_entry_spread_mean from state file)
-        first_entry_mean = self._read_first_entry_spread_mean()
-        presentation['mean_drift_value'] = self._calculate_mean_drift(
-            current_mean=raw_status.get('spread_mean_value', 0.0),
+        # Fields used more than once, looked up once
+        r = raw_status
+        zscore = r.zscore_value
+        total_pnl = r.total_pnl_value
+        signal = r.signal_value
+        spread_mean = r.spread_mean_value
+        is_running = r.is_running
+        balance = r.balance_value
+        unrealized = r.unrealized_pnl_value
+        open_positions = r.open_positions_value
+
+        # Entry tracking values from the state file (read once per refresh)
+        first_entry_mean, last_z, next_z = self._read_spread_state_snapshot()
+
+        # Calculate mean drift from first_entry_spread_mean
+        drift_text, drift = self._calculate_mean_drift(
+            current_mean=spread_mean,
             entry_mean=first_entry_mean
         )
-        presentation['mean_drift_style'] = self._get_drift_style(presentation['mean_drift_value'])
-
-        presentation['max_z_score_value'] = self._format_zscore(raw_status.get('max_zscore_value', 0.0))
-        presentation['min_z_score_value'] = self._format_zscore(raw_status.get('min_zscore_value', 0.0))
-
-        presentation['max_mean_value'] = self._format_decimal(raw_status.get('max_mean_value', 0.0), 2)
-        presentation['min_mean_value'] = self._format_decimal(raw_status.get('min_mean_value', 0.0), 2)
-
-        # Last update timestamp
-        presentation['last_update_value'] = datetime.now().strftime("%H:%M:%S")
-
-        # Status indicator
-        presentation['status_value'] = self._get_status_text(raw_status.get('is_running', False))
-        presentation['status_style'] = self._get_status_style(raw_status.get('is_running', False))
-
-        # Entry tracking metrics (read from JSON file)
-        scale_interval = raw_status.get('scale_interval_value', 0.5)
-        last_z, next_z = self._read_entry_tracking(scale_interval)
-
-        presentation['last_z_score_entries_value'] = self._format_zscore(last_z) if last_z is not None else "--"
-        presentation['next_z_score_entries_value'] = self._format_zscore(next_z) if next_z is not None else "--"
-
-        # Pyramiding parameters
-        presentation['scalp_interval_value'] = self._format_decimal(
-            raw_status.get('scale_interval_value', 0.5), 1
-        )
-        presentation['volume_multiplier_value'] = self._format_decimal(
-            raw_status.get('volume_multiplier_value', 1.0), 2
-        )
-
-        # ========== ACCOUNT STATUS ==========
-        presentation['balance_value'] = self._format_currency(raw_status.get('balance_value', 0.0))
-        presentation['equity_value'] = self._format_currency(raw_status.get('equity_value', 0.0))
-
-        presentation['unrealized_pnl_value'] = self._format_currency(raw_status.get('unrealized_pnl_value', 0.0))
-        presentation['unrealized_pnl_style'] = self._get_pnl_style(raw_status.get('unrealized_pnl_value', 0.0))
-
-        presentation['used_margin_value'] = self._format_currency(raw_status.get('used_margin_value', 0.0))
-        presentation['free_margin_value'] = self._format_currency(raw_status.get('free_margin_value', 0.0))
-        presentation['margin_level_value'] = self._format_percentage(raw_status.get('margin_level_value', 0.0), 1)
-
-        # ========== POSITION OVERVIEW ==========
-        presentation['open_spread_value'] = str(int(raw_status.get('open_positions_value', 0)))
-        presentation['open_close_value'] = f"{raw_status.get('open_positions_value', 0)} / {raw_status.get('closed_positions_value', 0)}"
 
         # ========== HEDGE METRICS ==========
         # Get hedge metrics from MT5
-        hedge_imbalance = raw_status.get('hedge_imbalance_value', 0.0)
-        hedge_imbalance_pct = raw_status.get('hedge_imbalance_pct_value', 0.0)
-        primary_lots = raw_status.get('primary_lots_value', 0.0)
-        secondary_lots = raw_status.get('secondary_lots_value', 0.0)
-
-        # Hedge Quality = 100% - abs(imbalance%)
-        hedge_quality_pct = 100.0 - (abs(hedge_imbalance_pct) * 100.0) if hedge_imbalance_pct != 0 else 100.0
+        hedge_imbalance = r.hedge_imbalance_value
+        hedge_imbalance_pct = r.hedge_imbalance_pct_value
+        primary_lots = r.primary_lots_value
+        secondary_lots = r.secondary_lots_value
+
+        setup_risk_pct = r.setup_risk_pct_value
+        daily_limit_pct = r.daily_limit_pct_value
+        daily_pnl = r.daily_total_pnl_value
+        setup_risk_amount, daily_risk_amount, daily_risk_pct_used, hedge_quality_pct = _compute_risk_metrics(
+            balance, setup_risk_pct, daily_limit_pct, daily_pnl, hedge_imbalance_pct
+        )
 
         # Format hedge quality with emoji indicator
         if hedge_quality_pct >= 98:
-            presentation['hedge_quality_value'] = f"{hedge_quality_pct:.1f}% ✓"
-            presentation['hedge_quality_style'] = "color: #27ae60; font-weight: bold;"
+            hedge_quality_mark, hedge_quality_style = _HQ_OK
         elif hedge_quality_pct >= 95:
-            presentation['hedge_quality_value'] = f"{hedge_quality_pct:.1f}% ⚠"
-            presentation['hedge_quality_style'] = "color: #f39c12; font-weight: bold;"
+            hedge_quality_mark, hedge_quality_style = _HQ_WARN
         else:
-            presentation['hedge_quality_value'] = f"{hedge_quality_pct:.1f}% ✗"
-            presentation['hedge_quality_style'] = "color: #e74c3c; font-weight: bold;"
+            hedge_quality_mark, hedge_quality_style = _HQ_BAD
+        hedge_quality_text = f"{hedge_quality_pct:.1f}% {hedge_quality_mark}"
 
         # Format imbalance text
-        if abs(hedge_imbalance) < 0.01:
-            presentation['imbalance_value'] = "Balanced ✓"
-            presentation['imbalance_style'] = "color: #27ae60;"
+        if -0.01 < hedge_imbalance < 0.01:
+            imbalance_text = "Balanced ✓"
+            imbalance_style = _STYLE_GREEN
         elif hedge_imbalance > 0:
-            presentation['imbalance_value'] = f"+{hedge_imbalance:.4f} lots (Primary)"
-            presentation['imbalance_style'] = "color: #f39c12;" if abs(hedge_imbalance_pct) < 0.05 else "color: #e74c3c;"
+            imbalance_text = _LOTS_PRIMARY_FMT(hedge_imbalance)
+            imbalance_style = _STYLE_ORANGE if -0.05 < hedge_imbalance_pct < 0.05 else _STYLE_RED
         else:
-            presentation['imbalance_value'] = f"{hedge_imbalance:.4f} lots (Secondary)"
-            presentation['imbalance_style'] = "color: #f39c12;" if abs(hedge_imbalance_pct) < 0.05 else "color: #e74c3c;"
-
-        # Format lots with absolute values (no +/- sign for Total Lots display)
-        presentation['primary_lots_value'] = f"{abs(primary_lots):.4f}"
-        presentation['secondary_lots_value'] = f"{abs(secondary_lots):.4f}"
-
-        # ========== RISK MONITORING ==========
-        # Setup risk (per trade)
-        setup_risk_pct = raw_status.get('setup_risk_pct_value', 0.0)
-        presentation['setup_risk_pct_value'] = self._format_percentage(setup_risk_pct, 2)
-
-        balance = raw_status.get('balance_value', 0.0)
-        setup_risk_amount = balance * (setup_risk_pct / 100.0) if balance > 0 else 0.0
-        presentation['setup_risk_amount_value'] = self._format_currency(setup_risk_amount)
-
-        # Risk unrealized (current unrealized P&L for risk monitoring)
-        risk_unrealized = raw_status.get('unrealized_pnl_value', 0.0)
-        presentation['risk_unrealized_value'] = self._format_currency(risk_unrealized)
-        presentation['risk_unrealized_style'] = self._get_pnl_style(risk_unrealized)
-
-        # Daily risk limit
-        daily_limit_pct = raw_status.get('daily_limit_pct_value', 5.0)
-        daily_risk_amount = balance * (daily_limit_pct / 100.0) if balance > 0 else 0.0
-        presentation['daily_risk_pct_value'] = self._format_percentage(daily_limit_pct, 2)
-        presentation['daily_risk_limit_value'] = self._format_currency(daily_risk_amount)
-
-        # Daily total P&L
-        daily_pnl = raw_status.get('daily_total_pnl_value', 0.0)
-        presentation['daily_total_pnl_value'] = self._format_currency(daily_pnl)
-        presentation['daily_total_pnl_style'] = self._get_pnl_style(daily_pnl)
-
-        # Daily risk percentage used
-        daily_risk_pct_used = (abs(daily_pnl) / daily_risk_amount * 100.0) if daily_risk_amount > 0 else 0.0
-        presentation['daily_risk_pct_used_value'] = self._format_percentage(daily_risk_pct_used, 1)
+            imbalance_text = _LOTS_SECONDARY_FMT(hedge_imbalance)
+            imbalance_style = _STYLE_ORANGE if -0.05 < hedge_imbalance_pct < 0.05 else _STYLE_RED
 
         # ========== TRADING LOCK STATUS ==========
-        is_locked = raw_status.get('trading_locked_value', False)
-        presentation['trading_status_value'] = "LOCK" if is_locked else "UNLOCK"
-        presentation['trading_status_style'] = self._get_lock_style(is_locked)
-
-        # Lock timestamps
+        is_locked = r.trading_locked_value
         if is_locked:
-            locked_at = raw_status.get('lock_time_value')
-            locked_until = raw_status.get('unlock_time_value')
-            presentation['block_time_value'] = locked_at.strftime("%H:%M") if locked_at else "--"
-            presentation['unlock_time_value'] = locked_until.strftime("%H:%M") if locked_until else "--"
+            locked_at = r.lock_time_value
+            locked_until = r.unlock_time_value
+            block_time = locked_at.strftime("%H:%M") if locked_at else "--"
+            unlock_time = locked_until.strftime("%H:%M") if locked_until else "--"
         else:
-            presentation['block_time_value'] = "--"
-            presentation['unlock_time_value'] = "--"
+            block_time = "--"
+            unlock_time = "--"
+
+        # Styles only change when their raw value does
+        style = self._style_on_change
+        unrealized_style = style('unrealized_pnl_style', unrealized, self._get_pnl_style)
+
+        # Build presentation data in one call
+        presentation = Presentation(
+            # ========== LIVE STATISTICS ==========
+            z_score_value=self._format_zscore(zscore),
+            z_score_style=style('z_score_style', zscore, self._get_zscore_style),
+            correlation_value=self._format_correlation(r.correlation_value),
+            hedge_ratio_value=_fmt4(r.hedge_ratio_value),
+            spread_value=_fmt2(r.spread_value),
+            total_pnl_value=self._format_currency(total_pnl),
+            total_pnl_style=style('total_pnl_style', total_pnl, self._get_pnl_style),
+            signal_value=signal,
+            signal_style=style('signal_style', signal, self._get_signal_style),
+
+            # ========== MODEL METRICS ==========
+            entry_threshold_value=_fmt1(r.entry_threshold_value),
+            exit_threshold_value=_fmt1(r.exit_threshold_value),
+            window_size_value=str(int(r.window_size_value)),
+            spread_mean_value=_fmt2(spread_mean),
+            spread_std_value=_fmt2(r.spread_std_value),
+            mean_drift_value=drift_text,
+            mean_drift_style=self._get_drift_style(drift),
+            max_z_score_value=self._format_zscore(r.max_zscore_value),
+            min_z_score_value=self._format_zscore(r.min_zscore_value),
+            max_mean_value=_fmt2(r.max_mean_value),
+            min_mean_value=_fmt2(r.min_mean_value),
+            last_update_value=self._now_hms(),
+            status_value=self._get_status_text(is_running),
+            status_style=style('status_style', is_running, self._get_status_style),
+            last_z_score_entries_value=self._format_zscore(last_z) if last_z is not None else "--",
+            next_z_score_entries_value=self._format_zscore(next_z) if next_z is not None else "--",
+            scalp_interval_value=_fmt1(r.scale_interval_value),
+            volume_multiplier_value=_fmt2(r.volume_multiplier_value),
+
+            # ========== ACCOUNT STATUS ==========
+            balance_value=self._format_currency(balance),
+            equity_value=self._format_currency(r.equity_value),
+            unrealized_pnl_value=self._format_currency(unrealized),
+            unrealized_pnl_style=unrealized_style,
+            used_margin_value=self._format_currency(r.used_margin_value),
+            free_margin_value=self._format_currency(r.free_margin_value),
+            margin_level_value=_fmt_pct1(r.margin_level_value),
+
+            # ========== POSITION OVERVIEW ==========
+            open_spread_value=str(int(open_positions)),
+            open_close_value=_OPEN_CLOSE_FMT(open_positions, r.closed_positions_value),
+
+            # ========== HEDGE METRICS ==========
+            hedge_quality_value=hedge_quality_text,
+            hedge_quality_style=hedge_quality_style,
+            imbalance_value=imbalance_text,
+            imbalance_style=imbalance_style,
+            # Lots shown as absolute values (no +/- sign for Total Lots display)
+            primary_lots_value=f"{abs(primary_lots):.4f}",
+            secondary_lots_value=f"{abs(secondary_lots):.4f}",
+
+            # ========== RISK MONITORING ==========
+            setup_risk_pct_value=_fmt_pct2(setup_risk_pct),
+            setup_risk_amount_value=self._format_currency(setup_risk_amount),
+            risk_unrealized_value=self._format_currency(unrealized),
+            risk_unrealized_style=unrealized_style,
+            daily_risk_pct_value=_fmt_pct2(daily_limit_pct),
+            daily_risk_limit_value=self._format_currency(daily_risk_amount),
+            daily_total_pnl_value=self._format_currency(daily_pnl),
+            daily_total_pnl_style=style('daily_total_pnl_style', daily_pnl, self._get_pnl_style),
+            daily_risk_pct_used_value=_fmt_pct1(daily_risk_pct_used),
+
+            # ========== TRADING LOCK STATUS ==========
+            trading_status_value="LOCK" if is_locked else "UNLOCK",
+            trading_status_style=style('trading_status_style', is_locked, self._get_lock_style),
+            block_time_value=block_time,
+            unlock_time_value=unlock_time,
+        )
 
         return presentation
 
@@ -227,83 +501,82 @@ class GUIDataPresenter:
             return "--"
         return f"{value:.3f}"
 
-    def _format_decimal(self, value: float, decimals: int) -> str:
-        """Format decimal number"""
-        if value == 0.0:
-            return "--"
-        return f"{value:.{decimals}f}"
-
     def _format_currency(self, value: float) -> str:
         """Format currency with $ sign and commas"""
         return f"${value:,.2f}"
 
-    def _format_percentage(self, value: float, decimals: int) -> str:
-        """Format percentage"""
-        return f"{value:.{decimals}f}%"
+    def _now_hms(self) -> str:
+        """Current local time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
 
     # ========== CALCULATION METHODS ==========
 
-    def _calculate_mean_drift(self, current_mean: float, entry_mean: Optional[float]) -> str:
-        """Calculate mean drift from entry point"""
+    def _calculate_mean_drift(self, current_mean: float,
+                              entry_mean: Optional[float]) -> tuple[str, Optional[float]]:
+        """Calculate mean drift from entry point, returned as (display text, drift)"""
         if entry_mean is None or entry_mean == 0.0:
-            return "--"
+            return "--", None
 
         drift = current_mean - entry_mean
         drift_pct = (drift / entry_mean) * 100.0
-        return f"{drift:+.2f} ({drift_pct:+.1f}%)"
+        return f"{drift:+.2f} ({drift_pct:+.1f}%)", drift
 
     # ========== STYLING METHODS ==========
 
+    def _style_on_change(self, key: str, value: Any, style_fn) -> str:
+        """Return style_fn(value), reusing the previous result for key while value is unchanged"""
+        cached = self._cached_styles.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        style = style_fn(value)
+        self._cached_styles[key] = (value, style)
+        return style
+
     def _get_zscore_style(self, zscore: float) -> str:
         """Get color style for z-score"""
-        if abs(zscore) >= 2.0:
-            return "color: #e74c3c; font-weight: bold;"  # Red for extreme
-        elif abs(zscore) >= 1.0:
-            return "color: #f39c12; font-weight: bold;"  # Orange for moderate
+        if zscore >= 2.0 or zscore <= -2.0:
+            return _STYLE_RED_BOLD  # Red for extreme
+        elif zscore >= 1.0 or zscore <= -1.0:
+            return _STYLE_ORANGE_BOLD  # Orange for moderate
         else:
-            return "color: #95a5a6;"  # Gray for normal
+            return _STYLE_GRAY  # Gray for normal
 
     def _get_pnl_style(self, pnl: float) -> str:
         """Get color style for P&L values"""
         if pnl > 0:
-            return "color: #27ae60; font-weight: bold;"  # Green for profit
+            return _STYLE_GREEN_BOLD  # Green for profit
         elif pnl < 0:
-            return "color: #e74c3c; font-weight: bold;"  # Red for loss
+            return _STYLE_RED_BOLD  # Red for loss
         else:
-            return "color: #95a5a6;"  # Gray for zero
+            return _STYLE_GRAY  # Gray for zero
 
     def _get_signal_style(self, signal: str) -> str:
         """Get background style for signal"""
-        signal_styles = {
-            'HOLD': "background-color: #7f8c8d; color: white; padding: 2px; border-radius: 2px; font-weight: bold;",
-            'LONG SPREAD': "background-color: #27ae60; color: white; padding: 2px; border-radius: 2px; font-weight: bold;",
-            'SHORT SPREAD': "background-color: #e74c3c; color: white; padding: 2px; border-radius: 2px; font-weight: bold;"
-        }
-        return signal_styles.get(signal, signal_styles['HOLD'])
-
-    def _get_drift_style(self, drift_str: str) -> str:
-        """Get style for mean drift indicator"""
-        if drift_str == "--":
-            return "color: #95a5a6;"
+        return _SIGNAL_STYLES.get(signal, _SIGNAL_STYLES['HOLD'])
 
-        # Extract drift value (first number before parenthesis)
-        try:
-            drift_val = float(drift_str.split('(')[0].strip())
-            if abs(drift_val) > 1.0:
-                return "color: #e74c3c; font-weight: bold;"  # Red for large drift
-            elif abs(drift_val) > 0.5:
-                return "color: #f39c12; font-weight: bold;"  # Orange for moderate
-            else:
-                return "color: #27ae60;"  # Green for small drift
-        except:
-            return "color: #95a5a6;"
+    def _get_drift_style(self, drift: Optional[float]) -> str:
+        """Get style for mean drift indicator"""
+        if drift is None:
+            return _STYLE_GRAY
+
+        # Judge the drift as displayed (2 decimals)
+        drift = round(drift, 2)
+        if drift > 1.0 or drift < -1.0:
+            return _STYLE_RED_BOLD  # Red for large drift
+        elif drift > 0.5 or drift < -0.5:
+            return _STYLE_ORANGE_BOLD  # Orange for moderate
+        else:
+            return _STYLE_GREEN  # Green for small drift
 
     def _get_status_style(self, is_running: bool) -> str:
         """Get style for status indicator"""
         if is_running:
-            return "color: #27ae60; font-weight: bold;"  # Green running
+            return _STYLE_GREEN_BOLD  # Green running
         else:
-            return "color: #7f8c8d; font-weight: bold;"  # Gray stopped
+            return _STYLE_GRAY_BOLD  # Gray stopped
 
     def _get_status_text(self, is_running: bool) -> str:
         """Get status text"""
@@ -312,154 +585,74 @@ class GUIDataPresenter:
     def _get_lock_style(self, is_locked: bool) -> str:
         """Get style for trading lock status"""
         if is_locked:
-            return "color: #e74c3c; font-weight: bold;"  # Red for locked
+            return _STYLE_RED_BOLD  # Red for locked
         else:
-            return "color: #27ae60; font-weight: bold;"  # Green for unlocked
+            return _STYLE_GREEN_BOLD  # Green for unlocked
 
-    def _read_entry_tracking(self, scale_interval: float) -> tuple[Optional[float], Optional[float]]:
+    def _load_state_cached(self) -> Optional[Dict[str, Any]]:
         """
-        Read entry tracking data from spread_states.json.
-
-        Args:
-            scale_interval: Scale interval (not used - values already in state file)
+        Return the parsed spread_states.json, re-reading it only when its mtime changes.
 
         Returns:
-            Tuple of (last_entry_zscore, next_entry_zscore)
-            Returns (None, None) if file doesn't exist or has no valid data
+            Parsed state dict, or None if the file doesn't exist
         """
+        cached_mtime_ns, cached_state = self._state_cache
         try:
-            if not self.state_file.exists():
-                return None, None
-
-            with open(self.state_file, 'r') as f:
-                state_data = json.load(f)
-
-            spreads = state_data.get('spreads', {})
-            if not spreads:
-                return None, None
-
-            # Get the first spread state (usually only one active)
-            spread_state = None
-            for spread_id, state in spreads.items():
-                spread_state = state
-                break
-
-            if not spread_state:
-                return None, None
-
-            last_entry_z = spread_state.get('last_z_entry')
-            next_entry_z = spread_state.get('next_z_entry')
-
-            if last_entry_z is None:
-                return None, None
-
-            return last_entry_z, next_entry_z
+            mtime_ns = self.state_file.stat().st_mtime_ns
+            if mtime_ns != cached_mtime_ns:
+                cached_state = _json_loads(self.state_file.read_bytes())
+                self._state_cache = (mtime_ns, cached_state)
+        except FileNotFoundError:
+            # Missing, or removed between stat and read
+            self._state_cache = (None, None)
+            return None
 
-        except Exception as e:
-            logger.error(f"Error reading spread state data: {e}", exc_info=True)
-            return None, None
+        return cached_state
 
-    def _read_first_entry_spread_mean(self) -> Optional[float]:
+    def _read_spread_state_snapshot(self) -> tuple[Optional[float], Optional[float], Optional[float]]:
         """
-        Read first_entry_spread_mean from spread_states.json.
+        Read entry tracking data from spread_states.json in one pass.
 
-        This value is stored when the first entry is made and used to calculate
-        mean drift (how much the spread mean has changed since entry).
+        first_entry_spread_mean is stored when the first entry is made and used to
+        calculate mean drift (how much the spread mean has changed since entry).
 
         Returns:
-            first_entry_spread_mean if exists and valid, None otherwise
+            Tuple of (first_entry_spread_mean, last_entry_zscore, next_entry_zscore).
+            first_entry_spread_mean is None unless a spread has a positive value;
+            the z-scores come from the first spread and are (None, None) if it has
+            no last entry.
         """
         try:
-            if not self.state_file.exists():
-                return None
-
-            with open(self.state_file, 'r') as f:
-                state_data = json.load(f)
+            state_data = self._load_state_cached()
+            if state_data is None:
+                return None, None, None
 
             spreads = state_data.get('spreads', {})
             if not spreads:
-                return None
+                return None, None, None
+
+            first_mean = None
+            for state in spreads.values():
+                value = state.get('first_entry_spread_mean')
+                if value is not None and value > 0:
+                    first_mean = value
+                    break
 
             # Get the first spread state (usually only one active)
-            for spread_id, state in spreads.items():
-                first_mean = state.get('first_entry_spread_mean')
-                if first_mean is not None and first_mean > 0:
-                    return first_mean
+            spread_state = next(iter(spreads.values()), None)
+            if not spread_state:
+                return first_mean, None, None
 
-            return None
+            last_entry_z = spread_state.get('last_z_entry')
+            if last_entry_z is None:
+                return first_mean, None, None
+
+            return first_mean, last_entry_z, spread_state.get('next_z_entry')
 
         except Exception as e:
-            logger.error(f"Error reading first_entry_spread_mean: {e}", exc_info=True)
-            return None
+            logger.error(f"Error reading spread state data: {e}", exc_info=True)
+            return None, None, None
 
-    def _get_default_presentation(self) -> Dict[str, Any]:
+    def _get_default_presentation(self) -> Presentation:
         """Return default presentation when no data available"""
-        return {
-            # Live Statistics
-            'z_score_value': '--',
-            'z_score_style': 'color: #95a5a6;',
-            'correlation_value': '--',
-            'hedge_ratio_value': '--',
-            'spread_value': '--',
-            'total_pnl_value': '$0.00',
-            'total_pnl_style': 'color: #95a5a6;',
-            'signal_value': 'HOLD',
-            'signal_style': 'background-color: #7f8c8d; color: white; padding: 5px; border-radius: 3px; font-weight: bold;',
-
-            # Model Metrics
-            'entry_threshold_value': '2.0',
-            'exit_threshold_value': '0.5',
-            'window_size_value': '200',
-            'spread_mean_value': '--',
-            'spread_std_value': '--',
-            'mean_drift_value': '--',
-            'mean_drift_style': 'color: #95a5a6;',
-            'max_z_score_value': '--',
-            'min_z_score_value': '--',
-            'max_mean_value': '--',
-            'min_mean_value': '--',
-            'last_update_value': '--',
-            'status_value': '⚫ Stopped',
-            'status_style': 'color: #7f8c8d; font-weight: bold;',
-            'last_z_score_entries_value': '--',
-            'next_z_score_entries_value': '--',
-            'scalp_interval_value': '0.5',
-            'volume_multiplier_value': '1.0',
-
-            # Account Status
-            'balance_value': '$0.00',
-            'equity_value': '$0.00',
-            'unrealized_pnl_value': '$0.00',
-            'unrealized_pnl_style': 'color: #95a5a6;',
-            'used_margin_value': '$0.00',
-            'free_margin_value': '$0.00',
-            'margin_level_value': '0.0%',
-
-            # Position Overview
-            'open_spread_value': '0',
-            'open_close_value': '0 / 0',
-
-            # Hedge Metrics
-            'hedge_quality_value': '100.0% ✓',
-            'hedge_quality_style': 'color: #27ae60; font-weight: bold;',
-            'imbalance_value': 'Balanced ✓',
-            'imbalance_style': 'color: #27ae60;',
-            'primary_lots_value': '+0.0000',
-            'secondary_lots_value': '+0.0000',
-
-            # Risk Monitoring
-            'setup_risk_pct_value': '0%',
-            'setup_risk_amount_value': '$0.00',
-            'risk_unrealized_value': '$0.00',
-            'risk_unrealized_style': 'color: #95a5a6;',
-            'daily_risk_limit_value': '$0.00',
-            'daily_total_pnl_value': '$0.00',
-            'daily_total_pnl_style': 'color: #95a5a6;',
-            'daily_risk_pct_used_value': '0.0%',
-
-            # Trading Lock Status
-            'trading_status_value': 'UNLOCK',
-            'trading_status_style': 'color: #27ae60; font-weight: bold;',
-            'block_time_value': '--',
-            'unlock_time_value': '--',
-        }
+        return _DEFAULT_PRESENTATION
@@ -4,7 +4,10 @@ Refactored to use separate display and settings panels
 """
 
 import sys
+import time
+import traceback
 from pathlib import Path
+from typing import Any, NamedTuple, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -14,9 +17,10 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QMessageBox, QStatusBar
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QObject, QRunnable, QThreadPool, QSignalBlocker
+)
 from PyQt6.QtGui import QFont
-from datetime import datetime
 import logging
 
 # Import theme
@@ -29,49 +33,135 @@ from config.trading_settings import TradingSettingsManager, SymbolLoader
 from gui.settings_panel import SettingsPanel
 from gui.display_panel import DisplayPanel
 
-# Import pair discovery tab
-from gui.pair_discovery_tab import PairDiscoveryTab
-
 # Import risk alert handler
 from gui.risk_alert_handler import RiskAlertHandler
 
-# Import trading system
-from core.trading_system import TradingSystem
+# Import throttle helper
+from gui.throttle import qthrottled
 
 logger = logging.getLogger(__name__)
 
+# Start/stop button styles (shared so Qt reuses the parsed sheet)
+STYLE_START_BTN = """
+    QPushButton {
+        background-color: #27ae60;
+        color: white;
+        font-weight: bold;
+        padding: 15px;
+        border-radius: 4px;
+        min-width: 180px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #2ecc71;
+    }
+"""
 
-class StopThread(QThread):
-    """Thread to stop trading system without blocking GUI"""
+STYLE_STOP_BTN = """
+    QPushButton {
+        background-color: #e74c3c;
+        color: white;
+        font-weight: bold;
+        padding: 15px;
+        border-radius: 4px;
+        min-width: 180px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #c0392b;
+    }
+"""
+
+
+class Snapshot(NamedTuple):
+    """One trading-loop tick as shown by the GUI (chart and dashboard)"""
+
+    timestamp: Any
+    zscore: float
+    correlation: float
+    hedge_ratio: float
+    spread: float
+    spread_mean: float
+    spread_std: float
+    window_size: int
+    signal: str = 'HOLD'
+    entry_threshold: float = 2.0
+    exit_threshold: float = 0.5
+    total_pnl: float = 0.0
+    max_z_score: Optional[float] = None
+    min_z_score: Optional[float] = None
+    max_mean: Optional[float] = None
+    min_mean: Optional[float] = None
+
+    @classmethod
+    def from_market(cls, market, signal, entry_threshold, exit_threshold, total_pnl=0.0, stats=(None,) * 4):
+        """Build from a MarketSnapshot plus the current signal context, P&L and session stats"""
+        max_z_score, min_z_score, max_mean, min_mean = stats
+        return cls(
+            timestamp=market.timestamp,
+            zscore=market.zscore,
+            correlation=market.correlation,
+            hedge_ratio=market.hedge_ratio,
+            spread=market.spread,
+            spread_mean=market.spread_mean,
+            spread_std=market.spread_std,
+            window_size=market.window_size,
+            signal=signal,
+            entry_threshold=entry_threshold,
+            exit_threshold=exit_threshold,
+            total_pnl=total_pnl,
+            max_z_score=max_z_score,
+            min_z_score=min_z_score,
+            max_mean=max_mean,
+            min_mean=min_mean,
+        )
+
+
+class StopSignaler(QObject):
+    """Signals emitted by StopTask (QRunnable cannot carry signals itself)"""
 
-    finished_signal = pyqtSignal(bool)
     log_message = pyqtSignal(str)
 
+
+class StopTask(QRunnable):
+    """Pooled task that sends the (blocking) stop request to the trading system"""
+
     def __init__(self, trading_thread):
         super().__init__()
         self.trading_thread = trading_thread
+        self.signaler = StopSignaler()
 
     def run(self):
-        """Stop trading system in background"""
+        """Stop trading system in background (completion is reported by the thread's finished signal)"""
         try:
-            self.log_message.emit("   Stop signal sent to thread...")
+            self.signaler.log_message.emit("   Stop signal sent to thread...")
             self.trading_thread.stop()
+        except Exception as e:
+            self.signaler.log_message.emit(f"❌ Error stopping: {e}")
+
+
+class AccountInfoSignaler(QObject):
+    """Signals emitted by AccountInfoWorker"""
+
+    result = pyqtSignal(object)
+
 
-            stopped = self.trading_thread.wait(10000)
+class AccountInfoWorker(QRunnable):
+    """Pooled task to fetch MT5 account info without blocking GUI"""
 
-            if not stopped:
-                self.log_message.emit("⚠️  Thread did not stop in 10 seconds, force terminating...")
-                self.trading_thread.terminate()
-                self.trading_thread.wait(2000)
-                self.log_message.emit("   Thread terminated forcefully")
-                self.finished_signal.emit(False)
-            else:
-                self.log_message.emit("   Thread stopped gracefully")
-                self.finished_signal.emit(True)
+    def __init__(self):
+        super().__init__()
+        self.signaler = AccountInfoSignaler()
 
+    def run(self):
+        """Query MT5 in background (emits None on failure)"""
+        account_info = None
+        try:
+            from core.mt5_manager import get_mt5
+            account_info = get_mt5().account_info()
         except Exception as e:
-            self.log_message.emit(f"❌ Error stopping: {e}")
-            self.finished_signal.emit(False)
+            logger.error(f"Failed to load MT5 state: {e}")
+        self.signaler.result.emit(account_info)
 
 
 class TradingSystemThread(QThread):
@@ -81,7 +171,6 @@ class TradingSystemThread(QThread):
     position_update = pyqtSignal(list)
     log_message = pyqtSignal(str)
     snapshot_update = pyqtSignal(object)
-    error_occurred = pyqtSignal(str)
 
     def __init__(self, trading_config: dict, risk_alert_handler=None):
         super().__init__()
@@ -89,6 +178,9 @@ class TradingSystemThread(QThread):
         self.trading_system = None
         self.running = False
         self.risk_alert_handler = risk_alert_handler
+        self._last_seq = 0
+        # Session extremes: (max_z_score, min_z_score, max_mean, min_mean), see _record_stats
+        self._stats = (None, None, None, None)
 
     def run(self):
         """Run the trading system"""
@@ -97,6 +189,9 @@ class TradingSystemThread(QThread):
         try:
             self.log_message.emit("🔧 Initializing Trading System...")
 
+            # Imported here so the window can show before the trading stack loads
+            from core.trading_system import TradingSystem
+
             # Create trading system instance
             self.trading_system = TradingSystem(
                 symbol_primary=self.trading_config['primary_symbol'],
@@ -108,6 +203,9 @@ class TradingSystemThread(QThread):
             if self.risk_alert_handler:
                 self.trading_system.risk_manager.alert_callback = self.risk_alert_handler.handle_alert
 
+            # Push snapshots to the GUI as the data thread produces them
+            self.trading_system.snapshot_callback = self._publish_snapshot
+
             self.log_message.emit("✅ Trading System initialized")
             self.log_message.emit("🔄 Starting main trading loop...")
             self.log_message.emit("")
@@ -116,9 +214,10 @@ class TradingSystemThread(QThread):
             self.trading_system.run()
 
         except Exception as e:
-            logger.exception("Trading system error")
-            self.error_occurred.emit(str(e))
-            self.log_message.emit(f"❌ Trading system error: {e}")
+            # Format once here and send the GUI a single message
+            message = f"❌ Trading system error: {e}\n{traceback.format_exc()}"
+            logger.error(message)
+            self.log_message.emit(message)
 
         finally:
             self.running = False
@@ -127,6 +226,38 @@ class TradingSystemThread(QThread):
             self.log_message.emit("✅ Trading system stopped")
             self.log_message.emit("=" * 70)
 
+    def _publish_snapshot(self, seq, snapshot):
+        """Emit snapshot_update once per new snapshot sequence number"""
+        if seq <= self._last_seq:
+            return
+        self._last_seq = seq
+
+        self._record_stats(snapshot.zscore, snapshot.spread_mean)
+        current_signal = getattr(self.trading_system, 'current_signal', None)
+        settings = self.trading_config['settings']
+        self.snapshot_update.emit(Snapshot.from_market(
+            snapshot,
+            current_signal.signal_type.value if current_signal else 'HOLD',
+            settings.get('entry_threshold', 2.0),
+            settings.get('exit_threshold', 0.5),
+            total_pnl=self.trading_system.position_tracker.get_total_pnl()['total_pnl'],
+            stats=self._stats,
+        ))
+
+    def _record_stats(self, zscore, spread_mean):
+        """Fold one snapshot into the session extremes (max/min z-score keep their sign)"""
+        if spread_mean <= 0:  # Ensure valid snapshot
+            return
+        max_z, min_z, max_mean, min_mean = self._stats
+        if abs(zscore) > 0.01:  # Ignore very small z-scores
+            if max_z is None or abs(zscore) > abs(max_z):
+                max_z = zscore
+            if min_z is None or abs(zscore) < abs(min_z):
+                min_z = zscore
+        max_mean = spread_mean if max_mean is None else max(max_mean, spread_mean)
+        min_mean = spread_mean if min_mean is None else min(min_mean, spread_mean)
+        self._stats = (max_z, min_z, max_mean, min_mean)
+
     def stop(self):
         """Stop the trading system gracefully"""
         self.running = False
@@ -137,6 +268,9 @@ class TradingSystemThread(QThread):
 class PairTradingGUI(QMainWindow):
     """Main GUI Window - Compact Version with Modular Panels"""
 
+    ACCOUNT_INFO_TTL = 1.0  # Seconds a fetched account_info is reused
+    STOP_TIMEOUT_MS = 10000  # Trading thread is terminated if still running after this
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Pair Trading System - Professional Edition")
@@ -147,7 +281,22 @@ class PairTradingGUI(QMainWindow):
 
         # Initialize state
         self.trading_thread = None
-        self.stop_thread = None
+        self.stop_task = None
+        self._stop_timer = QTimer(self)
+        self._stop_timer.setSingleShot(True)
+        self._stop_timer.setInterval(self.STOP_TIMEOUT_MS)
+        self._stop_timer.timeout.connect(self._force_terminate_if_running)
+        self._account_cache = (None, 0.0)  # (account_info, monotonic fetch time)
+        self._account_worker = None
+        # Last update time text, formatted once per second
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        # Values last pushed to the dashboard (unchanged ones are skipped)
+        self._last_live = None
+        self._last_metrics = None
+        self._last_pnl = None
+        # Latest snapshot received while the Dashboard tab was hidden
+        self._hidden_snapshot = None
 
         # Settings and symbol loader
         self.settings_manager = TradingSettingsManager()
@@ -159,10 +308,8 @@ class PairTradingGUI(QMainWindow):
         # Create UI
         self.init_ui()
 
-        # Setup update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)
+        # Coalesce bursts of snapshots into the latest one
+        self._throttled_display = qthrottled(self.update_display, 200, self)
 
         # Load initial state
         self.load_initial_state()
@@ -195,12 +342,14 @@ class PairTradingGUI(QMainWindow):
         self.tabs.addTab(dashboard_tab, "📊 Dashboard")
 
         # ========== CHARTS TAB ==========
-        self.chart_widget = self.display_panel.chart_widget
-        self.tabs.addTab(self.chart_widget, "📈 Charts")
+        # Placeholder until first opened (the matplotlib chart is expensive to build)
+        self.chart_widget = None
+        self._chart_index = self.tabs.addTab(QWidget(), "📈 Charts")
 
         # ========== PAIR DISCOVERY TAB ==========
-        self.discovery_tab = PairDiscoveryTab()
-        self.tabs.addTab(self.discovery_tab, "🔬 Pair Discovery")
+        # Placeholder until first opened (PairDiscoveryTab pulls in the analysis stack)
+        self.discovery_tab = None
+        self._discovery_index = self.tabs.addTab(QWidget(), "🔬 Pair Discovery")
 
         # ========== SETTINGS TAB ==========
         self.tabs.addTab(self.settings_panel, "⚙️ Settings")
@@ -210,15 +359,51 @@ class PairTradingGUI(QMainWindow):
         self.tabs.addTab(self.logs_widget, "📝 Logs")
 
         main_layout.addWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Status bar
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready - Select pair and start trading")
 
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index):
+        """Render updates deferred while a tab was hidden, building lazy tabs on first show"""
+        if index == 0:
+            if self._hidden_snapshot is not None:
+                snapshot, self._hidden_snapshot = self._hidden_snapshot, None
+                self.update_display(snapshot)
+            self.display_panel.replay_pending_updates()
+        elif index == self._chart_index:
+            if self.chart_widget is None:
+                self.chart_widget = self.display_panel.chart_widget
+                self._replace_placeholder(index, self.chart_widget, "📈 Charts")
+                # Catch up with a session that started before the chart existed
+                if self.trading_thread and self.trading_thread.trading_system:
+                    self.chart_widget.load_historical_data(self.trading_thread.trading_system)
+            self.display_panel.refresh_chart()
+        elif index == self._discovery_index and self.discovery_tab is None:
+            self._create_discovery_tab()
+
+    def _create_discovery_tab(self):
+        """Swap the Pair Discovery placeholder for the real tab"""
+        from gui.pair_discovery_tab import PairDiscoveryTab
+
+        self.discovery_tab = PairDiscoveryTab()
+        self._replace_placeholder(self._discovery_index, self.discovery_tab, "🔬 Pair Discovery")
+
+    def _replace_placeholder(self, index, widget, label):
+        """Put widget in place of the placeholder tab at index and keep it current"""
+        with QSignalBlocker(self.tabs):
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
     def create_dashboard_tab(self):
         """Create dashboard tab - combines symbol selection + display panels"""
-        from PyQt6.QtWidgets import QGroupBox, QLineEdit, QPushButton
+        from PyQt6.QtWidgets import QGroupBox, QGridLayout, QLabel, QLineEdit, QPushButton
 
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -249,19 +434,7 @@ class PairTradingGUI(QMainWindow):
 
         # Start/Stop button
         self.start_stop_btn = QPushButton("▶️ Start Trading")
-        self.start_stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 4px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-        """)
+        self.start_stop_btn.setStyleSheet(STYLE_START_BTN)
         self.start_stop_btn.clicked.connect(self.toggle_trading)
         symbol_layout.addWidget(self.start_stop_btn, 1, 2)
 
@@ -269,7 +442,7 @@ class PairTradingGUI(QMainWindow):
         control_layout.addWidget(symbol_group)
 
         # Add live statistics from display panel
-        control_layout.addWidget(self.display_panel.dashboard_widget._create_control_panel().findChildren(QGroupBox)[1])  # Get Live Statistics group
+        control_layout.addWidget(self.display_panel.dashboard_widget.create_live_stats_group())
 
         control_panel.setLayout(control_layout)
         layout.addWidget(control_panel)
@@ -287,8 +460,10 @@ class PairTradingGUI(QMainWindow):
         primary = self.primary_input.text().strip().upper()
         secondary = self.secondary_input.text().strip().upper()
 
-        # Update settings panel too
-        self.settings_panel.set_symbols(primary, secondary)
+        # Update settings panel too (blocked so it doesn't echo symbol_changed back per field)
+        settings_panel = self.settings_panel
+        with QSignalBlocker(settings_panel.primary_input), QSignalBlocker(settings_panel.secondary_input):
+            settings_panel.set_symbols(primary, secondary)
 
         if primary and secondary and primary != secondary:
             self.statusBar.showMessage(f"Ready to trade: {primary}/{secondary}")
@@ -303,16 +478,32 @@ class PairTradingGUI(QMainWindow):
         self.load_current_state_from_mt5()
 
     def load_current_state_from_mt5(self):
-        """Load current state from MT5"""
-        try:
-            from core.mt5_manager import get_mt5
-            mt5 = get_mt5()
+        """Load current state from MT5 (fetched in background, cached briefly)"""
+        account_info, fetched_at = self._account_cache
+        if account_info is not None and time.monotonic() - fetched_at < self.ACCOUNT_INFO_TTL:
+            self._apply_account_info(account_info)
+            return
+
+        if self._account_worker is not None:
+            return  # A fetch is already in flight
 
-            account_info = mt5.account_info()
-            if account_info is None:
-                logger.warning("Could not get MT5 account info")
-                return
+        self._account_worker = AccountInfoWorker()
+        self._account_worker.signaler.result.connect(self._apply_account_info, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(self._account_worker)
+
+    @pyqtSlot(object)
+    def _apply_account_info(self, account_info):
+        """Update account and risk panels from MT5 account info"""
+        if account_info is None:
+            self._account_worker = None
+            logger.warning("Could not get MT5 account info")
+            return
 
+        if account_info is not self._account_cache[0]:
+            self._account_worker = None
+            self._account_cache = (account_info, time.monotonic())
+
+        try:
             balance = account_info.balance
             equity = account_info.equity
             profit = account_info.profit
@@ -349,38 +540,39 @@ class PairTradingGUI(QMainWindow):
 
     def show_startup_message(self):
         """Show startup message in logs"""
-        self.add_log("=" * 70)
-        self.add_log("PAIR TRADING SYSTEM - PROFESSIONAL EDITION")
-        self.add_log("=" * 70)
-        self.add_log("")
-        self.add_log("✅ GUI initialized successfully")
-        self.add_log(f"📂 Settings loaded from: config/trading_settings.yaml")
-        self.add_log(f"⚙️  Global settings apply to ALL pairs")
-        self.add_log("")
-        self.add_log("📋 READY TO START:")
-        self.add_log("   1. Configure symbols in Settings tab")
-        self.add_log("   2. Adjust parameters if needed")
-        self.add_log("   3. Click 'Start Trading' in Dashboard")
-        self.add_log("")
-        self.add_log("=" * 70)
+        self.add_log_bulk([
+            "=" * 70,
+            "PAIR TRADING SYSTEM - PROFESSIONAL EDITION",
+            "=" * 70,
+            "",
+            "✅ GUI initialized successfully",
+            "📂 Settings loaded from: config/trading_settings.yaml",
+            "⚙️  Global settings apply to ALL pairs",
+            "",
+            "📋 READY TO START:",
+            "   1. Configure symbols in Settings tab",
+            "   2. Adjust parameters if needed",
+            "   3. Click 'Start Trading' in Dashboard",
+            "",
+            "=" * 70,
+        ])
 
     def toggle_trading(self):
         """Start or stop trading"""
         if self.trading_thread is not None and self.trading_thread.isRunning():
             # ========== STOP TRADING ==========
-            self.add_log("=" * 70)
-            self.add_log("⏸️ STOPPING TRADING SYSTEM")
-            self.add_log("=" * 70)
+            self.add_log_bulk(["=" * 70, "⏸️ STOPPING TRADING SYSTEM", "=" * 70])
 
             btn = self.display_panel.get_start_stop_button()
             btn.setEnabled(False)
             btn.setText("⏸️ Stopping...")
             self.statusBar.showMessage("Stopping trading system...")
 
-            self.stop_thread = StopThread(self.trading_thread)
-            self.stop_thread.log_message.connect(self.add_log)
-            self.stop_thread.finished_signal.connect(self._on_stop_finished)
-            self.stop_thread.start()
+            # Completion arrives via trading_thread.finished; the timer is the fallback
+            self._stop_timer.start()
+            self.stop_task = StopTask(self.trading_thread)
+            self.stop_task.signaler.log_message.connect(self.add_log, Qt.ConnectionType.QueuedConnection)
+            QThreadPool.globalInstance().start(self.stop_task)
             return
 
         # ========== START TRADING ==========
@@ -394,20 +586,22 @@ class PairTradingGUI(QMainWindow):
                                 "Please enter valid, different symbols in Settings tab!")
             return
 
-        self.add_log("=" * 70)
-        self.add_log("🚀 STARTING TRADING SYSTEM")
-        self.add_log("=" * 70)
-        self.add_log(f"📊 Selected Pair: {primary} / {secondary}")
-        self.add_log("🔄 Loading symbol info from MT5...")
+        self.add_log_bulk([
+            "=" * 70,
+            "🚀 STARTING TRADING SYSTEM",
+            "=" * 70,
+            f"📊 Selected Pair: {primary} / {secondary}",
+            "🔄 Loading symbol info from MT5...",
+        ])
 
         try:
             symbols = self.symbol_loader.load_pair(primary, secondary)
-            self.add_log(
+            self.add_log_bulk([
                 f"✅ {primary}: contract_size={symbols['primary']['contract_size']}, "
-                f"min_lot={symbols['primary']['min_lot']}")
-            self.add_log(
+                f"min_lot={symbols['primary']['min_lot']}",
                 f"✅ {secondary}: contract_size={symbols['secondary']['contract_size']}, "
-                f"min_lot={symbols['secondary']['min_lot']}")
+                f"min_lot={symbols['secondary']['min_lot']}",
+            ])
         except Exception as e:
             self.add_log(f"❌ Failed to load symbols: {e}")
             QMessageBox.critical(self, "Symbol Error",
@@ -420,11 +614,13 @@ class PairTradingGUI(QMainWindow):
 
         # Get settings
         settings = self.settings_manager.get()
-        self.add_log(f"⚙️  Global Settings:")
-        self.add_log(f"   Entry: {settings.entry_threshold}, Exit: {settings.exit_threshold}")
-        self.add_log(f"   Volume: {settings.volume_multiplier}x, Window: {settings.rolling_window_size}")
-        self.add_log(f"   Max Positions: {settings.max_positions}, Risk: {settings.max_risk_pct}%")
-        self.add_log("=" * 70)
+        self.add_log_bulk([
+            "⚙️  Global Settings:",
+            f"   Entry: {settings.entry_threshold}, Exit: {settings.exit_threshold}",
+            f"   Volume: {settings.volume_multiplier}x, Window: {settings.rolling_window_size}",
+            f"   Max Positions: {settings.max_positions}, Risk: {settings.max_risk_pct}%",
+            "=" * 70,
+        ])
 
         # Create trading config
         trading_config = {
@@ -436,56 +632,41 @@ class PairTradingGUI(QMainWindow):
 
         # Create and start trading thread
         self.trading_thread = TradingSystemThread(trading_config, self.risk_alert_handler)
-        self.trading_thread.log_message.connect(self.add_log)
-        self.trading_thread.snapshot_update.connect(self.on_snapshot_update)
-        self.trading_thread.finished.connect(self._on_thread_finished)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.trading_thread.log_message.connect(self.add_log, queued)
+        self.trading_thread.snapshot_update.connect(self.on_snapshot_update, queued)
+        self.trading_thread.snapshot_update.connect(self.update_from_snapshot, queued)
+        self.trading_thread.finished.connect(self._on_thread_finished, queued)
         self.trading_thread.start()
 
         # Auto-save config
-        self.add_log("")
-        self.add_log("💾 Auto-saving configuration...")
         try:
             self.settings_panel.save_settings()
-            self.add_log("✅ Configuration auto-saved")
+            save_result = "✅ Configuration auto-saved"
         except Exception as e:
-            self.add_log(f"⚠️  Failed to auto-save: {e}")
+            save_result = f"⚠️  Failed to auto-save: {e}"
 
-        self.add_log("=" * 70)
+        self.add_log_bulk(["", "💾 Auto-saving configuration...", save_result, "=" * 70])
 
         # Update UI to running state
         btn = self.display_panel.get_start_stop_button()
         btn.setText("⏸️ Stop Trading")
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 4px;
-                min-width: 180px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        btn.setStyleSheet(STYLE_STOP_BTN)
 
         self.statusBar.showMessage(f"Trading {primary}/{secondary}")
         self.display_panel.update_status("🟢 Running", "#27ae60")
 
+    @pyqtSlot(bool)
     def _on_stop_finished(self, graceful: bool):
-        """Handle stop thread completion"""
-        self.add_log("")
-        if graceful:
-            self.add_log("✅ Trading system stopped gracefully")
-        else:
-            self.add_log("⚠️  Trading system force-stopped")
-        self.add_log("=" * 70)
-
-        # Clean up threads
-        if self.stop_thread:
-            self.stop_thread.deleteLater()
-            self.stop_thread = None
+        """Handle stop completion (graceful finish or forced terminate)"""
+        self.add_log_bulk([
+            "",
+            "✅ Trading system stopped gracefully" if graceful else "⚠️  Trading system force-stopped",
+            "=" * 70,
+        ])
+
+        # Clean up threads (the pool disposes of the stop task itself)
+        self.stop_task = None
 
         if self.trading_thread:
             self.trading_thread.deleteLater()
@@ -495,86 +676,111 @@ class PairTradingGUI(QMainWindow):
         btn = self.display_panel.get_start_stop_button()
         btn.setEnabled(True)
         btn.setText("▶️ Start Trading")
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 4px;
-                min-width: 180px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-        """)
+        btn.setStyleSheet(STYLE_START_BTN)
 
         self.statusBar.showMessage("Ready")
         self.display_panel.update_status("⚫ Stopped", "#7f8c8d")
 
+    @pyqtSlot()
     def _on_thread_finished(self):
-        """Handle trading thread natural finish"""
-        if self.trading_thread and not self.trading_thread.running:
+        """Handle trading thread finish (requested stop or natural end)"""
+        if self._stop_timer.isActive():
+            self._stop_timer.stop()
+            self.add_log("   Thread stopped gracefully")
+            self._on_stop_finished(True)
+        elif self.trading_thread and not self.trading_thread.running:
             self.add_log("🔔 Trading thread finished")
 
+    @pyqtSlot()
+    def _force_terminate_if_running(self):
+        """Terminate the trading thread if it ignored the stop request"""
+        thread = self.trading_thread
+        if thread is None or not thread.isRunning():
+            return
+
+        self.add_log(f"⚠️  Thread did not stop in {self.STOP_TIMEOUT_MS // 1000} seconds, force terminating...")
+        thread.terminate()
+        thread.wait(2000)
+        self.add_log("   Thread terminated forcefully")
+        self._on_stop_finished(False)
+
     @pyqtSlot(object)
     def on_snapshot_update(self, snapshot):
         """Handle snapshot update from trading system"""
         if snapshot:
             self.display_panel.update_chart(snapshot)
 
-    def update_display(self):
-        """Periodic display update"""
-        if not self.trading_thread or not self.trading_thread.isRunning():
+    @pyqtSlot(object)
+    def update_from_snapshot(self, snapshot):
+        """Handle pushed snapshot (text widgets refresh at most every 200ms)"""
+        if snapshot is not None:
+            self._throttled_display(snapshot)
+
+    def update_display(self, snapshot):
+        """Refresh dashboard text widgets from a snapshot"""
+        if self.tabs.currentIndex() != 0:
+            # Dashboard hidden: keep only the latest, rendered on tab switch
+            self._hidden_snapshot = snapshot
             return
 
         try:
-            if not self.trading_thread.trading_system:
-                return
-
-            system = self.trading_thread.trading_system
-
-            # Get latest snapshot
-            if hasattr(system, 'snapshots') and system.snapshots:
-                snapshot = system.snapshots[-1]
-
-                # Update live stats
-                self.display_panel.update_live_stats(
-                    z_score=snapshot.get('z_score'),
-                    correlation=snapshot.get('correlation'),
-                    hedge_ratio=snapshot.get('hedge_ratio'),
-                    spread=snapshot.get('spread'),
-                    signal=snapshot.get('signal', 'HOLD')
+            now = time.time()
+            sec = int(now)
+            if sec != self._last_ts_sec:
+                self._last_ts_sec = sec
+                self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+
+            dp = self.display_panel
+            ts_str = self._last_ts_str
+            # Update live stats
+            live_key = (snapshot.zscore, snapshot.correlation, snapshot.hedge_ratio,
+                        snapshot.spread, snapshot.signal)
+            if live_key != self._last_live:
+                self._last_live = live_key
+                dp.update_live_stats(
+                    z_score=snapshot.zscore,
+                    correlation=snapshot.correlation,
+                    hedge_ratio=snapshot.hedge_ratio,
+                    spread=snapshot.spread,
+                    signal=snapshot.signal
                 )
 
-                # Update model metrics
-                metrics = {
-                    'entry_threshold': snapshot.get('entry_threshold', 2.0),
-                    'exit_threshold': snapshot.get('exit_threshold', 0.5),
-                    'window_size': snapshot.get('window_size', 200),
-                    'spread_mean': snapshot.get('spread_mean'),
-                    'spread_std': snapshot.get('spread_std'),
-                    'mean_drift': snapshot.get('mean_drift'),
-                    'max_z_score': snapshot.get('max_z_score'),
-                    'min_z_score': snapshot.get('min_z_score'),
-                    'max_mean': snapshot.get('max_mean'),
-                    'min_mean': snapshot.get('min_mean'),
-                    'last_update': datetime.now().strftime("%H:%M:%S")
-                }
-                self.display_panel.update_model_metrics(metrics)
-
-                # Update total P&L
-                total_pnl = snapshot.get('total_pnl', 0)
-                self.display_panel.update_total_pnl(total_pnl)
+            # Update model metrics (last_update in the key keeps the clock ticking)
+            metrics_key = (snapshot.entry_threshold, snapshot.exit_threshold, snapshot.window_size,
+                           snapshot.spread_mean, snapshot.spread_std, snapshot.max_z_score,
+                           snapshot.min_z_score, snapshot.max_mean, snapshot.min_mean, ts_str)
+            if metrics_key != self._last_metrics:
+                self._last_metrics = metrics_key
+                dp.update_model_metrics({
+                    'entry_threshold': snapshot.entry_threshold,
+                    'exit_threshold': snapshot.exit_threshold,
+                    'window_size': snapshot.window_size,
+                    'spread_mean': snapshot.spread_mean,
+                    'spread_std': snapshot.spread_std,
+                    'max_z_score': snapshot.max_z_score,
+                    'min_z_score': snapshot.min_z_score,
+                    'max_mean': snapshot.max_mean,
+                    'min_mean': snapshot.min_mean,
+                    'last_update': ts_str
+                })
+
+            # Update total P&L
+            if snapshot.total_pnl != self._last_pnl:
+                self._last_pnl = snapshot.total_pnl
+                dp.update_total_pnl(snapshot.total_pnl)
 
         except Exception as e:
             logger.error(f"Display update error: {e}")
 
+    @pyqtSlot(str)
     def add_log(self, message):
         """Add log message"""
         self.display_panel.add_log(message)
 
+    def add_log_bulk(self, messages):
+        """Add several log messages in one append"""
+        self.display_panel.add_log_bulk(messages)
+
     def on_settings_saved(self):
         """Handle settings saved"""
         self.add_log("💾 Settings saved successfully")
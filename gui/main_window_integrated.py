@@ -14,15 +14,22 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QPushButton, QComboBox, QTableWidget,
     QTableWidgetItem, QGroupBox, QGridLayout, QLineEdit,
-    QTextEdit, QSplitter, QFrame, QSpinBox, QDoubleSpinBox,
+    QPlainTextEdit, QSplitter, QFrame, QSpinBox, QDoubleSpinBox,
     QCheckBox, QProgressBar, QStatusBar, QMessageBox, QScrollArea
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QMetaObject, QSignalBlocker
 from PyQt6.QtGui import QFont, QColor, QPalette
 from datetime import datetime
+import dataclasses
 import json
 import logging
+import queue
+import numpy as np
 import threading
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # Import theme (styles only)
 from asset.theme import DARCULA_THEME_QSS, apply_theme
@@ -41,12 +48,17 @@ from gui.pair_discovery_tab import PairDiscoveryTab
 from gui.risk_alert_handler import RiskAlertHandler
 
 # Import GUI data presenter (NEW: Presentation layer)
-from gui.gui_data_presenter import GUIDataPresenter
+from gui.gui_data_presenter import GUIDataPresenter, SystemStatus, DEFAULT_STATUS
+from gui.throttle import qthrottled
 
 # Import config sync manager and indicator (NEW: Hot-reload & sync)
 from core.config_sync_manager import ConfigSyncManager, SymbolValidator, get_config_sync_manager
 from gui.config_sync_indicator import ConfigSyncIndicator, ConfigSyncStatusBar
 
+# Import MT5 connection manager and risk monitor (used on every status refresh)
+from core.mt5_manager import get_mt5_manager, get_mt5
+from risk.mt5_risk_monitor import MT5RiskMonitor
+
 # Import trading system (EXISTING CODE - NO CHANGES)
 # CRITICAL: Use lazy import to avoid triggering main_cli module-level code!
 # This prevents TradingSystem from auto-starting when GUI loads
@@ -55,6 +67,19 @@ from core.trading_system import TradingSystem
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _format_spread_id(spread_id: str) -> str:
+    """Shorten a spread_id for display (spread_ids never change once opened)"""
+    if '-' in spread_id:
+        # Ticket-based format: "1538873231-1538873233"
+        # Show as: "8231-3233" (last 4 digits of each ticket)
+        parts = spread_id.split('-')
+        if len(parts) == 2:
+            return f"{parts[0][-4:]}-{parts[1][-4:]}"
+    # UUID format or other
+    return spread_id[:8]
+
+
 class StopThread(QThread):
     """Thread to stop trading system without blocking GUI"""
 
@@ -91,6 +116,133 @@ class StopThread(QThread):
             self.finished_signal.emit(False)
 
 
+class MT5PrewarmThread(QThread):
+    """Thread to open the MT5 connection at GUI launch, before Start Trading is clicked"""
+
+    finished_signal = pyqtSignal(bool)  # True if MT5 is connected
+
+    def run(self):
+        """Initialize MT5 in background (mt5_manager caches the connection)"""
+        try:
+            ok = get_mt5_manager().initialize()
+        except Exception as e:
+            logger.warning(f"MT5 prewarm failed: {e}")
+            ok = False
+        self.finished_signal.emit(ok)
+
+
+class MT5StateThread(QThread):
+    """Thread to fetch the initial account/risk/lock state without blocking GUI"""
+
+    finished_signal = pyqtSignal(dict)  # Plain values for PairTradingGUI._apply_mt5_state ({} on failure)
+
+    HISTORY_TTL = 60.0  # Seconds a daily-history result is reused
+    POSITIONS_MAX_AGE = 0.5  # Seconds a positions list from the running monitor is reused
+
+    def __init__(self, max_risk_pct: float, daily_loss_limit_pct: float, risk_monitor=None,
+                 lock_cache=None, history_cache=None):
+        super().__init__()
+        self.max_risk_pct = max_risk_pct
+        self.daily_loss_limit_pct = daily_loss_limit_pct
+        self.risk_monitor = risk_monitor  # MT5RiskMonitor polled by a running TradingSystemThread, if any
+        # Caches owned by PairTradingGUI; it reads the updated values back once the thread finishes
+        self.lock_cache = lock_cache  # (TradingLockManager, state file mtime) or None
+        self.history_cache = dict(history_cache or {})  # (day, balance/100, risk, limit, equity/100) -> (fetched_at, pnl)
+
+    def _net_realized_pnl(self, balance: float, equity: float) -> float:
+        """Session realized P&L, reused for HISTORY_TTL between near-identical balances"""
+        today = datetime.now().date()
+        cache = {k: v for k, v in self.history_cache.items() if k[0] == today}  # Drop earlier days
+        self.history_cache = cache
+
+        key = (today, round(balance / 100), self.max_risk_pct, self.daily_loss_limit_pct, round(equity / 100))
+        now = time.monotonic()
+        cached = cache.get(key)
+        if cached is not None and now - cached[0] < self.HISTORY_TTL:
+            return cached[1]
+
+        from risk.daily_risk_manager import DailyRiskManager
+        daily_risk = DailyRiskManager(
+            account_balance=balance,
+            max_risk_pct=self.max_risk_pct,
+            daily_loss_limit_pct=self.daily_loss_limit_pct
+        )
+        history = daily_risk.load_daily_history(current_equity=equity)
+        cache[key] = (now, history['net_realized_pnl'])
+        return history['net_realized_pnl']
+
+    def _trading_lock_manager(self):
+        """TradingLockManager reused until its state file is rewritten"""
+        from risk.trading_lock_manager import TradingLockManager
+
+        def file_mtime(manager):
+            try:
+                return manager.persist_path.stat().st_mtime
+            except OSError:
+                return None
+
+        if self.lock_cache is not None:
+            manager, mtime = self.lock_cache
+            if mtime is not None and file_mtime(manager) == mtime:
+                manager.check_auto_unlock()  # Lock expiry is time-based, not file-based
+                return manager
+
+        manager = TradingLockManager()
+        self.lock_cache = (manager, file_mtime(manager))
+        return manager
+
+    def run(self):
+        """Query MT5, daily history and trading lock in background"""
+        state = {}
+        try:
+            mt5 = get_mt5()
+
+            # Get account info
+            account_info = mt5.account_info()
+            if account_info is None:
+                logger.warning("Could not get MT5 account info for initial state load")
+                self.finished_signal.emit(state)
+                return
+
+            state['balance'] = account_info.balance
+            state['equity'] = account_info.equity
+            state['profit'] = account_info.profit
+            state['margin'] = account_info.margin
+            state['free_margin'] = account_info.margin_free
+            state['margin_level'] = account_info.margin_level if account_info.margin_level else 0
+
+            # Realized P&L of the current session (disk I/O)
+            state['net_realized_pnl'] = None
+            try:
+                state['net_realized_pnl'] = self._net_realized_pnl(account_info.balance, account_info.equity)
+            except Exception as e:
+                logger.warning(f"Could not load Risk Manager state: {e}")
+
+            # Trading lock status
+            state['lock'] = None
+            try:
+                lock_manager = self._trading_lock_manager()
+                if lock_manager.is_locked():
+                    state['lock'] = lock_manager.get_lock_info()
+                else:
+                    state['lock'] = {}
+            except Exception as e:
+                logger.warning(f"Could not load TradingLockManager state: {e}")
+
+            positions = None
+            if self.risk_monitor is not None:
+                positions = self.risk_monitor.recent_positions(self.POSITIONS_MAX_AGE)
+            if positions is None:
+                positions = mt5.positions_get()
+            state['position_count'] = len(positions) if positions else 0
+
+        except Exception as e:
+            logger.warning(f"Could not load initial MT5 state: {e}")
+            state = {}
+
+        self.finished_signal.emit(state)
+
+
 class TradingSystemThread(QThread):
     """Thread to run trading system without blocking GUI"""
 
@@ -101,18 +253,49 @@ class TradingSystemThread(QThread):
     snapshot_update = pyqtSignal(object)  # ← NEW: For chart updates
     error_occurred = pyqtSignal(str)  # ← NEW: For error handling
 
+    MT5_CALL_TIMEOUT = 0.4  # Seconds get_status waits for MT5 metrics
+    STATUS_INTERVAL = 0.5  # Seconds between SystemStatus builds in the monitor loop
+    STATS_WINDOW = 4096  # Snapshots kept for the max/min z-score and mean statistics
+
     def __init__(self, trading_config: dict, risk_alert_handler=None):
         super().__init__()
         self.trading_config = trading_config
         self.trading_system = None
         self.running = False
         self.risk_alert_handler = risk_alert_handler  # Store risk alert handler
-
-        # Track statistics
-        self.max_zscore = 0.0
-        self.min_zscore = 0.0  # NEW: Track minimum Z-score
-        self.min_mean = float('inf')
-        self.max_mean = float('-inf')
+        self.mt5_monitor = MT5RiskMonitor()  # Reused by every get_status call
+        # Single worker keeps MT5 calls serialized; the GUI only waits MT5_CALL_TIMEOUT
+        self._mt5_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5-metrics")
+        self._metrics_future = None
+        self._last_mt5_metrics = None
+        self._stop_event = threading.Event()  # Set by stop() to wake the monitor loop
+        self._last_seq = 0  # Sequence number of the last snapshot emitted
+        self._latest_snapshot = None  # Newest snapshot not yet handed to the GUI thread
+        self._drain_pending = False  # True while a _drain_snapshot call is queued
+        self._snapshot_lock = threading.Lock()  # Guards the two fields above
+        self._log_buffer = []  # Startup log lines, emitted together by _flush_log
+        self._status_queue = queue.Queue(maxsize=1)  # Latest SystemStatus built by the monitor loop
+        self._last_status = DEFAULT_STATUS  # Newest status taken off the queue
+        self._positions_cache = {}  # position_id -> row dict, see get_positions
+        self.refresh_config_view()
+
+        # Track statistics - ring buffers of recent samples, reduced on demand by _stats()
+        self._zbuf = np.empty(self.STATS_WINDOW)
+        self._z_count = 0
+        self._mean_buf = np.empty(self.STATS_WINDOW)
+        self._mean_count = 0
+        self._stats_cache = ((0, 0), (0.0, 0.0, 0.0, 0.0))  # (sample counts, _stats result)
+        self._debug_counter = 0  # get_status calls with a valid snapshot, for periodic debug logs
+
+    def _log(self, message: str):
+        """Queue a startup log line (sent on the next _flush_log)"""
+        self._log_buffer.append(message)
+
+    def _flush_log(self):
+        """Emit all queued log lines as a single message"""
+        if self._log_buffer:
+            self.log_message.emit("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def run(self):
         """Run trading system in background thread"""
@@ -123,50 +306,51 @@ class TradingSystemThread(QThread):
             primary_symbol = self.trading_config['primary_symbol']
             secondary_symbol = self.trading_config['secondary_symbol']
 
-            # DEBUG: Log what we received
-            self.log_message.emit("")
-            self.log_message.emit("🔍 DEBUG - Trading Config Received:")
-            self.log_message.emit(f"   Primary Symbol: {primary_symbol}")
-            self.log_message.emit(f"   Secondary Symbol: {secondary_symbol}")
-            self.log_message.emit(f"   Primary Contract: {symbols['primary']['contract_size']}")
-            self.log_message.emit(f"   Secondary Contract: {symbols['secondary']['contract_size']}")
-            self.log_message.emit("")
+            # DEBUG: Log what we received (application log only, not the GUI pane)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Trading config received: %s/%s, contract sizes %s/%s",
+                             primary_symbol, secondary_symbol,
+                             symbols['primary']['contract_size'], symbols['secondary']['contract_size'])
+            self._log("")
 
             # ========== INITIALIZE MT5 CONNECTION (FIRST!) ==========
-            self.log_message.emit("🔌 Initializing MT5 connection...")
-            self.log_message.emit("   This may take up to 60 seconds...")
-
             try:
-                from core.mt5_manager import get_mt5_manager
-
                 mt5_manager = get_mt5_manager()
 
-                self.log_message.emit("   Connecting to MT5 terminal...")
-                init_success = mt5_manager.initialize()
+                if mt5_manager.is_initialized and mt5_manager.is_connected():
+                    # Already connected by MT5PrewarmThread at GUI launch
+                    init_success = True
+                else:
+                    self._log("🔌 Initializing MT5 connection...")
+                    self._log("   This may take up to 60 seconds...")
+                    self._log("   Connecting to MT5 terminal...")
+                    self._flush_log()  # Show progress before the (slow) connect
+                    init_success = mt5_manager.initialize()
 
                 if not init_success:
-                    self.log_message.emit("❌ FATAL ERROR: Failed to initialize MT5 connection")
-                    self.log_message.emit("")
-                    self.log_message.emit("Common issues:")
-                    self.log_message.emit("  1. MT5 terminal is NOT running")
-                    self.log_message.emit("     → Please start MetaTrader 5 terminal first")
-                    self.log_message.emit("")
-                    self.log_message.emit("  2. Wrong credentials in .env file")
-                    self.log_message.emit("     → Check MT5_LOGIN, MT5_PASSWORD, MT5_SERVER")
-                    self.log_message.emit("")
-                    self.log_message.emit("  3. No internet connection")
-                    self.log_message.emit("     → Check your network")
-                    self.log_message.emit("")
+                    self._log("❌ FATAL ERROR: Failed to initialize MT5 connection")
+                    self._log("")
+                    self._log("Common issues:")
+                    self._log("  1. MT5 terminal is NOT running")
+                    self._log("     → Please start MetaTrader 5 terminal first")
+                    self._log("")
+                    self._log("  2. Wrong credentials in .env file")
+                    self._log("     → Check MT5_LOGIN, MT5_PASSWORD, MT5_SERVER")
+                    self._log("")
+                    self._log("  3. No internet connection")
+                    self._log("     → Check your network")
+                    self._log("")
+                    self._flush_log()
                     self.error_occurred.emit("Failed to initialize MT5 connection")
                     return
 
-                self.log_message.emit("✅ MT5 Connection established")
+                self._log("✅ MT5 Connection established")
 
             except Exception as e:
-                self.log_message.emit(f"❌ Exception during MT5 initialization: {e}")
-                import traceback
-                error_details = traceback.format_exc()
-                self.log_message.emit(f"   Details: {error_details}")
+                self._log(f"❌ Exception during MT5 initialization: {e}")
+                self._log("   Details: see application log")
+                logger.exception("MT5 initialization failed")
+                self._flush_log()
                 self.error_occurred.emit(f"MT5 initialization error: {e}")
                 return
 
@@ -175,16 +359,16 @@ class TradingSystemThread(QThread):
             account_info = mt5.account_info()
             if account_info is None:
                 real_balance = 100000.0  # Fallback
-                self.log_message.emit("⚠️  Could not get MT5 balance, using default $100,000")
+                self._log("⚠️  Could not get MT5 balance, using default $100,000")
             else:
                 real_balance = account_info.balance
-                self.log_message.emit(f"✅ MT5 Account Balance: ${real_balance:,.2f}")
-                self.log_message.emit(f"   Account: {account_info.login}")
-                self.log_message.emit(f"   Leverage: 1:{account_info.leverage}")
+                self._log(f"✅ MT5 Account Balance: ${real_balance:,.2f}")
+                self._log(f"   Account: {account_info.login}")
+                self._log(f"   Leverage: 1:{account_info.leverage}")
 
             # Create trading system with symbols + settings!
-            self.log_message.emit("")
-            self.log_message.emit("🔧 Creating TradingSystem...")
+            self._log("")
+            self._log("🔧 Creating TradingSystem...")
 
             # Add symbols to config dict
             config_with_symbols = settings.copy()
@@ -195,9 +379,10 @@ class TradingSystemThread(QThread):
             # IMPORTANT: Don't convert to dollar amount - TradingSystem now accepts percentage!
             daily_loss_pct = config_with_symbols.get('daily_loss_limit_pct', 5.0)  # Default 5%
 
-            self.log_message.emit(f"💰 Risk Settings:")
-            self.log_message.emit(f"   Risk Per Setup: {config_with_symbols.get('max_risk_pct', 2.0):.1f}%")
-            self.log_message.emit(f"   Daily Risk Limit: {daily_loss_pct:.1f}% (calculated from starting balance)")
+            self._log(f"💰 Risk Settings:")
+            self._log(f"   Risk Per Setup: {config_with_symbols.get('max_risk_pct', 2.0):.1f}%")
+            self._log(f"   Daily Risk Limit: {daily_loss_pct:.1f}% (calculated from starting balance)")
+            self._flush_log()
 
             self.trading_system = TradingSystem(
                 account_balance=real_balance,
@@ -207,77 +392,61 @@ class TradingSystemThread(QThread):
             # CRITICAL: Set risk alert callback (for GUI notifications)
             if self.risk_alert_handler:
                 self.trading_system.risk_alert_callback = lambda severity, title, msg: self.risk_alert_handler.emit_alert(severity, title, msg)
-                self.log_message.emit("✅ Risk alert handler connected")
+                self._log("✅ Risk alert handler connected")
             else:
-                self.log_message.emit("⚠️  Risk alert handler not found (GUI won't show alerts)")
+                self._log("⚠️  Risk alert handler not found (GUI won't show alerts)")
 
             # Set symbol info (runtime data)
-            self.log_message.emit(f"📝 Setting symbols in market_data:")
-            self.log_message.emit(f"   primary_symbol = {primary_symbol}")
-            self.log_message.emit(f"   secondary_symbol = {secondary_symbol}")
             self.trading_system.market_data.primary_symbol = primary_symbol
             self.trading_system.market_data.secondary_symbol = secondary_symbol
             self.trading_system.market_data.primary_contract_size = symbols['primary']['contract_size']
             self.trading_system.market_data.secondary_contract_size = symbols['secondary']['contract_size']
 
             # CRITICAL: Also update trade executor symbols!
-            self.log_message.emit(f"📝 Setting symbols in trade_executor:")
             self.trading_system.trade_executor.primary_symbol = primary_symbol
             self.trading_system.trade_executor.secondary_symbol = secondary_symbol
-            self.log_message.emit(f"   ✅ Executor updated: {primary_symbol}/{secondary_symbol}")
-
-            # VERIFY what was actually set
-            self.log_message.emit("")
-            self.log_message.emit("✅ Verification - Symbols in TradingSystem:")
-            self.log_message.emit(f"   market_data.primary_symbol = {self.trading_system.market_data.primary_symbol}")
-            self.log_message.emit(
-                f"   market_data.secondary_symbol = {self.trading_system.market_data.secondary_symbol}")
-            self.log_message.emit(
-                f"   market_data.primary_contract_size = {self.trading_system.market_data.primary_contract_size}")
-            self.log_message.emit(
-                f"   market_data.secondary_contract_size = {self.trading_system.market_data.secondary_contract_size}")
-            self.log_message.emit(
-                f"   trade_executor.primary_symbol = {self.trading_system.trade_executor.primary_symbol}")
-            self.log_message.emit(
-                f"   trade_executor.secondary_symbol = {self.trading_system.trade_executor.secondary_symbol}")
-            self.log_message.emit("")
-
-            self.log_message.emit(f"✅ Trading system initialized and ready!")
-            self.log_message.emit(f"   Trading Pair: {primary_symbol}/{secondary_symbol}")
-            self.log_message.emit(f"   Global config applied")
+
+            # VERIFY what was actually set (application log only, not the GUI pane)
+            if logger.isEnabledFor(logging.DEBUG):
+                md = self.trading_system.market_data
+                te = self.trading_system.trade_executor
+                logger.debug("Verification - market_data: %s/%s (contracts %s/%s), trade_executor: %s/%s",
+                             md.primary_symbol, md.secondary_symbol,
+                             md.primary_contract_size, md.secondary_contract_size,
+                             te.primary_symbol, te.secondary_symbol)
+            self._log("")
+
+            self._log(f"✅ Trading system initialized and ready!")
+            self._log(f"   Trading Pair: {primary_symbol}/{secondary_symbol}")
+            self._log(f"   Global config applied")
+            self._flush_log()
+            self.refresh_config_view()
 
             # Start trading system in separate thread (non-blocking)
             self.running = True
 
+            # Chart snapshots are pushed by the data thread as they are produced
+            self.trading_system.snapshot_callback = self._publish_snapshot
+
             # Start the trading system (this starts its own threads)
             self.trading_system.start()
 
-            # Monitor loop - keep thread alive and check running flag
-            import time
-            while self.running:
-                time.sleep(0.5)  # Check every 500ms
-
-                # Emit current snapshot for chart updates
-                try:
-                    if self.trading_system and hasattr(self.trading_system, 'market_data'):
-                        snapshot = self.trading_system.market_data.get_realtime_snapshot()
-                        if snapshot:
-                            self.snapshot_update.emit(snapshot)
-                except Exception as e:
-                    # Don't crash on snapshot errors
-                    pass
-
+            # Monitor loop - keep thread alive until stop() sets the event,
+            # building a complete SystemStatus for the GUI on every pass
+            # from the snapshot the data thread last produced
+            while self.running and not self._stop_event.wait(self.STATUS_INTERVAL):
                 # If trading_system stopped itself, exit
-                if hasattr(self.trading_system, '_stop_event'):
-                    if self.trading_system._stop_event.is_set():
-                        self.log_message.emit("⚠️  Trading system stopped itself")
-                        break
+                if not self.trading_system.running:
+                    self.log_message.emit("⚠️  Trading system stopped itself")
+                    break
+                self._push_status(self.trading_system.current_snapshot)
 
             # Clean exit
             self.log_message.emit("🛑 Trading thread exiting...")
 
         except Exception as e:
-            self.log_message.emit(f"❌ Error starting trading system: {str(e)}")
+            self._log(f"❌ Error starting trading system: {str(e)}")
+            self._flush_log()
             logger.error(f"Trading system error: {e}", exc_info=True)
         finally:
             # Ensure system is stopped
@@ -287,95 +456,159 @@ class TradingSystemThread(QThread):
                 except:
                     pass
             self.running = False
+            self._mt5_pool.shutdown(wait=False)
+
+    def _record_stats(self, zscore: float, current_mean: float):
+        """Append one snapshot's z-score and rolling mean to the statistics ring buffers"""
+        if current_mean <= 0:  # Ensure valid snapshot
+            return
+        if abs(zscore) > 0.01:  # Ignore very small z-scores
+            self._zbuf[self._z_count % self.STATS_WINDOW] = zscore
+            self._z_count += 1
+        self._mean_buf[self._mean_count % self.STATS_WINDOW] = current_mean
+        self._mean_count += 1
+
+    def _stats(self):
+        """Return (max_z, min_z, min_mean, max_mean) over the last STATS_WINDOW samples"""
+        # Reuse the last result until a new sample arrives (timer refreshes re-read the same data)
+        counts = (self._z_count, self._mean_count)
+        if counts == self._stats_cache[0]:
+            return self._stats_cache[1]
+
+        max_z = min_z = min_mean = max_mean = 0.0
+
+        # max/min z-score are the samples furthest from / closest to zero (sign kept)
+        z = self._zbuf[:min(self._z_count, self.STATS_WINDOW)]
+        if z.size:
+            abs_z = np.abs(z)
+            max_z = float(z[abs_z.argmax()])
+            min_z = float(z[abs_z.argmin()])
+
+        means = self._mean_buf[:min(self._mean_count, self.STATS_WINDOW)]
+        if means.size:
+            min_mean = float(means.min())
+            max_mean = float(means.max())
+
+        result = (max_z, min_z, min_mean, max_mean)
+        self._stats_cache = (counts, result)
+        return result
+
+    def _publish_snapshot(self, seq, snapshot):
+        """
+        Hand a new snapshot to the GUI thread (called from the data thread).
+        Only the latest snapshot is kept; if the GUI is behind, older ones are skipped.
+        """
+        if seq <= self._last_seq:
+            return
+        self._last_seq = seq
+        self._record_stats(snapshot.zscore, snapshot.spread_mean)
+        with self._snapshot_lock:
+            self._latest_snapshot = snapshot
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        QMetaObject.invokeMethod(self, "_drain_snapshot", Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot()
+    def _drain_snapshot(self):
+        """Emit snapshot_update with the latest snapshot (runs in the GUI thread)"""
+        with self._snapshot_lock:
+            snapshot, self._latest_snapshot = self._latest_snapshot, None
+            self._drain_pending = False
+        if snapshot is not None:
+            self.snapshot_update.emit(snapshot)
 
     def stop(self):
         """Stop trading system"""
         self.running = False
+        self._stop_event.set()
         if self.trading_system:
             # CRITICAL: Must call stop() on TradingSystem to stop its threads!
             self.trading_system.stop()
             self.log_message.emit("⏸️ Trading system stop signal sent")
 
-    def get_status(self) -> dict:
+    def refresh_config_view(self):
+        """
+        Snapshot the config values get_status reads into _cfg_view.
+        Call again whenever the running config changes (config_applied).
+        """
+        settings = self.trading_config['settings']
+        config = self.trading_system.config if self.trading_system is not None else {}
+        self._cfg_view = SimpleNamespace(
+            signal_entry=settings.get('entry_threshold', 2.0),
+            max_risk=settings.get('max_risk_pct', 2.0) / 100.0,  # Convert to fraction
+            entry_threshold=config.get('entry_threshold', 2.0),
+            exit_threshold=config.get('exit_threshold', 0.5),
+            window=config.get('rolling_window_size', 200),
+            scale_interval=config.get('scale_interval', 0.5),
+            vol_mult=config.get('volume_multiplier', 1.0),
+            daily_limit_pct=config.get('daily_loss_limit_pct', 5.0),
+            setup_risk_pct=config.get('max_risk_pct', 2.0),
+        )
+
+    def _fetch_mt5_metrics(self, **kwargs):
+        """
+        Run mt5_monitor.get_metrics on the MT5 worker, waiting at most MT5_CALL_TIMEOUT.
+        While a previous call is still stuck in MT5, the last good metrics are reused.
+        """
+        if self._metrics_future is None or self._metrics_future.done():
+            self._metrics_future = self._mt5_pool.submit(self.mt5_monitor.get_metrics, **kwargs)
+        try:
+            self._last_mt5_metrics = self._metrics_future.result(timeout=self.MT5_CALL_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning(f"MT5 metrics call exceeded {self.MT5_CALL_TIMEOUT}s - using last known values")
+        return self._last_mt5_metrics
+
+    def _push_status(self, snapshot=None):
+        """Build a SystemStatus on the monitor thread and replace any status the GUI has not taken yet"""
+        status = self.get_status(snapshot)
+        try:
+            self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        # Only the monitor loop puts, so the slot is free here
+        self._status_queue.put_nowait(status)
+
+    def latest_status(self) -> SystemStatus:
+        """
+        Newest SystemStatus published by the monitor loop (GUI thread side).
+        Never touches live trading state, so fields always come from one consistent build.
+        """
+        try:
+            while True:
+                self._last_status = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        return self._last_status
+
+    def get_status(self, snapshot=None) -> SystemStatus:
         """
         Get current system status - Returns raw values for GUI presentation layer.
         All fields use *_value suffix to clearly indicate they're data values, not labels.
+        Without a snapshot, the data thread's current_snapshot is used (never a fresh MT5 fetch).
         """
 
-        # Default values (shown when not running)
-        default_status = {
-            'is_running': False,
-            # Core market data
-            'zscore_value': 0.0,
-            'correlation_value': 0.0,
-            'hedge_ratio_value': 0.0,
-            'spread_value': 0.0,
-            'spread_mean_value': 0.0,
-            'spread_std_value': 0.0,
-            'signal_value': 'HOLD',
-            # P&L data
-            'total_pnl_value': 0.0,
-            'unrealized_pnl_value': 0.0,
-            'realized_pnl_value': 0.0,
-            # Position counts
-            'open_positions_value': 0,
-            'closed_positions_value': 0,
-            # Account data (MT5)
-            'balance_value': 0.0,
-            'equity_value': 0.0,
-            'used_margin_value': 0.0,
-            'free_margin_value': 0.0,
-            'margin_level_value': 0.0,
-            # Hedge metrics
-            'primary_lots_value': 0.0,
-            'secondary_lots_value': 0.0,
-            'hedge_imbalance_value': 0.0,
-            'hedge_imbalance_pct_value': 0.0,
-            # Model parameters
-            'entry_threshold_value': 2.0,
-            'exit_threshold_value': 0.5,
-            'window_size_value': 200,
-            'scale_interval_value': 0.5,
-            'volume_multiplier_value': 1.0,
-            # Statistics tracking
-            'max_zscore_value': 0.0,
-            'min_zscore_value': 0.0,
-            'min_mean_value': 0.0,
-            'max_mean_value': 0.0,
-            # Entry tracking (for pyramiding display)
-            'last_entry_zscore_value': None,
-            'next_entry_zscore_value': None,
-            # Note: entry_mean_value removed - gui_data_presenter reads first_entry_spread_mean directly from spread_states.json
-            # Risk management
-            'setup_risk_pct_value': 0.0,
-            'daily_limit_pct_value': 0.0,
-            'daily_total_pnl_value': 0.0,
-            'trading_locked_value': False,
-            'lock_time_value': None,
-            'unlock_time_value': None,
-        }
-
         # If not running, return defaults
         if not self.trading_system or not self.running:
-            return default_status
+            return DEFAULT_STATUS
 
         try:
             # Get real data
-            snapshot = self.trading_system.market_data.get_realtime_snapshot()
+            if snapshot is None:
+                snapshot = self.trading_system.current_snapshot
             pnl_data = self.trading_system.position_tracker.get_total_pnl()
 
 
+            cfg = self._cfg_view
+
             # Get MT5 risk metrics
-            from risk.mt5_risk_monitor import MT5RiskMonitor
-            mt5_monitor = MT5RiskMonitor()
-            max_risk = self.trading_config['settings'].get('max_risk_pct', 2.0) / 100.0  # Convert to fraction
 
             try:
-                mt5_metrics = mt5_monitor.get_metrics(
+                mt5_metrics = self._fetch_mt5_metrics(
                     primary_symbol=self.trading_config.get('primary_symbol', 'XAUUSD'),
                     secondary_symbol=self.trading_config.get('secondary_symbol', 'XAGUSD'),
                     target_hedge_ratio=snapshot.hedge_ratio if snapshot else None,
-                    max_risk_pct=max_risk
+                    max_risk_pct=cfg.max_risk
                 )
                 if not mt5_metrics:
                     logger.warning("MT5RiskMonitor returned None - using defaults")
@@ -388,159 +621,136 @@ class TradingSystemThread(QThread):
 
             # Determine signal
             zscore = snapshot.zscore if snapshot else 0.0
-            entry = self.trading_config['settings'].get('entry_threshold', 2.0)
-            if abs(zscore) >= entry:
+            if abs(zscore) >= cfg.signal_entry:
                 signal = "SHORT SPREAD" if zscore > 0 else "LONG SPREAD"
             else:
                 signal = "HOLD"
 
-            # Track statistics
+            # Statistics (samples are recorded per snapshot in _publish_snapshot)
+            max_z, min_z, min_mean, max_mean = self._stats()
             if snapshot and snapshot.spread_mean > 0:  # Ensure valid snapshot
-                # Track max/min z-score (only if zscore is meaningful)
-                if abs(zscore) > 0.01:  # Ignore very small values
-                    if abs(zscore) > abs(self.max_zscore):
-                        self.max_zscore = zscore
-                    
-                    # Track minimum z-score (most negative or least positive)
-                    if self.min_zscore == 0.0:  # First time
-                        self.min_zscore = zscore
-                    elif abs(zscore) < abs(self.min_zscore):
-                        self.min_zscore = zscore
-
-                # Track min/max rolling mean (ensure valid values)
-                current_mean = snapshot.spread_mean
-                if current_mean > 0:  # Valid mean
-                    if self.min_mean == float('inf'):  # First time
-                        self.min_mean = current_mean
-                    elif current_mean < self.min_mean:
-                        self.min_mean = current_mean
-                    
-                    if self.max_mean == float('-inf'):  # First time
-                        self.max_mean = current_mean
-                    elif current_mean > self.max_mean:
-                        self.max_mean = current_mean
-                
                 # Debug log periodically
-                if hasattr(self, '_debug_counter'):
-                    self._debug_counter += 1
-                    if self._debug_counter % 10 == 0:  # Every 10 updates
-                        logger.debug(f"Tracking: max_z={self.max_zscore:.3f}, min_z={self.min_zscore:.3f}, "
-                                   f"min_mean={self.min_mean:.2f}, max_mean={self.max_mean:.2f}")
-                else:
-                    self._debug_counter = 1
-
-            # Get config values
-            config = self.trading_system.config if hasattr(self.trading_system, 'config') else {}
+                self._debug_counter += 1
+                if self._debug_counter % 10 == 0:  # Every 10 updates
+                    logger.debug(f"Tracking: max_z={max_z:.3f}, min_z={min_z:.3f}, "
+                               f"min_mean={min_mean:.2f}, max_mean={max_mean:.2f}")
 
             # Get trading lock status
             is_locked = False
             lock_time = None
             unlock_time = None
             daily_pnl = 0.0
-            daily_limit_pct = config.get('daily_loss_limit_pct', 5.0)
-            setup_risk_pct = config.get('max_risk_pct', 2.0)
 
-            if hasattr(self.trading_system, 'daily_risk_manager'):
-                risk_status = self.trading_system.daily_risk_manager.check_risk(mt5_metrics.profit if mt5_metrics else 0.0)
-                is_locked = risk_status.trading_locked
-                daily_pnl = risk_status.daily_total_pnl
-                if is_locked and hasattr(risk_status, 'locked_at'):
-                    lock_time = risk_status.locked_at
-                    unlock_time = risk_status.locked_until
+            risk_status = self.trading_system.daily_risk_manager.check_risk(mt5_metrics.profit if mt5_metrics else 0.0)
+            is_locked = risk_status.trading_locked
+            daily_pnl = risk_status.daily_total_pnl
+            if is_locked:
+                # Not every RiskStatus carries lock timestamps
+                lock_time = getattr(risk_status, 'locked_at', None)
+                unlock_time = getattr(risk_status, 'locked_until', None)
 
             # Return ONLY fields needed by GUI (cleaned up, no unused data)
-            return {
-                'is_running': True,
+            return SystemStatus(
+                is_running=True,
                 # Core market data
-                'zscore_value': zscore,
-                'correlation_value': snapshot.correlation if snapshot else 0.0,
-                'hedge_ratio_value': snapshot.hedge_ratio if snapshot else 0.0,
-                'spread_value': snapshot.spread if snapshot else 0.0,
-                'spread_mean_value': snapshot.spread_mean if snapshot else 0.0,
-                'spread_std_value': snapshot.spread_std if snapshot else 0.0,
-                'signal_value': signal,
+                zscore_value=zscore,
+                correlation_value=snapshot.correlation if snapshot else 0.0,
+                hedge_ratio_value=snapshot.hedge_ratio if snapshot else 0.0,
+                spread_value=snapshot.spread if snapshot else 0.0,
+                spread_mean_value=snapshot.spread_mean if snapshot else 0.0,
+                spread_std_value=snapshot.spread_std if snapshot else 0.0,
+                signal_value=signal,
                 # P&L data
-                'total_pnl_value': pnl_data.get('total_pnl', 0.0),
+                total_pnl_value=pnl_data.get('total_pnl', 0.0),
                 # IMPORTANT: Use MT5 real profit from ALL positions (not just tracked ones)
                 # This ensures manual positions on ANY symbol are displayed
-                'unrealized_pnl_value': mt5_metrics.profit if mt5_metrics else pnl_data.get('unrealized_pnl', 0.0),
-                'realized_pnl_value': pnl_data.get('realized_pnl', 0.0),
+                unrealized_pnl_value=mt5_metrics.profit if mt5_metrics else pnl_data.get('unrealized_pnl', 0.0),
+                realized_pnl_value=pnl_data.get('realized_pnl', 0.0),
                 # Position counts
                 # IMPORTANT: Use MT5 real position count (includes manual positions)
-                'open_positions_value': mt5_metrics.total_positions if mt5_metrics else pnl_data.get('open_positions', 0),
-                'closed_positions_value': pnl_data.get('closed_positions', 0),
+                open_positions_value=mt5_metrics.total_positions if mt5_metrics else pnl_data.get('open_positions', 0),
+                closed_positions_value=pnl_data.get('closed_positions', 0),
                 # Account data (from MT5)
-                'balance_value': mt5_metrics.balance if mt5_metrics else 0.0,
-                'equity_value': mt5_metrics.equity if mt5_metrics else 0.0,
-                'used_margin_value': mt5_metrics.margin if mt5_metrics else 0.0,
-                'free_margin_value': mt5_metrics.margin_free if mt5_metrics else 0.0,
-                'margin_level_value': mt5_metrics.margin_level if mt5_metrics else 0.0,
+                balance_value=mt5_metrics.balance if mt5_metrics else 0.0,
+                equity_value=mt5_metrics.equity if mt5_metrics else 0.0,
+                used_margin_value=mt5_metrics.margin if mt5_metrics else 0.0,
+                free_margin_value=mt5_metrics.margin_free if mt5_metrics else 0.0,
+                margin_level_value=mt5_metrics.margin_level if mt5_metrics else 0.0,
                 # Hedge metrics (from MT5)
-                'primary_lots_value': mt5_metrics.primary_lots if mt5_metrics else 0.0,
-                'secondary_lots_value': mt5_metrics.secondary_lots if mt5_metrics else 0.0,
-                'hedge_imbalance_value': mt5_metrics.hedge_imbalance if mt5_metrics else 0.0,
-                'hedge_imbalance_pct_value': mt5_metrics.hedge_imbalance_pct if mt5_metrics else 0.0,
+                primary_lots_value=mt5_metrics.primary_lots if mt5_metrics else 0.0,
+                secondary_lots_value=mt5_metrics.secondary_lots if mt5_metrics else 0.0,
+                hedge_imbalance_value=mt5_metrics.hedge_imbalance if mt5_metrics else 0.0,
+                hedge_imbalance_pct_value=mt5_metrics.hedge_imbalance_pct if mt5_metrics else 0.0,
                 # Model parameters (from config - synced by apply_settings)
-                'entry_threshold_value': config.get('entry_threshold', 2.0),
-                'exit_threshold_value': config.get('exit_threshold', 0.5),
-                'window_size_value': config.get('rolling_window_size', 200),
-                'scale_interval_value': config.get('scale_interval', 0.5),
-                'volume_multiplier_value': config.get('volume_multiplier', 1.0),
+                entry_threshold_value=cfg.entry_threshold,
+                exit_threshold_value=cfg.exit_threshold,
+                window_size_value=cfg.window,
+                scale_interval_value=cfg.scale_interval,
+                volume_multiplier_value=cfg.vol_mult,
                 # Statistics tracking
-                'max_zscore_value': self.max_zscore,
-                'min_zscore_value': self.min_zscore,
-                'min_mean_value': self.min_mean if self.min_mean != float('inf') else 0.0,
-                'max_mean_value': self.max_mean if self.max_mean != float('-inf') else 0.0,
+                max_zscore_value=max_z,
+                min_zscore_value=min_z,
+                min_mean_value=min_mean,
+                max_mean_value=max_mean,
                 # Note: entry_mean_value removed - gui_data_presenter reads first_entry_spread_mean directly from spread_states.json
                 # Risk management
-                'setup_risk_pct_value': setup_risk_pct,
-                'daily_limit_pct_value': daily_limit_pct,
-                'daily_total_pnl_value': daily_pnl,
-                'trading_locked_value': is_locked,
-                'lock_time_value': lock_time,
-                'unlock_time_value': unlock_time,
-            }
+                setup_risk_pct_value=cfg.setup_risk_pct,
+                daily_limit_pct_value=cfg.daily_limit_pct,
+                daily_total_pnl_value=daily_pnl,
+                trading_locked_value=is_locked,
+                lock_time_value=lock_time,
+                unlock_time_value=unlock_time,
+            )
 
         except Exception as e:
             logger.error(f"Error getting status: {e}", exc_info=True)
-            return default_status  # Return defaults on error
+            return DEFAULT_STATUS  # Return defaults on error
 
     def get_positions(self) -> list:
-        """Get current positions"""
+        """
+        Get current positions.
+        Row dicts are cached per position_id: display fields are built once when a
+        position first appears, later calls only refresh the fields that change.
+        """
         if not self.trading_system:
             return []
 
         try:
-            positions = []
-            for pos in self.trading_system.position_tracker.get_all_positions():
-                # Use spread_id from metadata (ticket-based) instead of position_id (UUID)
-                spread_id = pos.metadata.get('spread_id', pos.position_id)
-
-                # Format spread_id for display
-                if '-' in spread_id:
-                    # Ticket-based format: "1538873231-1538873233"
-                    # Show as: "8231-3233" (last 4 digits of each ticket)
-                    parts = spread_id.split('-')
-                    if len(parts) == 2:
-                        display_id = f"{parts[0][-4:]}-{parts[1][-4:]}"
-                    else:
-                        display_id = spread_id[:8]
+            cache = self._positions_cache
+            # Copy first: the trading thread opens and closes positions while we iterate
+            live = dict(self.trading_system.position_tracker.positions)
+
+            # Drop rows for positions that were closed
+            for position_id in cache.keys() - live.keys():
+                del cache[position_id]
+
+            for position_id, pos in live.items():
+                row = cache.get(position_id)
+                if row is None:
+                    # Use spread_id from metadata (ticket-based) instead of position_id (UUID)
+                    spread_id = pos.metadata.get('spread_id', pos.position_id)
+
+                    display_id = _format_spread_id(spread_id)
+                    pos.metadata['display_id'] = display_id
+
+                    cache[position_id] = {
+                        'id': display_id,  # Display shortened spread_id
+                        'symbol': pos.symbol,
+                        'side': pos.side,
+                        'quantity': pos.quantity,
+                        'entry_price': pos.entry_price,
+                        'current_price': pos.current_price,
+                        'unrealized_pnl': pos.unrealized_pnl,
+                        'opened_at': pos.opened_at.strftime("%H:%M:%S"),
+                        'metadata': pos.metadata
+                    }
                 else:
-                    # UUID format or other
-                    display_id = spread_id[:8]
-
-                positions.append({
-                    'id': display_id,  # Display shortened spread_id
-                    'symbol': pos.symbol,
-                    'side': pos.side,
-                    'quantity': pos.quantity,
-                    'entry_price': pos.entry_price,
-                    'current_price': pos.current_price,
-                    'unrealized_pnl': pos.unrealized_pnl,
-                    'opened_at': pos.opened_at.strftime("%H:%M:%S"),
-                    'metadata': pos.metadata
-                })
-            return positions
+                    # Only these fields change while a position is open
+                    row['quantity'] = pos.quantity
+                    row['current_price'] = pos.current_price
+                    row['unrealized_pnl'] = pos.unrealized_pnl
+
+            return list(cache.values())
         except Exception as e:
             logger.error(f"Error getting positions: {e}")
             return []
@@ -549,6 +759,54 @@ class TradingSystemThread(QThread):
 class PairTradingGUI(QMainWindow):
     """Main GUI Window - Integrated with Trading System"""
 
+    MAX_LOG_LINES = 5000  # Oldest log lines are dropped beyond this
+    DISPLAY_THROTTLE_MS = 250  # Dashboard renders at most this often; the last request always runs
+
+    # Shared label styles (one string object each, so unchanged styles compare cheaply)
+    _STYLE_POS = "color: #27ae60; font-weight: bold;"
+    _STYLE_NEG = "color: #e74c3c; font-weight: bold;"
+    _STYLE_ZERO = "color: #95a5a6;"
+
+    # P&L/lock labels are recolored through a "pnl" property matched by one panel stylesheet
+    _PNL_ROLES = {_STYLE_POS: "pos", _STYLE_NEG: "neg", _STYLE_ZERO: "zero"}
+    _PNL_ROLE_QSS = (
+        'QLabel[pnl="pos"] { color: #27ae60; font-weight: bold; }'
+        ' QLabel[pnl="neg"] { color: #e74c3c; font-weight: bold; }'
+        ' QLabel[pnl="zero"] { color: #95a5a6; }'
+    )
+
+    # Model Metrics grid: (row, col, caption, attribute, initial text, font, tooltip)
+    _METRIC_CELLS = (
+        (0, 0, "Entry Threshold:", "entry_threshold_label", "2.0", "mono", None),
+        (0, 2, "Spread Mean:", "spread_mean_label", "--", "mono", None),
+        (0, 4, "Mean Drift:", "mean_drift_label", "--", "mono_bold", "Thay đổi Mean từ lúc entry"),
+        (1, 0, "Exit Threshold:", "exit_threshold_label", "0.5", "mono", None),
+        (1, 2, "Spread Std:", "spread_std_label", "--", "mono", None),
+        (1, 4, "Window Size:", "window_size_label", "200", "mono", None),
+        (2, 0, "Max Z-Score:", "max_z_score_label", "--", "mono", None),
+        (2, 2, "Max Mean:", "max_mean_label", "--", "mono", None),
+        (2, 4, "Last Update:", "last_update_label", "--", "mono_small", None),
+        (3, 0, "Min Z-Score:", "min_z_score_label", "--", "mono_bold", "Z-score thấp nhất trong session"),
+        (3, 2, "Min Mean:", "min_mean_label", "--", "mono", None),
+        (3, 4, "Status:", "status_label", "⚫ Stopped", None, None),
+        (4, 0, "Last Z Score Entries:", "last_z_score_entries_label", "--", "mono",
+         "Z-score của lần entry cuối cùng"),
+        (4, 2, "Scalp Interval:", "scalp_interval_label", "0.5", "mono",
+         "Khoảng cách z-score giữa các lần pyramiding"),
+        (5, 0, "Next Z Score Entries:", "next_z_score_entries_label", "--", "mono",
+         "Z-score dự kiến cho lần entry tiếp theo"),
+        (5, 2, "Volume Multiplier:", "volume_multiplier_label", "1.0", "mono",
+         "Hệ số nhân khối lượng giao dịch"),
+    )
+
+    # Bound str.format callables for label text (format spec parsed once, not per refresh)
+    _FMT_MONEY = "${:,.2f}".format
+    _FMT_MONEY0 = "${:,.0f}".format
+    _FMT_PCT = "{:.2f}%".format
+    _FMT_PCT1 = "{:.1f}%".format
+    _FMT_ONE = "{:.1f}".format
+    _FMT_TWO = "{:.2f}".format
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Pair Trading System - Professional Edition")
@@ -584,16 +842,50 @@ class PairTradingGUI(QMainWindow):
         # Create UI
         self.init_ui()
 
-        # Setup update timer
+        # Settings spinboxes emit valueChanged on Enter/focus-out, not on every keystroke
+        for spin in (self.entry_zscore_spin, self.exit_zscore_spin, self.stop_zscore_spin,
+                     self.max_positions_spin, self.volume_mult_spin, self.window_spin,
+                     self.interval_spin, self.hedge_drift_spin, self.max_pos_pct_spin,
+                     self.max_risk_pct_spin, self.daily_loss_spin, self.scale_interval_spin,
+                     self.initial_fraction_spin, self.min_adjust_interval_spin,
+                     self.magic_number_spin, self.zscore_history_spin):
+            spin.setKeyboardTracking(False)
+
+        # Fallback refresh for account/P&L values between snapshots.
+        # Only runs while trading; new snapshots refresh immediately (see update_display)
         self.update_timer = QTimer()
+        self.update_timer.setInterval(1000)
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Update every second
 
-        # Load settings into GUI
+        # Leading + trailing throttle, so the newest status taken is always rendered
+        self._throttled_render = qthrottled(self._render_display, self.DISPLAY_THROTTLE_MS, self)
+        self._rendered_status = None  # SystemStatus last rendered by _render_display
+
+        # Settings values last written by load_settings_into_gui (None once the user edits a control)
+        self._last_loaded_settings = None
+
+        # Risk percentages and balance multipliers, rebuilt by _refresh_risk_view when settings change
+        self._risk_view = None
+
+        # Coalesces bursts of settings edits into one config-sync diff
+        self._settings_dirty_timer = QTimer(self)
+        self._settings_dirty_timer.setSingleShot(True)
+        self._settings_dirty_timer.setInterval(200)
+        self._settings_dirty_timer.timeout.connect(self._flush_gui_setting_changed)
+
+        # Connect settings controls to change detector (for config sync indicator),
+        # then load settings into GUI (signals are blocked while loading)
+        self._connect_settings_change_signals()
         self.load_settings_into_gui()
 
-        # Load current state from MT5 (account info, risk values from config)
-        self.load_current_state_from_mt5()
+        # Connect to MT5 in the background; account info/risk values load once it is ready
+        self._mt5_state_thread = None
+        # Reused across MT5StateThread runs (see MT5StateThread.lock_cache / history_cache)
+        self._lock_mgr = None
+        self._history_cache = {}
+        self._mt5_prewarm = MT5PrewarmThread()
+        self._mt5_prewarm.finished_signal.connect(self._on_mt5_prewarmed)
+        self._mt5_prewarm.start()
 
         # Initial startup message
         self.add_log("=" * 70)
@@ -656,19 +948,23 @@ class PairTradingGUI(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setFont(QFont("Segoe UI", 10))
 
-        # Add tabs
+        # Add tabs (Settings and Logs are built eagerly: their widgets are used before first show)
         self.dashboard_tab = self.create_dashboard_tab()
-        self.chart_tab = self.create_chart_tab()  # ← NEW: Chart tab
-        self.discovery_tab = PairDiscoveryTab()  # ← NEW: Pair Discovery tab
         self.settings_tab = self.create_settings_tab()
         self.logs_tab = self.create_logs_tab()
 
         self.tabs.addTab(self.dashboard_tab, "📊 Dashboard")
-        self.tabs.addTab(self.chart_tab, "📈 Charts")  # ← NEW: Charts tab
-        self.tabs.addTab(self.discovery_tab, "🔬 Pair Discovery")  # ← NEW: Discovery tab
+        chart_index = self.tabs.addTab(QWidget(), "📈 Charts")  # Built on first show
+        discovery_index = self.tabs.addTab(QWidget(), "🔬 Pair Discovery")  # Built on first show
         self.tabs.addTab(self.settings_tab, "⚙️ Settings")
         self.tabs.addTab(self.logs_tab, "📝 Logs")
 
+        self._lazy_tabs = {
+            chart_index: self._build_chart_tab,
+            discovery_index: self._build_discovery_tab,
+        }
+        self.tabs.currentChanged.connect(self._lazy_build_tab)
+
         main_layout.addWidget(self.tabs)
 
         # Status bar with config sync indicator
@@ -682,6 +978,11 @@ class PairTradingGUI(QMainWindow):
         self.config_sync_indicator.details_clicked.connect(self._on_sync_details_clicked)
         self.statusBar.addPermanentWidget(self.config_sync_indicator)
 
+        # MT5 connection indicator (updated by MT5PrewarmThread)
+        self.mt5_status_label = QLabel("MT5: connecting…")
+        self.mt5_status_label.setStyleSheet("color: #f39c12;")
+        self.statusBar.addPermanentWidget(self.mt5_status_label)
+
     def load_settings_into_gui(self):
         """
         Load global settings into GUI controls
@@ -689,6 +990,14 @@ class PairTradingGUI(QMainWindow):
         """
         settings = self.settings_manager.get()
 
+        # Nothing to do if the controls already show exactly these settings
+        loaded = dataclasses.astuple(settings)
+        if loaded == self._last_loaded_settings:
+            return
+
+        # One change-detector run at the end instead of one per control
+        blockers = [QSignalBlocker(w) for w in self._settings_controls()]
+
         # Trading parameters
         self.entry_zscore_spin.setValue(settings.entry_threshold)
         self.exit_zscore_spin.setValue(settings.exit_threshold)
@@ -723,14 +1032,18 @@ class PairTradingGUI(QMainWindow):
         self.magic_number_spin.setValue(settings.magic_number)
         self.zscore_history_spin.setValue(settings.zscore_history_size)
 
-        # Update displays
-        self.entry_threshold_label.setText(f"{settings.entry_threshold:.1f}")
-        self.exit_threshold_label.setText(f"{settings.exit_threshold:.1f}")
-        self.window_size_label.setText(f"{settings.rolling_window_size}")
+        for blocker in blockers:
+            blocker.unblock()
+        self._on_gui_setting_changed()
 
-        # Update new labels
-        self.scalp_interval_label.setText(f"{settings.scale_interval:.1f}")
-        self.volume_multiplier_label.setText(f"{settings.volume_multiplier:.2f}")
+        # Update displays
+        self._set_metric_labels(
+            settings.entry_threshold,
+            settings.exit_threshold,
+            settings.rolling_window_size,
+            settings.scale_interval,
+            settings.volume_multiplier,
+        )
 
         # risk manager
         self.daily_risk_pct_label.setText(f"{settings.daily_loss_limit_pct:.2f}%")
@@ -739,8 +1052,32 @@ class PairTradingGUI(QMainWindow):
         self.primary_input.setText("BTCUSD")
         self.secondary_input.setText("ETHUSD")
 
-        # Connect settings controls to change detector (for config sync indicator)
-        self._connect_settings_change_signals()
+        self._last_loaded_settings = loaded
+        self._refresh_risk_view()
+
+    def _refresh_risk_view(self):
+        """Cache the risk settings and their balance multipliers for _apply_mt5_state"""
+        settings = self.settings_manager.get()
+        self._risk_view = SimpleNamespace(
+            setup_risk_pct=settings.max_risk_pct,
+            setup_mul=settings.max_risk_pct / 100.0,
+            daily_risk_pct=settings.daily_loss_limit_pct,
+            daily_mul=settings.daily_loss_limit_pct / 100.0,
+        )
+
+    def _settings_controls(self):
+        """All settings controls wired to _on_gui_setting_changed"""
+        return (
+            self.entry_zscore_spin, self.exit_zscore_spin, self.stop_zscore_spin,
+            self.max_positions_spin, self.volume_mult_spin,
+            self.window_spin, self.interval_spin, self.hedge_drift_spin,
+            self.pyramiding_check, self.hedge_adjust_check,
+            self.entry_cooldown_check, self.manual_sync_check,
+            self.max_pos_pct_spin, self.max_risk_pct_spin, self.daily_loss_spin,
+            self.session_start_input, self.session_end_input,
+            self.scale_interval_spin, self.initial_fraction_spin,
+            self.min_adjust_interval_spin, self.magic_number_spin, self.zscore_history_spin,
+        )
 
     def _connect_settings_change_signals(self):
         """Connect all settings controls to change detector for config sync indicator"""
@@ -766,8 +1103,8 @@ class PairTradingGUI(QMainWindow):
         self.max_pos_pct_spin.valueChanged.connect(self._on_gui_setting_changed)
         self.max_risk_pct_spin.valueChanged.connect(self._on_gui_setting_changed)
         self.daily_loss_spin.valueChanged.connect(self._on_gui_setting_changed)
-        self.session_start_input.textChanged.connect(self._on_gui_setting_changed)
-        self.session_end_input.textChanged.connect(self._on_gui_setting_changed)
+        self.session_start_input.editingFinished.connect(self._on_gui_setting_changed)
+        self.session_end_input.editingFinished.connect(self._on_gui_setting_changed)
 
         # Advanced settings
         self.scale_interval_spin.valueChanged.connect(self._on_gui_setting_changed)
@@ -776,120 +1113,148 @@ class PairTradingGUI(QMainWindow):
         self.magic_number_spin.valueChanged.connect(self._on_gui_setting_changed)
         self.zscore_history_spin.valueChanged.connect(self._on_gui_setting_changed)
 
+    def _on_mt5_prewarmed(self, connected: bool):
+        """Handle MT5 prewarm result - update indicator and load account state"""
+        if connected:
+            self.mt5_status_label.setText("MT5: ready")
+            self.mt5_status_label.setStyleSheet("color: #27ae60;")
+            # Load current state from MT5 (account info, risk values from config)
+            self.load_current_state_from_mt5()
+        else:
+            self.mt5_status_label.setText("MT5: offline")
+            self.mt5_status_label.setStyleSheet("color: #e74c3c;")
+
     def load_current_state_from_mt5(self):
         """
         Load current state from MT5 when GUI starts.
         This updates the RISK MANAGER panel and other displays
         with real values instead of defaults.
-        Uses mt5_manager to ensure single MT5 connection.
+        MT5 and disk reads run on MT5StateThread; labels are set in _apply_mt5_state.
         """
-        try:
-            from core.mt5_manager import get_mt5
-            mt5 = get_mt5()
+        if self._mt5_state_thread is not None and self._mt5_state_thread.isRunning():
+            return
 
-            # Get account info
-            account_info = mt5.account_info()
-            if account_info is None:
-                logger.warning("Could not get MT5 account info for initial state load")
-                return
+        risk = self._risk_view
+        risk_monitor = self.trading_thread.mt5_monitor if self.trading_thread else None
+        self._mt5_state_thread = MT5StateThread(risk.setup_risk_pct, risk.daily_risk_pct, risk_monitor,
+                                                lock_cache=self._lock_mgr, history_cache=self._history_cache)
+        self._mt5_state_thread.finished_signal.connect(self._apply_mt5_state)
+        self._mt5_state_thread.finished.connect(self._store_mt5_state_caches)
+        self._mt5_state_thread.start()
+
+    def _store_mt5_state_caches(self):
+        """Keep the caches the finished MT5StateThread built for the next run"""
+        thread = self.sender()  # run() has returned, so its caches are no longer written
+        self._lock_mgr = thread.lock_cache
+        self._history_cache = thread.history_cache
+
+    @staticmethod
+    def _set_style(label, style):
+        """Set label stylesheet only if it changed (setStyleSheet always re-polishes the widget)"""
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+
+    def _set_pnl_role(self, label, style):
+        """Recolor a P&L/lock label by flipping its pnl property; other styles fall back to _set_style"""
+        role = self._PNL_ROLES.get(style)
+        if role is None:
+            self._set_style(label, style)
+            return
+        if label.styleSheet():
+            label.setStyleSheet("")
+        if label.property("pnl") != role:
+            label.setProperty("pnl", role)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def _apply_mt5_state(self, state: dict):
+        """Apply the state fetched by MT5StateThread to the dashboard labels"""
+        if not state:
+            return
 
-            balance = account_info.balance
-            equity = account_info.equity
-            profit = account_info.profit
+        try:
+            balance = state['balance']
+            equity = state['equity']
+            profit = state['profit']
 
             # Update MT5 Account panel
-            self.balance_label.setText(f"${balance:,.2f}")
-            self.equity_label.setText(f"${equity:,.2f}")
-            self.unrealized_pnl_label.setText(f"${profit:,.2f}")
+            self.balance_label.setText(self._FMT_MONEY(balance))
+            self.equity_label.setText(self._FMT_MONEY(equity))
+            self.unrealized_pnl_label.setText(self._FMT_MONEY(profit))
 
             # Color code profit
             if profit > 0:
-                self.unrealized_pnl_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+                self._set_pnl_role(self.unrealized_pnl_label, self._STYLE_POS)
             elif profit < 0:
-                self.unrealized_pnl_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+                self._set_pnl_role(self.unrealized_pnl_label, self._STYLE_NEG)
 
             # Update margin info
-            margin = account_info.margin
-            free_margin = account_info.margin_free
-            margin_level = account_info.margin_level if account_info.margin_level else 0
-
-            self.used_margin_label.setText(f"${margin:,.2f}")
-            self.free_margin_label.setText(f"${free_margin:,.2f}")
-            self.margin_level_label.setText(f"{margin_level:.1f}%")
+            self.used_margin_label.setText(self._FMT_MONEY(state['margin']))
+            self.free_margin_label.setText(self._FMT_MONEY(state['free_margin']))
+            self.margin_level_label.setText(self._FMT_PCT1(state['margin_level']))
 
             # ========== RISK MANAGER - Load from settings and MT5 ==========
             try:
-                settings = self.settings_manager.get()
+                risk = self._risk_view
 
                 # Get unrealized P&L (open positions)
                 unrealized_pnl = equity - balance
 
                 # Risk Per Setup - from config
-                setup_risk_pct = settings.max_risk_pct
-                setup_risk_amount = balance * (setup_risk_pct / 100.0)
-                self.setup_risk_pct_label.setText(f"{setup_risk_pct:.2f}%")
-                self.setup_risk_amount_label.setText(f"${setup_risk_amount:,.0f}")
-                self.risk_unrealized_label.setText(f"${unrealized_pnl:,.2f}")
+                setup_risk_pct = risk.setup_risk_pct
+                setup_risk_amount = balance * risk.setup_mul
+                self.setup_risk_pct_label.setText(self._FMT_PCT(setup_risk_pct))
+                self.setup_risk_amount_label.setText(self._FMT_MONEY0(setup_risk_amount))
+                self.risk_unrealized_label.setText(self._FMT_MONEY(unrealized_pnl))
                 if unrealized_pnl < 0:
-                    self.risk_unrealized_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+                    self._set_pnl_role(self.risk_unrealized_label, self._STYLE_NEG)
                 else:
-                    self.risk_unrealized_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+                    self._set_pnl_role(self.risk_unrealized_label, self._STYLE_POS)
 
                 # Daily Risk - from config
-                daily_risk_pct = settings.daily_loss_limit_pct
-                daily_risk_amount = balance * (daily_risk_pct / 100.0)
-                self.daily_risk_limit_label.setText(f"${daily_risk_amount:,.0f}")
-
-                # Get session P&L from history
-                from risk.daily_risk_manager import DailyRiskManager
-                daily_risk = DailyRiskManager(
-                    account_balance=balance,
-                    max_risk_pct=settings.max_risk_pct,
-                    daily_loss_limit_pct=settings.daily_loss_limit_pct
-                )
-                history = daily_risk.load_daily_history(current_equity=equity)
-                session_pnl = history['net_realized_pnl'] + unrealized_pnl
-                self.daily_total_pnl_label.setText(f"${session_pnl:,.0f}")
-                if session_pnl < 0:
-                    self.daily_total_pnl_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                else:
-                    self.daily_total_pnl_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+                daily_risk_pct = risk.daily_risk_pct
+                daily_risk_amount = balance * risk.daily_mul
+                self.daily_risk_limit_label.setText(self._FMT_MONEY0(daily_risk_amount))
+
+                # Session P&L from history (None if the history could not be loaded)
+                if state['net_realized_pnl'] is not None:
+                    session_pnl = state['net_realized_pnl'] + unrealized_pnl
+                    self.daily_total_pnl_label.setText(self._FMT_MONEY0(session_pnl))
+                    if session_pnl < 0:
+                        self._set_pnl_role(self.daily_total_pnl_label, self._STYLE_NEG)
+                    else:
+                        self._set_pnl_role(self.daily_total_pnl_label, self._STYLE_POS)
 
-                logger.info(f"[GUI] Risk Manager: Setup={setup_risk_pct}%/${setup_risk_amount:.0f}, "
-                           f"Daily={daily_risk_pct}%/${daily_risk_amount:.0f}, PnL=${session_pnl:.0f}")
+                    logger.info(f"[GUI] Risk Manager: Setup={setup_risk_pct}%/${setup_risk_amount:.0f}, "
+                               f"Daily={daily_risk_pct}%/${daily_risk_amount:.0f}, PnL=${session_pnl:.0f}")
 
             except Exception as e:
                 logger.warning(f"Could not load Risk Manager state: {e}")
 
             # ========== Load Trading Lock Status ==========
+            lock_info = state['lock']  # None if unavailable, {} if unlocked
             try:
-                from risk.trading_lock_manager import TradingLockManager
-                lock_manager = TradingLockManager()
-
-                if lock_manager.is_locked():
+                if lock_info:
                     self.trading_status_label.setText("LOCK")
-                    self.trading_status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+                    self._set_pnl_role(self.trading_status_label, self._STYLE_NEG)
                     # Show block/unlock time
-                    lock_info = lock_manager.get_lock_info()
                     if lock_info.get('locked_at'):
-                        from datetime import datetime
                         locked_at = datetime.fromisoformat(lock_info['locked_at'])
                         self.block_time_label.setText(locked_at.strftime("%H:%M"))
                     if lock_info.get('locked_until'):
                         locked_until = datetime.fromisoformat(lock_info['locked_until'])
                         self.unlock_time_label.setText(locked_until.strftime("%H:%M"))
-                else:
+                elif lock_info is not None:
                     self.trading_status_label.setText("UNLOCK")
-                    self.trading_status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+                    self._set_pnl_role(self.trading_status_label, self._STYLE_POS)
                     self.block_time_label.setText("--")
                     self.unlock_time_label.setText("--")
             except Exception as e:
                 logger.warning(f"Could not load TradingLockManager state: {e}")
 
             # ========== Load Active Positions Count ==========
-            positions = mt5.positions_get()
-            if positions:
-                position_count = len(positions)
+            position_count = state['position_count']
+            if position_count:
                 # Count spreads (pairs of positions)
                 spread_count = position_count // 2
                 self.open_close_label.setText(f"{spread_count} / --")
@@ -910,17 +1275,35 @@ class PairTradingGUI(QMainWindow):
     def update_dashboard_from_config(self, pair: PairConfig):
         """Update dashboard display labels from config"""
         # Update Model Metrics display on Dashboard
-        self.entry_threshold_label.setText(f"{pair.entry_threshold:.1f}")
-        self.exit_threshold_label.setText(f"{pair.exit_threshold:.1f}")
-        self.window_size_label.setText(f"{pair.rolling_window_size}")
-
-        # Update new labels
-        self.scalp_interval_label.setText(f"{getattr(pair, 'scale_interval', 0.5):.1f}")
-        self.volume_multiplier_label.setText(f"{pair.volume_multiplier:.2f}")
+        self._set_metric_labels(
+            pair.entry_threshold,
+            pair.exit_threshold,
+            pair.rolling_window_size,
+            getattr(pair, 'scale_interval', 0.5),
+            pair.volume_multiplier,
+        )
 
         # Update status
         self.statusBar.showMessage(f"Configuration loaded: {pair.primary_symbol}/{pair.secondary_symbol}")
 
+    def _set_metric_labels(self, entry, exit_, window, scale_interval, volume_multiplier):
+        """Write the config-driven Model Metrics labels with one repaint of the panel"""
+        texts = {
+            self.entry_threshold_label: self._FMT_ONE(entry),
+            self.exit_threshold_label: self._FMT_ONE(exit_),
+            self.window_size_label: str(window),
+            self.scalp_interval_label: self._FMT_ONE(scale_interval),
+            self.volume_multiplier_label: self._FMT_TWO(volume_multiplier),
+        }
+        self.metrics_panel.setUpdatesEnabled(False)
+        try:
+            for label, text in texts.items():
+                if label.text() != text:
+                    label.setText(text)
+        finally:
+            self.metrics_panel.setUpdatesEnabled(True)
+            self.metrics_panel.update()
+
     def create_dashboard_tab(self):
         """Create main dashboard tab"""
         tab = QWidget()
@@ -1012,109 +1395,32 @@ class PairTradingGUI(QMainWindow):
 
         # ========== Model Metrics Panel ==========
         metrics_panel = QGroupBox("Model Metrics")
+        self.metrics_panel = metrics_panel
         metrics_layout = QGridLayout()
 
-        # ========== Row 0: Entry Threshold, Spread Mean, Mean Drift ==========
-        metrics_layout.addWidget(QLabel("Entry Threshold:"), 0, 0)
-        self.entry_threshold_label = QLabel("2.0")
-        self.entry_threshold_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.entry_threshold_label, 0, 1)
-
-        metrics_layout.addWidget(QLabel("Spread Mean:"), 0, 2)
-        self.spread_mean_label = QLabel("--")
-        self.spread_mean_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.spread_mean_label, 0, 3)
-
-        metrics_layout.addWidget(QLabel("Mean Drift:"), 0, 4)
-        self.mean_drift_label = QLabel("--")
-        mean_drift_font = QFont("Courier New", 10)
-        mean_drift_font.setBold(True)
-        self.mean_drift_label.setFont(mean_drift_font)
-        self.mean_drift_label.setToolTip("Thay đổi Mean từ lúc entry")
-        metrics_layout.addWidget(self.mean_drift_label, 0, 5)
-
-        # ========== Row 1: Exit Threshold, Spread Std, Window Size ==========
-        metrics_layout.addWidget(QLabel("Exit Threshold:"), 1, 0)
-        self.exit_threshold_label = QLabel("0.5")
-        self.exit_threshold_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.exit_threshold_label, 1, 1)
-
-        metrics_layout.addWidget(QLabel("Spread Std:"), 1, 2)
-        self.spread_std_label = QLabel("--")
-        self.spread_std_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.spread_std_label, 1, 3)
-
-        metrics_layout.addWidget(QLabel("Window Size:"), 1, 4)
-        self.window_size_label = QLabel("200")
-        self.window_size_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.window_size_label, 1, 5)
-
-        # ========== Row 2: Max Z-Score, Max Mean, Last Update ==========
-        metrics_layout.addWidget(QLabel("Max Z-Score:"), 2, 0)
-        self.max_z_score_label = QLabel("--")
-        self.max_z_score_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.max_z_score_label, 2, 1)
-
-        metrics_layout.addWidget(QLabel("Max Mean:"), 2, 2)
-        self.max_mean_label = QLabel("--")
-        self.max_mean_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.max_mean_label, 2, 3)
-
-        metrics_layout.addWidget(QLabel("Last Update:"), 2, 4)
-        self.last_update_label = QLabel("--")
-        self.last_update_label.setFont(QFont("Courier New", 9))
-        metrics_layout.addWidget(self.last_update_label, 2, 5)
-
-        # ========== Row 3: Min Z-Score, Min Mean, Status ==========
-        metrics_layout.addWidget(QLabel("Min Z-Score:"), 3, 0)
-        self.min_z_score_label = QLabel("--")
-        min_z_font = QFont("Courier New", 10)
-        min_z_font.setBold(True)
-        self.min_z_score_label.setFont(min_z_font)
-        self.min_z_score_label.setToolTip("Z-score thấp nhất trong session")
-        metrics_layout.addWidget(self.min_z_score_label, 3, 1)
-
-        metrics_layout.addWidget(QLabel("Min Mean:"), 3, 2)
-        self.min_mean_label = QLabel("--")
-        self.min_mean_label.setFont(QFont("Courier New", 10))
-        metrics_layout.addWidget(self.min_mean_label, 3, 3)
-
-        metrics_layout.addWidget(QLabel("Status:"), 3, 4)
-        self.status_label = QLabel("⚫ Stopped")
+        mono = QFont("Courier New", 10)
+        mono_bold = QFont("Courier New", 10)
+        mono_bold.setBold(True)
+        fonts = {"mono": mono, "mono_bold": mono_bold, "mono_small": QFont("Courier New", 9), None: None}
+
+        for row, col, caption, attr, text, font, tooltip in self._METRIC_CELLS:
+            metrics_layout.addWidget(QLabel(caption), row, col)
+            label = QLabel(text)
+            if fonts[font] is not None:
+                label.setFont(fonts[font])
+            if tooltip:
+                label.setToolTip(tooltip)
+            setattr(self, attr, label)
+            metrics_layout.addWidget(label, row, col + 1)
+
         self.status_label.setStyleSheet("color: #7f8c8d; font-weight: bold;")
-        metrics_layout.addWidget(self.status_label, 3, 5)
-
-        # ========== Row 4: Last Z Score Entries, Scalp Interval ==========
-        metrics_layout.addWidget(QLabel("Last Z Score Entries:"), 4, 0)
-        self.last_z_score_entries_label = QLabel("--")
-        self.last_z_score_entries_label.setFont(QFont("Courier New", 10))
-        self.last_z_score_entries_label.setToolTip("Z-score của lần entry cuối cùng")
-        metrics_layout.addWidget(self.last_z_score_entries_label, 4, 1)
-
-        metrics_layout.addWidget(QLabel("Scalp Interval:"), 4, 2)
-        self.scalp_interval_label = QLabel("0.5")
-        self.scalp_interval_label.setFont(QFont("Courier New", 10))
-        self.scalp_interval_label.setToolTip("Khoảng cách z-score giữa các lần pyramiding")
-        metrics_layout.addWidget(self.scalp_interval_label, 4, 3)
-
-        # ========== Row 5: Next Z Score Entries, Volume Multiplier ==========
-        metrics_layout.addWidget(QLabel("Next Z Score Entries:"), 5, 0)
-        self.next_z_score_entries_label = QLabel("--")
-        self.next_z_score_entries_label.setFont(QFont("Courier New", 10))
-        self.next_z_score_entries_label.setToolTip("Z-score dự kiến cho lần entry tiếp theo")
-        metrics_layout.addWidget(self.next_z_score_entries_label, 5, 1)
-
-        metrics_layout.addWidget(QLabel("Volume Multiplier:"), 5, 2)
-        self.volume_multiplier_label = QLabel("1.0")
-        self.volume_multiplier_label.setFont(QFont("Courier New", 10))
-        self.volume_multiplier_label.setToolTip("Hệ số nhân khối lượng giao dịch")
-        metrics_layout.addWidget(self.volume_multiplier_label, 5, 3)
 
         metrics_panel.setLayout(metrics_layout)
         layout.addWidget(metrics_panel)
 
         # ========== UNIFIED ACCOUNT & RISK MANAGEMENT PANEL ==========
         account_risk_panel = QGroupBox("💰 ACCOUNT & RISK MANAGEMENT")
+        account_risk_panel.setStyleSheet(self._PNL_ROLE_QSS)
         account_risk_layout = QGridLayout()
         
         # ===== SECTION 1: ACCOUNT STATUS =====
@@ -1220,7 +1526,7 @@ class PairTradingGUI(QMainWindow):
         account_risk_layout.addWidget(QLabel("Trading Status:"), 8, 4)
         self.trading_status_label = QLabel("--")
         self.trading_status_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        self.trading_status_label.setStyleSheet("color: #95a5a6;")
+        self.trading_status_label.setProperty("pnl", "zero")
         account_risk_layout.addWidget(self.trading_status_label, 8, 5)
 
         # Row 9: risk $ | Risk $ | block time
@@ -1398,6 +1704,32 @@ class PairTradingGUI(QMainWindow):
         
         return tab
 
+    def _lazy_build_tab(self, index):
+        """Replace a placeholder tab with the real widget the first time it is shown"""
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is None:
+            return
+
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, builder(), label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
+    def _build_chart_tab(self):
+        """Build the Charts tab, catching up with a session that is already running"""
+        self.chart_tab = self.create_chart_tab()
+        if self.trading_thread and self.trading_thread.trading_system:
+            self._do_load_chart_data()
+        return self.chart_tab
+
+    def _build_discovery_tab(self):
+        """Build the Pair Discovery tab"""
+        self.discovery_tab = PairDiscoveryTab()
+        return self.discovery_tab
+
     def create_chart_tab(self):
         """Create real-time chart tab"""
         self.chart_widget = ChartWidget()
@@ -1708,15 +2040,23 @@ class PairTradingGUI(QMainWindow):
         layout.addLayout(controls)
 
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.setMaximumBlockCount(self.MAX_LOG_LINES)
         self.log_display.setFont(QFont("Courier New", 9))
         layout.addWidget(self.log_display)
 
         return tab
 
     def _on_gui_setting_changed(self):
-        """Called when any GUI setting changes - update sync indicator"""
+        """Called when any GUI setting changes - (re)start the debounce timer"""
+        self._last_loaded_settings = None  # Controls may no longer match the loaded settings
+        self._settings_dirty_timer.start()
+
+    def _flush_gui_setting_changed(self):
+        """Update sync indicator with the settings as they are now"""
+        self._settings_dirty_timer.stop()
         if self.trading_thread and self.trading_thread.isRunning():
             gui_config = self._get_current_gui_config()
             self.config_sync_manager.update_gui_config(gui_config)
@@ -1744,15 +2084,16 @@ class PairTradingGUI(QMainWindow):
         self.current_pair = pair
 
         # Update displays
-        self.entry_threshold_label.setText(f"{pair.entry_threshold:.1f}")
-        self.exit_threshold_label.setText(f"{pair.exit_threshold:.1f}")
-        self.window_size_label.setText(f"{pair.rolling_window_size}")
-
-        # Update new labels
-        self.scalp_interval_label.setText(f"{getattr(pair, 'scale_interval', 0.5):.1f}")
-        self.volume_multiplier_label.setText(f"{pair.volume_multiplier:.2f}")
+        self._set_metric_labels(
+            pair.entry_threshold,
+            pair.exit_threshold,
+            pair.rolling_window_size,
+            getattr(pair, 'scale_interval', 0.5),
+            pair.volume_multiplier,
+        )
 
-        # Update spinboxes
+        # Update spinboxes (one change-detector run at the end instead of one per control)
+        blockers = [QSignalBlocker(w) for w in self._settings_controls()]
         self.entry_zscore_spin.setValue(pair.entry_threshold)
         self.exit_zscore_spin.setValue(pair.exit_threshold)
         self.stop_zscore_spin.setValue(pair.stop_loss_zscore)
@@ -1779,6 +2120,10 @@ class PairTradingGUI(QMainWindow):
         self.magic_number_spin.setValue(getattr(pair, 'magic_number', 234000))
         self.zscore_history_spin.setValue(getattr(pair, 'zscore_history_size', 200))
 
+        for blocker in blockers:
+            blocker.unblock()
+        self._on_gui_setting_changed()
+
     def analyze_pair(self):
         """Analyze selected pair for cointegration"""
         primary = self.primary_input.text().strip()
@@ -1970,8 +2315,11 @@ class PairTradingGUI(QMainWindow):
         self.trading_thread = TradingSystemThread(trading_config, self.risk_alert_handler)
         self.trading_thread.log_message.connect(self.add_log)
         self.trading_thread.snapshot_update.connect(self.on_snapshot_update)  # ← NEW: Chart updates
+        self.trading_thread.snapshot_update.connect(self.update_display,
+                                                    Qt.ConnectionType.QueuedConnection)
         self.trading_thread.finished.connect(self._on_thread_finished)  # Handle cleanup
         self.trading_thread.start()
+        self.update_timer.start()
 
         # Auto-save config after successful start (không cần hỏi!)
         self.add_log("")
@@ -2003,6 +2351,7 @@ class PairTradingGUI(QMainWindow):
                 enable_manual_position_sync=self.manual_sync_check.isChecked()
             )
             self.settings_manager.save()
+            self._refresh_risk_view()
             self.add_log("✅ Configuration auto-saved for next time")
         except Exception as e:
             self.add_log(f"⚠️  Failed to auto-save config: {e}")
@@ -2025,7 +2374,7 @@ class PairTradingGUI(QMainWindow):
             }
         """)
         self.status_label.setText("🟢 Running")
-        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        self.status_label.setStyleSheet(self._STYLE_POS)
         self.statusBar.showMessage(f"Trading {primary}/{secondary}...")
 
         # Disable symbol selection while running
@@ -2058,6 +2407,8 @@ class PairTradingGUI(QMainWindow):
     def _on_config_applied(self):
         """Handle config applied event"""
         self.config_sync_indicator.set_synced(True)
+        if self.trading_thread:
+            self.trading_thread.refresh_config_view()
         self.add_log("✅ Config changes applied successfully")
 
     def _on_sync_apply_clicked(self):
@@ -2067,6 +2418,10 @@ class PairTradingGUI(QMainWindow):
                                 "Trading system is not running. Start trading first!")
             return
 
+        # Make sure the diff reflects an edit still inside the debounce window
+        if self._settings_dirty_timer.isActive():
+            self._flush_gui_setting_changed()
+
         # Get current GUI config
         gui_config = self._get_current_gui_config()
 
@@ -2112,6 +2467,8 @@ class PairTradingGUI(QMainWindow):
 
     def _on_sync_details_clicked(self):
         """Show details of config differences"""
+        if self._settings_dirty_timer.isActive():
+            self._flush_gui_setting_changed()
         diff = self.config_sync_manager.get_current_diff()
 
         if not diff or not diff.has_changes:
@@ -2167,6 +2524,7 @@ class PairTradingGUI(QMainWindow):
 
     def _on_thread_finished(self):
         """Handle thread finished signal"""
+        self.update_timer.stop()
         self.add_log("📍 Trading thread has finished")
 
         # If button still shows "Stop", update it
@@ -2251,109 +2609,130 @@ class PairTradingGUI(QMainWindow):
 
     def _do_load_chart_data(self):
         """Actually load the chart data"""
+        if not hasattr(self, 'chart_widget'):
+            return  # Charts tab not built yet; it loads history when first shown
         if hasattr(self, 'trading_thread') and self.trading_thread and self.trading_thread.trading_system:
             self.chart_widget.load_historical_data(self.trading_thread.trading_system)
             self.chart_widget.start_auto_update()
 
 
 
-    def update_display(self):
-        """Update all displays with current data using presentation layer"""
+    def update_display(self, snapshot=None):
+        """
+        Request a dashboard refresh (rendered by _render_display, throttled to DISPLAY_THROTTLE_MS).
+        Called with the new snapshot on snapshot_update, or without one by update_timer.
+        """
+        if not self.trading_thread or not self.trading_thread.isRunning():
+            return
+
+        if snapshot is not None:
+            # Fresh data just arrived - push the next fallback poll a full interval out
+            self.update_timer.start()
+
+        self._throttled_render()
+
+    def _render_display(self):
+        """Update all displays from the latest status using the presentation layer"""
         if not self.trading_thread or not self.trading_thread.isRunning():
             return
 
         try:
-            # Get raw status from trading system
-            raw_status = self.trading_thread.get_status()
+            # Get the latest status built by the trading thread
+            raw_status = self.trading_thread.latest_status()
+
+            # Nothing new since the last render
+            if raw_status is self._rendered_status:
+                return
+            self._rendered_status = raw_status
 
             if raw_status:
                 # Transform raw data into presentation format using presenter
                 data = self.presenter.present_status(raw_status)
 
                 # ========== LIVE STATISTICS ==========
-                self.z_score_label.setText(data['z_score_value'])
-                self.z_score_label.setStyleSheet(data['z_score_style'])
+                self.z_score_label.setText(data.z_score_value)
+                self._set_style(self.z_score_label, data.z_score_style)
 
-                self.correlation_label.setText(data['correlation_value'])
-                self.hedge_ratio_label.setText(data['hedge_ratio_value'])
+                self.correlation_label.setText(data.correlation_value)
+                self.hedge_ratio_label.setText(data.hedge_ratio_value)
 
-                self.signal_label.setText(data['signal_value'])
-                self.signal_label.setStyleSheet(data['signal_style'])
+                self.signal_label.setText(data.signal_value)
+                self._set_style(self.signal_label, data.signal_style)
 
                 # ========== MODEL METRICS ==========
-                self.entry_threshold_label.setText(data['entry_threshold_value'])
-                self.exit_threshold_label.setText(data['exit_threshold_value'])
-                self.window_size_label.setText(data['window_size_value'])
+                self.entry_threshold_label.setText(data.entry_threshold_value)
+                self.exit_threshold_label.setText(data.exit_threshold_value)
+                self.window_size_label.setText(data.window_size_value)
 
-                self.spread_mean_label.setText(data['spread_mean_value'])
-                self.spread_std_label.setText(data['spread_std_value'])
+                self.spread_mean_label.setText(data.spread_mean_value)
+                self.spread_std_label.setText(data.spread_std_value)
 
-                self.mean_drift_label.setText(data['mean_drift_value'])
-                self.mean_drift_label.setStyleSheet(data['mean_drift_style'])
+                self.mean_drift_label.setText(data.mean_drift_value)
+                self._set_style(self.mean_drift_label, data.mean_drift_style)
 
-                self.max_z_score_label.setText(data['max_z_score_value'])
-                self.min_z_score_label.setText(data['min_z_score_value'])
+                self.max_z_score_label.setText(data.max_z_score_value)
+                self.min_z_score_label.setText(data.min_z_score_value)
 
-                self.max_mean_label.setText(data['max_mean_value'])
-                self.min_mean_label.setText(data['min_mean_value'])
+                self.max_mean_label.setText(data.max_mean_value)
+                self.min_mean_label.setText(data.min_mean_value)
 
-                self.last_update_label.setText(data['last_update_value'])
+                self.last_update_label.setText(data.last_update_value)
 
-                self.status_label.setText(data['status_value'])
-                self.status_label.setStyleSheet(data['status_style'])
+                self.status_label.setText(data.status_value)
+                self._set_style(self.status_label, data.status_style)
 
-                self.last_z_score_entries_label.setText(data['last_z_score_entries_value'])
-                self.next_z_score_entries_label.setText(data['next_z_score_entries_value'])
+                self.last_z_score_entries_label.setText(data.last_z_score_entries_value)
+                self.next_z_score_entries_label.setText(data.next_z_score_entries_value)
 
-                self.scalp_interval_label.setText(data['scalp_interval_value'])
-                self.volume_multiplier_label.setText(data['volume_multiplier_value'])
+                self.scalp_interval_label.setText(data.scalp_interval_value)
+                self.volume_multiplier_label.setText(data.volume_multiplier_value)
 
                 # ========== ACCOUNT STATUS ==========
-                self.balance_label.setText(data['balance_value'])
-                self.equity_label.setText(data['equity_value'])
+                self.balance_label.setText(data.balance_value)
+                self.equity_label.setText(data.equity_value)
 
-                self.unrealized_pnl_label.setText(data['unrealized_pnl_value'])
-                self.unrealized_pnl_label.setStyleSheet(data['unrealized_pnl_style'])
+                self.unrealized_pnl_label.setText(data.unrealized_pnl_value)
+                self._set_pnl_role(self.unrealized_pnl_label, data.unrealized_pnl_style)
 
-                self.used_margin_label.setText(data['used_margin_value'])
-                self.free_margin_label.setText(data['free_margin_value'])
-                self.margin_level_label.setText(data['margin_level_value'])
+                self.used_margin_label.setText(data.used_margin_value)
+                self.free_margin_label.setText(data.free_margin_value)
+                self.margin_level_label.setText(data.margin_level_value)
 
                 # ========== POSITION OVERVIEW ==========
-                self.open_spread_label.setText(data['open_spread_value'])
-                self.open_close_label.setText(data['open_close_value'])
+                self.open_spread_label.setText(data.open_spread_value)
+                self.open_close_label.setText(data.open_close_value)
 
                 # Total lots (primary / secondary)
-                primary_lots = data.get('primary_lots_value', '+0.0000')
-                secondary_lots = data.get('secondary_lots_value', '+0.0000')
+                primary_lots = data.primary_lots_value
+                secondary_lots = data.secondary_lots_value
                 self.total_lots_label.setText(f"{primary_lots} / {secondary_lots}")
 
                 # Hedge metrics
-                self.hedge_quality_label.setText(data['hedge_quality_value'])
-                self.hedge_quality_label.setStyleSheet(data['hedge_quality_style'])
-                self.imbalance_label.setText(data['imbalance_value'])
-                self.imbalance_label.setStyleSheet(data['imbalance_style'])
+                self.hedge_quality_label.setText(data.hedge_quality_value)
+                self._set_style(self.hedge_quality_label, data.hedge_quality_style)
+                self.imbalance_label.setText(data.imbalance_value)
+                self._set_style(self.imbalance_label, data.imbalance_style)
 
                 # ========== RISK MONITORING ==========
-                self.setup_risk_pct_label.setText(data['setup_risk_pct_value'])
-                self.setup_risk_amount_label.setText(data['setup_risk_amount_value'])
+                self.setup_risk_pct_label.setText(data.setup_risk_pct_value)
+                self.setup_risk_amount_label.setText(data.setup_risk_amount_value)
 
-                self.risk_unrealized_label.setText(data['risk_unrealized_value'])
-                self.risk_unrealized_label.setStyleSheet(data['risk_unrealized_style'])
+                self.risk_unrealized_label.setText(data.risk_unrealized_value)
+                self._set_pnl_role(self.risk_unrealized_label, data.risk_unrealized_style)
 
                 # Daily risk
-                self.daily_risk_pct_label.setText(data['daily_risk_pct_value'])
-                self.daily_risk_limit_label.setText(data['daily_risk_limit_value'])
+                self.daily_risk_pct_label.setText(data.daily_risk_pct_value)
+                self.daily_risk_limit_label.setText(data.daily_risk_limit_value)
 
-                self.daily_total_pnl_label.setText(data['daily_total_pnl_value'])
-                self.daily_total_pnl_label.setStyleSheet(data['daily_total_pnl_style'])
+                self.daily_total_pnl_label.setText(data.daily_total_pnl_value)
+                self._set_pnl_role(self.daily_total_pnl_label, data.daily_total_pnl_style)
 
                 # ========== TRADING LOCK STATUS ==========
-                self.trading_status_label.setText(data['trading_status_value'])
-                self.trading_status_label.setStyleSheet(data['trading_status_style'])
+                self.trading_status_label.setText(data.trading_status_value)
+                self._set_pnl_role(self.trading_status_label, data.trading_status_style)
 
-                self.block_time_label.setText(data['block_time_value'])
-                self.unlock_time_label.setText(data['unlock_time_value'])
+                self.block_time_label.setText(data.block_time_value)
+                self.unlock_time_label.setText(data.unlock_time_value)
 
         except Exception as e:
             logger.error(f"Error updating display: {e}")
@@ -2396,16 +2775,17 @@ class PairTradingGUI(QMainWindow):
 
         # Save to file
         self.settings_manager.save()
+        self._refresh_risk_view()
 
         # Update displays
         settings = self.settings_manager.get()
-        self.entry_threshold_label.setText(f"{settings.entry_threshold:.1f}")
-        self.exit_threshold_label.setText(f"{settings.exit_threshold:.1f}")
-        self.window_size_label.setText(f"{settings.rolling_window_size}")
-
-        # Update new labels
-        self.scalp_interval_label.setText(f"{settings.scale_interval:.1f}")
-        self.volume_multiplier_label.setText(f"{settings.volume_multiplier:.2f}")
+        self._set_metric_labels(
+            settings.entry_threshold,
+            settings.exit_threshold,
+            settings.rolling_window_size,
+            settings.scale_interval,
+            settings.volume_multiplier,
+        )
 
         # Log details
         self.add_log(f"💾 Global settings saved!")
@@ -2459,7 +2839,6 @@ class PairTradingGUI(QMainWindow):
                     self.toggle_trading()  # Stop
 
                     # Wait a bit for clean shutdown
-                    import time
                     time.sleep(1)
 
                     # Start with new settings
@@ -2547,12 +2926,10 @@ class PairTradingGUI(QMainWindow):
                 self.add_log(f"      Daily Limit: {sys.config['daily_loss_limit_pct']}%")
                 self.add_log(f"      Volume: {vol_mult}x, Scale: {scale_interval}")
 
+                self.trading_thread.refresh_config_view()
+
             # Update display labels
-            self.entry_threshold_label.setText(f"{entry:.1f}")
-            self.exit_threshold_label.setText(f"{exit_val:.1f}")
-            self.window_size_label.setText(f"{new_window}")
-            self.scalp_interval_label.setText(f"{scale_interval:.1f}")
-            self.volume_multiplier_label.setText(f"{vol_mult:.2f}")
+            self._set_metric_labels(entry, exit_val, new_window, scale_interval, vol_mult)
 
             self.add_log("=" * 70)
             self.add_log("✅ Settings applied to running system")
@@ -2565,7 +2942,7 @@ class PairTradingGUI(QMainWindow):
     def add_log(self, message: str):
         """Add message to log display"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_display.append(f"[{timestamp}] {message}")
+        self.log_display.appendPlainText(f"[{timestamp}] {message}")
 
         # Auto-scroll to bottom
         scrollbar = self.log_display.verticalScrollBar()
@@ -2576,6 +2953,13 @@ class PairTradingGUI(QMainWindow):
         self.log_display.clear()
         self.add_log("Logs cleared")
 
+    def _stop_mt5_prewarm(self):
+        """Don't let the MT5 prewarm/state QThreads be destroyed while still inside an MT5 call"""
+        for thread in (self._mt5_prewarm, self._mt5_state_thread):
+            if thread is not None and thread.isRunning() and not thread.wait(2000):
+                thread.terminate()
+                thread.wait(2000)
+
     def closeEvent(self, event):
         """Handle window close event - ALWAYS stop trading thread"""
         if self.trading_thread and self.trading_thread.isRunning():
@@ -2594,12 +2978,14 @@ class PairTradingGUI(QMainWindow):
                     self.trading_thread.wait(2000)
 
                 self.add_log("✅ Trading system stopped - safe to exit")
+                self._stop_mt5_prewarm()
                 event.accept()
             else:
                 # User chose not to exit
                 event.ignore()
         else:
             # No trading thread running - safe to exit
+            self._stop_mt5_prewarm()
             event.accept()
 
 
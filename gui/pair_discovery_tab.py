@@ -655,78 +655,85 @@ class PairDiscoveryTab(QWidget):
         elif sort_by == 'Sharpe Ratio':
             filtered = sorted(filtered, key=lambda x: x.get('backtest', {}).get('sharpe_ratio', 0) if x.get('backtest') else 0, reverse=True)
         
-        # Clear and populate table
-        self.results_table.setRowCount(0)
-        self.results_table.setRowCount(len(filtered))
-        
-        for i, pair in enumerate(filtered):
-            # Rank
-            rank_item = QTableWidgetItem(str(i + 1))
-            rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if i == 0:
-                rank_item.setText("🥇")
-            elif i == 1:
-                rank_item.setText("🥈")
-            elif i == 2:
-                rank_item.setText("🥉")
-            self.results_table.setItem(i, 0, rank_item)
+        # Clear and populate table - repaint once at the end instead of per setItem
+        table = self.results_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(filtered))
+        
+            for i, pair in enumerate(filtered):
+                # Rank
+                rank_item = QTableWidgetItem(str(i + 1))
+                rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if i == 0:
+                    rank_item.setText("🥇")
+                elif i == 1:
+                    rank_item.setText("🥈")
+                elif i == 2:
+                    rank_item.setText("🥉")
+                table.setItem(i, 0, rank_item)
             
-            # Pair
-            pair_name = f"{pair['symbol1']} / {pair['symbol2']}"
-            self.results_table.setItem(i, 1, QTableWidgetItem(pair_name))
+                # Pair
+                pair_name = f"{pair['symbol1']} / {pair['symbol2']}"
+                table.setItem(i, 1, QTableWidgetItem(pair_name))
             
-            # Score
-            score_item = QTableWidgetItem(f"{pair.get('score', 0):.1f}")
-            score_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Color code by score
-            score = pair.get('score', 0)
-            if score >= 90:
-                score_item.setForeground(QColor("#27ae60"))  # Green
-            elif score >= 80:
-                score_item.setForeground(QColor("#2980b9"))  # Blue
-            elif score >= 70:
-                score_item.setForeground(QColor("#f39c12"))  # Orange
-            else:
-                score_item.setForeground(QColor("#95a5a6"))  # Gray
-            self.results_table.setItem(i, 2, score_item)
+                # Score
+                score_item = QTableWidgetItem(f"{pair.get('score', 0):.1f}")
+                score_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                # Color code by score
+                score = pair.get('score', 0)
+                if score >= 90:
+                    score_item.setForeground(QColor("#27ae60"))  # Green
+                elif score >= 80:
+                    score_item.setForeground(QColor("#2980b9"))  # Blue
+                elif score >= 70:
+                    score_item.setForeground(QColor("#f39c12"))  # Orange
+                else:
+                    score_item.setForeground(QColor("#95a5a6"))  # Gray
+                table.setItem(i, 2, score_item)
             
-            # Correlation
-            corr = pair.get('correlation', {}).get('correlation', 0)
-            corr_item = QTableWidgetItem(f"{corr:.3f}")
-            corr_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(i, 3, corr_item)
+                # Correlation
+                corr = pair.get('correlation', {}).get('correlation', 0)
+                corr_item = QTableWidgetItem(f"{corr:.3f}")
+                corr_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(i, 3, corr_item)
             
-            # Win Rate
-            backtest = pair.get('backtest')
-            if backtest:
-                win_rate = backtest.get('win_rate', 0)
-                win_item = QTableWidgetItem(f"{win_rate:.1f}%")
-            else:
-                win_item = QTableWidgetItem("N/A")
-            win_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(i, 4, win_item)
+                # Win Rate
+                backtest = pair.get('backtest')
+                if backtest:
+                    win_rate = backtest.get('win_rate', 0)
+                    win_item = QTableWidgetItem(f"{win_rate:.1f}%")
+                else:
+                    win_item = QTableWidgetItem("N/A")
+                win_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(i, 4, win_item)
             
-            # Sharpe
-            if backtest:
-                sharpe = backtest.get('sharpe_ratio', 0)
-                sharpe_item = QTableWidgetItem(f"{sharpe:.2f}")
-            else:
-                sharpe_item = QTableWidgetItem("N/A")
-            sharpe_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(i, 5, sharpe_item)
+                # Sharpe
+                if backtest:
+                    sharpe = backtest.get('sharpe_ratio', 0)
+                    sharpe_item = QTableWidgetItem(f"{sharpe:.2f}")
+                else:
+                    sharpe_item = QTableWidgetItem("N/A")
+                sharpe_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(i, 5, sharpe_item)
             
-            # Trades
-            if backtest:
-                trades = backtest.get('total_trades', 0)
-                trades_item = QTableWidgetItem(str(trades))
-            else:
-                trades_item = QTableWidgetItem("N/A")
-            trades_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(i, 6, trades_item)
+                # Trades
+                if backtest:
+                    trades = backtest.get('total_trades', 0)
+                    trades_item = QTableWidgetItem(str(trades))
+                else:
+                    trades_item = QTableWidgetItem("N/A")
+                trades_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(i, 6, trades_item)
             
-            # Rating
-            rating = pair.get('rating', '')
-            self.results_table.setItem(i, 7, QTableWidgetItem(rating))
+                # Rating
+                rating = pair.get('rating', '')
+                table.setItem(i, 7, QTableWidgetItem(rating))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
     
     def show_pair_details(self, pair):
         """Show detailed analysis for a pair"""
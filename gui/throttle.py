@@ -0,0 +1,40 @@
+"""
+Throttle helper for GUI slots
+
+Calls the wrapped function immediately, then at most once per timeout
+with the most recent arguments (leading + trailing edge).
+"""
+
+from PyQt6.QtCore import QTimer
+
+
+class QThrottled:
+    """Leading + trailing throttle backed by a single-shot QTimer"""
+
+    def __init__(self, func, timeout: int, parent=None):
+        self._func = func
+        self._pending = None
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def __call__(self, *args):
+        if self._timer.isActive():
+            # Inside the window: keep only the latest payload
+            self._pending = args
+            return
+        self._func(*args)
+        self._timer.start()
+
+    def _on_timeout(self):
+        if self._pending is None:
+            return
+        args, self._pending = self._pending, None
+        self._func(*args)
+        self._timer.start()
+
+
+def qthrottled(func, timeout: int, parent=None) -> QThrottled:
+    """Wrap func so it runs at most once per timeout ms"""
+    return QThrottled(func, timeout, parent)
@@ -171,6 +171,10 @@ class TradingSystem:
         
         # Risk alert callback (for GUI)
         self.risk_alert_callback = None
+
+        # Snapshot callback (for GUI push updates)
+        self.snapshot_callback = None
+        self.snapshot_seq = 0
         
         # Threading
         self.running = False
@@ -534,6 +538,23 @@ class TradingSystem:
             except Exception as e:
                 logger.error(f"Failed to call risk alert callback: {e}")
 
+    def emit_snapshot(self, snapshot):
+        """
+        Publish a new market snapshot to the GUI
+
+        Args:
+            snapshot: Latest MarketSnapshot from the data thread
+        """
+        self.current_snapshot = snapshot
+        self.snapshot_seq += 1
+
+        # Call GUI callback if set
+        if self.snapshot_callback:
+            try:
+                self.snapshot_callback(self.snapshot_seq, snapshot)
+            except Exception as e:
+                logger.error(f"Failed to call snapshot callback: {e}")
+
     def _get_lock_until_time(self) -> str:
         """Get lock until time from TradingLockManager for GUI display"""
         try:
@@ -4,6 +4,7 @@ Tracks real MT5 positions and calculates hedge imbalance
 """
 
 import logging
+import time
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -67,6 +68,14 @@ class MT5RiskMonitor:
     
     def __init__(self):
         self.last_metrics: Optional[MT5RiskMetrics] = None
+        self._positions_cache = (None, ())  # (time.monotonic() of fetch, positions) from get_metrics
+
+    def recent_positions(self, max_age: float = 0.5):
+        """Positions fetched by the last get_metrics call if younger than max_age seconds, else None"""
+        fetched_at, positions = self._positions_cache
+        if fetched_at is not None and time.monotonic() - fetched_at < max_age:
+            return positions
+        return None
         
     def get_metrics(self,
                    primary_symbol: str = 'XAUUSD',
@@ -103,6 +112,7 @@ class MT5RiskMonitor:
             positions = mt5.positions_get()
             if positions is None:
                 positions = []
+            self._positions_cache = (time.monotonic(), positions)
             
             logger.debug(f"MT5 Positions: {len(positions)} total")
             
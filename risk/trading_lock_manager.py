@@ -50,7 +50,7 @@ class TradingLockManager:
             return  # Don't trade
         
         # Auto-unlock at new session
-        lock_mgr._check_auto_unlock()  # Call periodically
+        lock_mgr.check_auto_unlock()  # Call periodically
     """
     
     def __init__(self, 
@@ -185,6 +185,10 @@ class TradingLockManager:
         logger.info(f"  System can now open new positions")
         logger.info("=" * 80)
     
+    def check_auto_unlock(self):
+        """Unlock if the locked session has ended (call periodically)"""
+        self._check_auto_unlock()
+
     def _check_auto_unlock(self):
         """Check if should auto-unlock (new session)"""
         if not self.is_locked():
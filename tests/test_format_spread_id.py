@@ -0,0 +1,28 @@
+"""
+Test Spread ID Display Format
+
+Verify how spread_ids are shortened for the positions view
+"""
+
+import pytest
+
+pytest.importorskip("MetaTrader5")
+pytest.importorskip("PyQt6")
+
+from gui.main_window_integrated import _format_spread_id
+
+
+def test_ticket_based_spread_id():
+    """Ticket pairs show the last 4 digits of each ticket"""
+    assert _format_spread_id("1538873231-1538873233") == "3231-3233"
+
+
+def test_uuid_spread_id():
+    """UUIDs (and other multi-dash ids) show the first 8 characters"""
+    assert _format_spread_id("a1b2c3d4-e5f6-7890-abcd-ef0123456789") == "a1b2c3d4"
+    assert _format_spread_id("abc12345test") == "abc12345"
+
+
+def test_short_ticket_parts():
+    """Tickets shorter than 4 digits are shown whole"""
+    assert _format_spread_id("12-345") == "12-345"
@@ -0,0 +1,96 @@
+"""
+Test GUI Data Presenter Helpers
+
+Verify the risk figures, mean drift styling and the cached spread_states.json read
+"""
+
+import json
+import os
+
+import gui.gui_data_presenter as presenter_module
+from gui.gui_data_presenter import (
+    GUIDataPresenter, _compute_risk_metrics,
+    _STYLE_GRAY, _STYLE_GREEN, _STYLE_ORANGE_BOLD, _STYLE_RED_BOLD,
+)
+
+
+def test_compute_risk_metrics():
+    """Risk amounts scale with balance, budget use and hedge quality are percentages"""
+    setup_amount, daily_amount, daily_used, hedge_quality = _compute_risk_metrics(
+        balance=10000.0, setup_risk_pct=2.0, daily_limit_pct=5.0,
+        daily_pnl=-250.0, hedge_imbalance_pct=0.03)
+
+    assert setup_amount == 200.0
+    assert daily_amount == 500.0
+    assert daily_used == 50.0
+    assert abs(hedge_quality - 97.0) < 1e-9
+
+
+def test_compute_risk_metrics_edge_cases():
+    """No balance means no risk budget; a perfect hedge is 100% quality"""
+    assert _compute_risk_metrics(0.0, 2.0, 5.0, -100.0, 0.0) == (0.0, 0.0, 0.0, 100.0)
+
+    # Profit uses the budget the same way a loss does
+    _, _, daily_used, _ = _compute_risk_metrics(10000.0, 2.0, 5.0, 100.0, 0.0)
+    assert daily_used == 20.0
+
+    # Negative imbalance counts by magnitude
+    *_, hedge_quality = _compute_risk_metrics(10000.0, 2.0, 5.0, 0.0, -0.1)
+    assert abs(hedge_quality - 90.0) < 1e-9
+
+
+def test_drift_style_rounding():
+    """Drift is judged as displayed (2 decimals), so values just past a band still match the label"""
+    presenter = GUIDataPresenter()
+    style = presenter._get_drift_style
+
+    assert style(None) == _STYLE_GRAY
+    assert style(0.0) == _STYLE_GREEN
+    assert style(0.504) == _STYLE_GREEN  # Shown as 0.50
+    assert style(0.506) == _STYLE_ORANGE_BOLD  # Shown as 0.51
+    assert style(-0.506) == _STYLE_ORANGE_BOLD
+    assert style(1.004) == _STYLE_ORANGE_BOLD  # Shown as 1.00
+    assert style(1.006) == _STYLE_RED_BOLD  # Shown as 1.01
+    assert style(-1.006) == _STYLE_RED_BOLD
+
+
+def _write_state(path, first_mean, last_z, next_z, mtime_ns):
+    path.write_text(json.dumps({'spreads': {'s1': {
+        'first_entry_spread_mean': first_mean,
+        'last_z_entry': last_z,
+        'next_z_entry': next_z,
+    }}}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_spread_state_snapshot_mtime_cache(tmp_path, monkeypatch):
+    """spread_states.json is parsed again only when its mtime changes"""
+    parses = []
+
+    def counting_loads(data):
+        parses.append(data)
+        return json.loads(data)
+
+    monkeypatch.setattr(presenter_module, '_json_loads', counting_loads)
+
+    presenter = GUIDataPresenter()
+    presenter.state_file = tmp_path / 'spread_states.json'
+
+    # Missing file
+    assert presenter._read_spread_state_snapshot() == (None, None, None)
+    assert parses == []
+
+    _write_state(presenter.state_file, 100.0, -2.1, -2.6, 1_000_000_000)
+    assert presenter._read_spread_state_snapshot() == (100.0, -2.1, -2.6)
+    assert presenter._read_spread_state_snapshot() == (100.0, -2.1, -2.6)
+    assert len(parses) == 1
+
+    # Rewritten file (new mtime) is picked up
+    _write_state(presenter.state_file, 101.0, -2.6, -3.1, 2_000_000_000)
+    assert presenter._read_spread_state_snapshot() == (101.0, -2.6, -3.1)
+    assert len(parses) == 2
+
+    # Removed file clears the cache
+    presenter.state_file.unlink()
+    assert presenter._read_spread_state_snapshot() == (None, None, None)
+    assert presenter._state_cache == (None, None)
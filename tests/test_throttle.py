@@ -0,0 +1,63 @@
+"""
+Test QThrottled
+
+Verify the leading + trailing throttle used for GUI refresh slots
+"""
+
+import time
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from gui.throttle import qthrottled
+
+TIMEOUT_MS = 50
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def _spin(ms):
+    """Run the Qt event loop for ms milliseconds"""
+    deadline = time.monotonic() + ms / 1000.0
+    while time.monotonic() < deadline:
+        QtCore.QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+def test_leading_call_runs_immediately(app):
+    calls = []
+    throttled = qthrottled(calls.append, TIMEOUT_MS)
+
+    throttled(1)
+    assert calls == [1]
+
+    # Nothing queued in the window, so no trailing call
+    _spin(TIMEOUT_MS * 3)
+    assert calls == [1]
+
+
+def test_trailing_call_uses_latest_args(app):
+    calls = []
+    throttled = qthrottled(calls.append, TIMEOUT_MS)
+
+    throttled(1)
+    throttled(2)
+    throttled(3)
+    assert calls == [1]
+
+    _spin(TIMEOUT_MS * 3)
+    assert calls == [1, 3]
+
+
+def test_calls_after_window_run_immediately(app):
+    calls = []
+    throttled = qthrottled(calls.append, TIMEOUT_MS)
+
+    throttled(1)
+    _spin(TIMEOUT_MS * 3)
+    throttled(2)
+    assert calls == [1, 2]
@@ -32,7 +32,7 @@ class DataThread(BaseThread):
             initial_snapshot = self.system.market_data.get_realtime_snapshot()
             
             if initial_snapshot:
-                self.system.current_snapshot = initial_snapshot
+                self.system.emit_snapshot(initial_snapshot)
                 logger.info(f"Initial snapshot ready - Z-Score: {initial_snapshot.zscore:.3f}")
             else:
                 logger.error("Failed to get initial snapshot!")
@@ -83,7 +83,7 @@ class DataThread(BaseThread):
                     logger.warning("Data queue full")
                 
                 self.system.last_update_time = datetime.now()
-                self.system.current_snapshot = snapshot
+                self.system.emit_snapshot(snapshot)
                 
                 # ========== CRITICAL: SYNC WITH MT5 REAL BALANCE ==========
                 try:
@@ -27,7 +27,7 @@ class MonitorThread(BaseThread):
                 # ========== CHECK AUTO-UNLOCK ==========
                 # Check if should unlock (new session started)
                 try:
-                    self.system.trading_lock_manager._check_auto_unlock()  # Use system's trading_lock_manager
+                    self.system.trading_lock_manager.check_auto_unlock()  # Use system's trading_lock_manager
                 except Exception as e:
                     logger.error(f"Auto-unlock check error: {e}")
                 